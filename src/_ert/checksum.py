@@ -0,0 +1,51 @@
+"""Checksums of files produced by the forward model.
+
+The forward model runner computes a checksum of every file in the
+manifest, and ert verifies it before internalizing the results, to know
+that the files are fully visible on disk. Small files get the md5 of
+their content. Files of at least SAMPLED_CHECKSUM_MIN_SIZE bytes get
+the md5 of their size and of evenly spaced blocks, including the first
+and the last, so that restart and UNRST files of many gigabytes do not
+have to be read in full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+SAMPLED_CHECKSUM_MIN_SIZE = 64 * CHUNK_SIZE
+NUM_SAMPLED_CHUNKS = 16
+
+
+def md5_checksum(path: str | os.PathLike[str]) -> str:
+    """The md5 of the content of the file, read in chunks."""
+    with open(path, "rb") as fin:
+        return hashlib.file_digest(fin, "md5").hexdigest()
+
+
+def sampled_md5_checksum(path: str | os.PathLike[str]) -> str:
+    """The md5 of the size of the file and of NUM_SAMPLED_CHUNKS evenly
+    spaced chunks of its content."""
+    md5 = hashlib.md5()
+    with open(path, "rb") as fin:
+        size = os.fstat(fin.fileno()).st_size
+        md5.update(str(size).encode())
+        last_offset = max(size - CHUNK_SIZE, 0)
+        for i in range(NUM_SAMPLED_CHUNKS):
+            fin.seek(last_offset * i // (NUM_SAMPLED_CHUNKS - 1))
+            md5.update(fin.read(CHUNK_SIZE))
+    return md5.hexdigest()
+
+
+def file_checksum(path: str | os.PathLike[str]) -> tuple[str, str]:
+    """The kind and value of the checksum of the file.
+
+    The kind is "md5sum" or "sampled_md5sum", which is the key of the
+    checksum in the manifest.
+    """
+    if Path(path).stat().st_size < SAMPLED_CHECKSUM_MIN_SIZE:
+        return "md5sum", md5_checksum(path)
+    return "sampled_md5sum", sampled_md5_checksum(path)
@@ -14,6 +14,7 @@ class _ChecksumDictBase(TypedDict):
 
     class ChecksumDict(_ChecksumDictBase, total=False):
         md5sum: str
+        sampled_md5sum: str
         error: str
 
 
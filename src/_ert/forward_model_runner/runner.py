@@ -1,9 +1,9 @@
-import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+from _ert.checksum import file_checksum
 from _ert.forward_model_runner.forward_model_step import ForwardModelStep
 from _ert.forward_model_runner.reporting.message import Checksum, Finish, Init
 
@@ -44,7 +44,8 @@ def _populate_checksums(self, manifest):
         for info in manifest.values():
             path = Path(info["path"])
             if path.exists():
-                info["md5sum"] = hashlib.md5(path.read_bytes()).hexdigest()
+                kind, checksum = file_checksum(path)
+                info[kind] = checksum
             else:
                 info["error"] = f"Expected file {path} not created by forward model!"
         return manifest
@@ -2,22 +2,58 @@
 Ert - Ensemble Reservoir Tool - a package for reservoir modeling.
 """
 
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
 # workaround for https://github.com/Unidata/netcdf4-python/issues/1343
 import netCDF4 as _netcdf4  # noqa
 
-from .config import (
-    ErtScript,
-    ForwardModelStepJSON,
-    ForwardModelStepPlugin,
-    ForwardModelStepValidationError,
-    ForwardModelStepWarning,
-    ForwardModelStepDocumentation,
-)
-from .data import MeasuredData
-from .libres_facade import LibresFacade
-from .workflow_runner import WorkflowRunner
-from .plugins import plugin
-from .scheduler import JobState
+if TYPE_CHECKING:
+    from .config import (
+        ErtScript,
+        ForwardModelStepDocumentation,
+        ForwardModelStepJSON,
+        ForwardModelStepPlugin,
+        ForwardModelStepValidationError,
+        ForwardModelStepWarning,
+    )
+    from .data import MeasuredData
+    from .libres_facade import LibresFacade
+    from .plugins import plugin
+    from .scheduler import JobState
+    from .workflow_runner import WorkflowRunner
+
+# The public names are imported on first use, so that importing a light
+# submodule, like the command line entry point, does not import the config,
+# storage and scheduler stacks.
+_LAZY_IMPORTS = {
+    "ErtScript": ".config",
+    "ForwardModelStepDocumentation": ".config",
+    "ForwardModelStepJSON": ".config",
+    "ForwardModelStepPlugin": ".config",
+    "ForwardModelStepValidationError": ".config",
+    "ForwardModelStepWarning": ".config",
+    "JobState": ".scheduler",
+    "LibresFacade": ".libres_facade",
+    "MeasuredData": ".data",
+    "WorkflowRunner": ".workflow_runner",
+    "plugin": ".plugins",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    elif importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # Submodules used to be imported by this module, so keep them
+        # available as attributes
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ErtScript",
@@ -16,17 +16,14 @@
 from uuid import UUID
 
 import yaml
-from opentelemetry.instrumentation.threading import ThreadingInstrumentor
-from opentelemetry.trace import Status, StatusCode
 
 import ert.shared
 from _ert.threading import set_signal_handler
-from ert.cli.main import ErtCliError, run_cli
-from ert.config import ConfigValidationError, ErtConfig, lint_file
 from ert.logging import LOGGING_CONFIG
 from ert.mode_definitions import (
     ENSEMBLE_EXPERIMENT_MODE,
     ENSEMBLE_SMOOTHER_MODE,
+    ES_MDA_DEFAULT_WEIGHTS,
     ES_MDA_MODE,
     ITERATIVE_ENSEMBLE_SMOOTHER_MODE,
     TEST_RUN_MODE,
@@ -34,11 +31,7 @@
 )
 from ert.namespace import Namespace
 from ert.plugins import ErtPluginContext, ErtPluginManager
-from ert.run_models.multiple_data_assimilation import MultipleDataAssimilation
-from ert.services import StorageService, WebvizErt
 from ert.shared.storage.command import add_parser_options as ert_api_add_parser_options
-from ert.storage import ErtStorageException
-from ert.trace import trace, tracer, tracer_provider
 from ert.validation import (
     IntegerArgument,
     NumberListStringArgument,
@@ -50,8 +43,15 @@
 
 logger = logging.getLogger(__name__)
 
+# The subsystems behind each sub command (config, storage, services, tracing,
+# GUI and CLI) are imported when the command runs, so that `ert --version`,
+# `ert --help` and argument errors do not pay for importing them.
+
 
 def run_ert_storage(args: Namespace, _: ErtPluginManager | None = None) -> None:
+    from ert.config import ErtConfig  # noqa: PLC0415
+    from ert.services import StorageService  # noqa: PLC0415
+
     with StorageService.start_server(
         verbose=True, project=ErtConfig.from_file(args.config).ens_path
     ) as server:
@@ -66,6 +66,9 @@ def run_webviz_ert(args: Namespace, _: ErtPluginManager | None = None) -> None:
             "Running `ert vis` requires that webviz_ert is installed"
         ) from err
 
+    from ert.config import ErtConfig  # noqa: PLC0415
+    from ert.services import StorageService, WebvizErt  # noqa: PLC0415
+
     kwargs: dict[str, Any] = {"verbose": args.verbose}
     ert_config = ErtConfig.with_plugins().from_file(args.config)
     os.chdir(ert_config.config_path)
@@ -191,9 +194,17 @@ def run_gui_wrapper(args: Namespace, ert_plugin_manager: ErtPluginManager) -> No
 
 
 def run_lint_wrapper(args: Namespace, _: ErtPluginManager) -> None:
+    from ert.config import lint_file  # noqa: PLC0415
+
     lint_file(args.config)
 
 
+def run_cli(args: Namespace, plugin_manager: ErtPluginManager | None = None) -> None:
+    from ert.cli.main import run_cli as _run_cli  # noqa: PLC0415
+
+    _run_cli(args, plugin_manager)
+
+
 class DeprecatedAction(argparse.Action):
     def __init__(self, alternative_option: str | None = None, **kwargs: Any) -> None:
         self.alternative_option: str | None = alternative_option
@@ -485,6 +496,15 @@ def get_ert_parser(parser: ArgumentParser | None = None) -> ArgumentParser:
         default="ies",
         help="Name of the experiment",
     )
+    iterative_ensemble_smoother_parser.add_argument(
+        "--restart-ensemble-id",
+        type=valid_name,
+        default=None,
+        dest="restart_ensemble_id",
+        help="UUID of an ensemble of an earlier run to continue from. The run "
+        "continues with the update of this ensemble, resuming the smoother "
+        "from the state saved by the update that created it.",
+    )
 
     # es_mda_parser
     es_mda_description = f"Run '{ES_MDA_MODE}' in cli"
@@ -519,7 +539,7 @@ def get_ert_parser(parser: ArgumentParser | None = None) -> ArgumentParser:
     es_mda_parser.add_argument(
         "--weights",
         type=valid_weights,
-        default=MultipleDataAssimilation.default_weights,
+        default=ES_MDA_DEFAULT_WEIGHTS,
         help="Example custom relative weights: '8,4,2,1'. This means multiple data "
         "assimilation ensemble smoother will half the weight applied to the "
         "observation errors from one iteration to the next across 4 iterations.",
@@ -636,18 +656,35 @@ def log_process_usage() -> None:
         )
 
 
-@tracer.start_as_current_span("ert.application.start")
 def main() -> None:
-    span = trace.get_current_span()
     warnings.filterwarnings("ignore", category=DeprecationWarning)
     locale.setlocale(locale.LC_NUMERIC, "C")
 
     # Have ErtThread re-raise uncaught exceptions on main thread
     set_signal_handler()
-    ThreadingInstrumentor().instrument()
 
     args = ert_parser(None, sys.argv[1:])
 
+    from ert.trace import tracer  # noqa: PLC0415
+
+    with tracer.start_as_current_span("ert.application.start"):
+        _run(args)
+
+
+def _run(args: Namespace) -> None:
+    from opentelemetry.instrumentation.threading import (  # noqa: PLC0415
+        ThreadingInstrumentor,
+    )
+    from opentelemetry.trace import Status, StatusCode  # noqa: PLC0415
+
+    from ert.cli.main import ErtCliError  # noqa: PLC0415
+    from ert.config import ConfigValidationError  # noqa: PLC0415
+    from ert.storage import ErtStorageException  # noqa: PLC0415
+    from ert.trace import trace, tracer_provider  # noqa: PLC0415
+
+    span = trace.get_current_span()
+    ThreadingInstrumentor().instrument()
+
     log_dir = os.path.abspath(args.logdir)
     try:
         os.makedirs(log_dir, exist_ok=True)
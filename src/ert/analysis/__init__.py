@@ -1,6 +1,7 @@
 from ._es_update import (
     ErtAnalysisError,
     iterative_smoother_update,
+    load_sies_smoother,
     smoother_update,
 )
 from .event import (
@@ -27,5 +28,6 @@
     "ObservationStatus",
     "SmootherSnapshot",
     "iterative_smoother_update",
+    "load_sies_smoother",
     "smoother_update",
 ]
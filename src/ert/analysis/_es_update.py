@@ -2,8 +2,11 @@
 
 import functools
 import logging
+import os
+import tempfile
 import time
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from typing import (
     TYPE_CHECKING,
@@ -16,9 +19,10 @@
 import numpy as np
 import polars
 import psutil
+import xarray as xr
 from iterative_ensemble_smoother.experimental import AdaptiveESMDA
 
-from ert.config import GenKwConfig
+from ert.config import Field, GenKwConfig, SurfaceConfig
 
 from ..config.analysis_config import ObservationGroups, UpdateSettings
 from ..config.analysis_module import ESSettings, IESSettings
@@ -392,6 +396,150 @@ def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
     )
 
 
+def _multiply_in_place(
+    param_ensemble_array: npt.NDArray[np.floating],
+    transition_matrix: npt.NDArray[np.floating],
+    batch_size: int = 2**16,
+) -> None:
+    """Computes param_ensemble_array @ transition_matrix in place.
+
+    The parameters are multiplied a batch of rows at a time, so the only
+    temporary is a single batch of rows instead of a full copy of the
+    parameters.
+    """
+    transition_matrix = transition_matrix.astype(param_ensemble_array.dtype, copy=False)
+    for start in range(0, param_ensemble_array.shape[0], batch_size):
+        rows = slice(start, start + batch_size)
+        # In-place multiplication is not yet supported, therefore avoiding @=
+        param_ensemble_array[rows] = param_ensemble_array[rows] @ transition_matrix  # noqa: PLR6104
+
+
+def _update_memory_budget(module: ESSettings) -> int:
+    """Returns the number of bytes a parameter group may use in the update.
+
+    Without a memory budget in the settings, the budget is the memory
+    available on the system, with the same safety margin as the batches of
+    adaptive localization.
+    """
+    if module.memory_budget is not None:
+        return module.memory_budget * 1024**2
+    return int(psutil.virtual_memory().available * 0.8)
+
+
+def _exceeds_memory_budget(
+    ensemble: Ensemble,
+    param_group: str,
+    iens_active_index: npt.NDArray[np.int_],
+    memory_budget: int,
+) -> bool:
+    """Whether a FIELD or SURFACE parameter group is too large to be updated
+    in memory, other parameter groups are always updated in memory."""
+    config_node = ensemble.experiment.parameter_configuration[param_group]
+    if not isinstance(config_node, Field | SurfaceConfig):
+        return False
+    values = ensemble.load_parameter_values(param_group, int(iens_active_index[0]))
+    return values.nbytes * len(iens_active_index) > memory_budget
+
+
+def _memory_mapped_values(
+    ensemble: Ensemble, param_group: str, realization: int, swap_path: str
+) -> npt.NDArray[np.floating]:
+    """The values of a parameter group for one realization as a flat memory
+    map.
+
+    Parameters stored without a raw mirror, see MEMORY_MAP, are copied to
+    swap_path, so that only one realization at a time is read into memory.
+    """
+    values = ensemble.load_parameter_values(param_group, realization)
+    if not isinstance(values, np.memmap):
+        np.save(swap_path, values)
+        del values
+        values = np.load(swap_path, mmap_mode="r")
+    return values.reshape(-1)
+
+
+def _blocked_update(
+    source_ensemble: Ensemble,
+    target_ensemble: Ensemble,
+    param_group: str,
+    iens_active_index: npt.NDArray[np.int_],
+    transition_matrix: npt.NDArray[np.floating],
+    memory_budget: int,
+    dtype: npt.DTypeLike | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """Updates a FIELD or SURFACE parameter group one block of rows at a time.
+
+    Every block gathers its rows from the memory mapped values of each
+    realization, is multiplied by the transition matrix and is written to
+    memory mapped posterior values, so at most one block per worker is in
+    memory. The blocks are processed by a thread pool, which overlaps the
+    reading and writing of some blocks with the multiplication of others.
+    Finally the posterior is saved one realization at a time.
+
+    Prior values without a raw mirror are first copied to memory maps in a
+    temporary directory, one realization at a time.
+    """
+    config_node = source_ensemble.experiment.parameter_configuration[param_group]
+    if not config_node.memory_map:
+        logger.info(
+            f"Copying {param_group} to memory maps for the blocked update, "
+            "configure it with MEMORY_MAP:True to avoid the copy"
+        )
+    active = (
+        np.flatnonzero(~config_node.mask.ravel())
+        if isinstance(config_node, Field)
+        else None
+    )
+    if max_workers is None:
+        max_workers = min(4, os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory(dir=target_ensemble.mount_point) as swap_dir:
+        priors = [
+            _memory_mapped_values(
+                source_ensemble,
+                param_group,
+                int(realization),
+                os.path.join(swap_dir, f"prior_{realization}.npy"),
+            )
+            for realization in iens_active_index
+        ]
+        num_params = priors[0].size if active is None else active.size
+        block_dtype = np.dtype(priors[0].dtype if dtype is None else dtype)
+        transition_matrix = transition_matrix.astype(block_dtype, copy=False)
+        # Each worker holds a block of prior rows and the product of that block
+        bytes_per_row = 2 * len(priors) * block_dtype.itemsize
+        batch_size = max(1, memory_budget // (max_workers * bytes_per_row))
+
+        posteriors = [
+            np.lib.format.open_memmap(
+                os.path.join(swap_dir, f"{realization}.npy"),
+                mode="w+",
+                dtype=block_dtype,
+                shape=(num_params,),
+            )
+            for realization in iens_active_index
+        ]
+
+        def update_block(start: int) -> None:
+            stop = min(start + batch_size, num_params)
+            rows = slice(start, stop) if active is None else active[start:stop]
+            block = np.empty((stop - start, len(priors)), dtype=block_dtype)
+            for i, prior in enumerate(priors):
+                block[:, i] = prior[rows]
+            posterior_block = block @ transition_matrix
+            for i, posterior in enumerate(posteriors):
+                posterior[start:stop] = posterior_block[:, i]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(update_block, range(0, num_params, batch_size)))
+
+        for realization, posterior in zip(iens_active_index, posteriors, strict=True):
+            config_node.save_parameters(
+                target_ensemble, param_group, realization, posterior
+            )
+
+
 def _copy_unupdated_parameters(
     all_parameter_groups: Iterable[str],
     updated_parameter_groups: Iterable[str],
@@ -472,6 +620,9 @@ def adaptive_localization_progress_callback(
         progress_callback,
     )
     num_obs = len(observation_values)
+    single_precision = module.precision == "float32"
+    if single_precision:
+        S = S.astype(np.float32, copy=False)
 
     smoother_snapshot.update_step_snapshots = update_snapshot
 
@@ -511,6 +662,9 @@ def adaptive_localization_progress_callback(
         D = smoother_adaptive_es.perturb_observations(
             ensemble_size=ensemble_size, alpha=1.0
         )
+        if single_precision:
+            cov_YY = cov_YY.astype(np.float32)
+            D = D.astype(np.float32)
 
     else:
         # Compute transition matrix so that
@@ -518,6 +672,8 @@ def adaptive_localization_progress_callback(
         T = smoother_es.compute_transition_matrix(Y=S, alpha=1.0, truncation=truncation)
         # Add identity in place for fast computation
         np.fill_diagonal(T, T.diagonal() + 1)
+        if single_precision:
+            T = T.astype(np.float32)
 
     def correlation_callback(
         cross_correlations_of_batch: npt.NDArray[np.float64],
@@ -525,10 +681,34 @@ def correlation_callback(
     ) -> None:
         cross_correlations_accumulator.append(cross_correlations_of_batch)
 
+    memory_budget = _update_memory_budget(module)
     for param_group in parameters:
+        if not module.localization and _exceeds_memory_budget(
+            source_ensemble, param_group, iens_active_index, memory_budget
+        ):
+            log_msg = f"Running blocked update of {param_group} within a memory budget of {memory_budget // 1024**2} MB"
+            logger.info(log_msg)
+            progress_callback(AnalysisStatusEvent(msg=log_msg))
+            start = time.time()
+            _blocked_update(
+                source_ensemble,
+                target_ensemble,
+                param_group,
+                iens_active_index,
+                T,
+                memory_budget,
+                dtype=np.float32 if single_precision else None,
+            )
+            logger.info(
+                f"Blocked update of {param_group} completed in {(time.time() - start) / 60} minutes"
+            )
+            continue
+
         param_ensemble_array = _load_param_ensemble_array(
             source_ensemble, param_group, iens_active_index
         )
+        if single_precision:
+            param_ensemble_array = param_ensemble_array.astype(np.float32, copy=False)
         if module.localization:
             config_node = source_ensemble.experiment.parameter_configuration[
                 param_group
@@ -557,6 +737,7 @@ def correlation_callback(
                         X=X_local,
                         Y=S,
                         D=D,
+                        overwrite=True,
                         alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
                         correlation_threshold=module.correlation_threshold,
                         cov_YY=cov_YY,
@@ -583,10 +764,7 @@ def correlation_callback(
             )
 
         else:
-            # In-place multiplication is not yet supported, therefore avoiding @=
-            param_ensemble_array = param_ensemble_array @ T.astype(  # noqa: PLR6104
-                param_ensemble_array.dtype
-            )
+            _multiply_in_place(param_ensemble_array, T)
 
         log_msg = f"Storing data for {param_group}.."
         logger.info(log_msg)
@@ -600,13 +778,134 @@ def correlation_callback(
             f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
         )
 
-        _copy_unupdated_parameters(
-            list(source_ensemble.experiment.parameter_configuration.keys()),
-            parameters,
-            iens_active_index,
-            source_ensemble,
-            target_ensemble,
+    _copy_unupdated_parameters(
+        list(source_ensemble.experiment.parameter_configuration.keys()),
+        parameters,
+        iens_active_index,
+        source_ensemble,
+        target_ensemble,
+    )
+
+
+def _create_sies_smoother(
+    ensemble: Ensemble,
+    iens_active_index: npt.NDArray[np.int_],
+    covariance: npt.NDArray[np.floating],
+    observations: npt.NDArray[np.floating],
+    seed: np.random.Generator | None,
+    inversion: str,
+    truncation: float,
+) -> ies.SIES:
+    """Creates a SIES smoother without stacking all parameter groups.
+
+    Unless there are fewer parameters than realizations, the smoother only
+    uses the number of parameters and their dtype, so the parameters are
+    only stacked when they are few. Otherwise the smoother gets a read-only
+    view of the right shape that takes no memory.
+    """
+    ensemble_size = len(iens_active_index)
+    groups = [
+        _load_param_ensemble_array(ensemble, param_group, iens_active_index[:1])
+        for param_group in ensemble.experiment.parameter_configuration
+    ]
+    num_parameters = sum(group.shape[0] for group in groups)
+    dtype = np.result_type(*groups)
+    parameters = (
+        _all_parameters(ensemble, iens_active_index)
+        if num_parameters < ensemble_size - 1
+        else None
+    )
+    sies_smoother = ies.SIES(
+        parameters=(
+            np.zeros((1, ensemble_size), dtype=dtype)
+            if parameters is None
+            else parameters
+        ),
+        covariance=covariance,
+        observations=observations,
+        seed=seed,
+        inversion=inversion,
+        truncation=truncation,
+    )
+    if parameters is None:
+        sies_smoother.X = np.broadcast_to(
+            np.zeros((), dtype=dtype), (num_parameters, ensemble_size)
         )
+    return sies_smoother
+
+
+def _sies_state(sies_smoother: ies.SIES, ensemble: Ensemble) -> xr.Dataset:
+    """The state needed to resume a SIES smoother after updating ensemble."""
+    num_parameters, ensemble_size = sies_smoother.X.shape
+    data_vars = {
+        "W": (["realizations", "weights"], sies_smoother.W),
+        "D": (["observations", "realizations"], sies_smoother.D),
+        "observations": ("observations", sies_smoother.d),
+        "covariance": ("observations", sies_smoother.C_dd),
+    }
+    if num_parameters < ensemble_size - 1:
+        data_vars["parameters"] = (["parameters", "realizations"], sies_smoother.X)
+    return xr.Dataset(
+        data_vars,
+        attrs={
+            "ensemble_id": str(ensemble.id),
+            "iteration": sies_smoother.iteration,
+            "inversion": next(
+                name
+                for name, function in sies_smoother.inversion_funcs.items()
+                if function is sies_smoother.inversion
+            ),
+            "truncation": sies_smoother.truncation,
+            "num_parameters": num_parameters,
+        },
+    )
+
+
+def load_sies_smoother(
+    ensemble: Ensemble, analysis_config: IESSettings
+) -> ies.SIES | None:
+    """Resumes the SIES smoother from the update that created ensemble.
+
+    Returns None if the experiment has no saved state, or if the saved state
+    belongs to another ensemble. Raises ErtAnalysisError if the saved state
+    was created with another inversion or truncation than analysis_config.
+    """
+    try:
+        state = ensemble.experiment.load_sies_state()
+    except FileNotFoundError:
+        return None
+    if state.attrs["ensemble_id"] != str(ensemble.id):
+        return None
+    saved_settings = (state.attrs["inversion"], float(state.attrs["truncation"]))
+    if saved_settings != (analysis_config.inversion, analysis_config.enkf_truncation):
+        raise ErtAnalysisError(
+            "Cannot resume the iterated ensemble smoother from ensemble "
+            f"{ensemble.name}, it was updated with inversion {saved_settings[0]} "
+            f"and truncation {saved_settings[1]}, but the current settings are "
+            f"inversion {analysis_config.inversion} and truncation "
+            f"{analysis_config.enkf_truncation}"
+        )
+    num_parameters = int(state.attrs["num_parameters"])
+    ensemble_size = state.sizes["realizations"]
+    sies_smoother = ies.SIES(
+        parameters=(
+            state["parameters"].values
+            if "parameters" in state
+            else np.zeros((1, ensemble_size), dtype=state["W"].dtype)
+        ),
+        covariance=state["covariance"].values,
+        observations=state["observations"].values,
+        inversion=state.attrs["inversion"],
+        truncation=float(state.attrs["truncation"]),
+    )
+    if "parameters" not in state:
+        sies_smoother.X = np.broadcast_to(
+            np.zeros((), dtype=state["W"].dtype), (num_parameters, ensemble_size)
+        )
+    sies_smoother.D = state["D"].values.copy()
+    sies_smoother.W = state["W"].values.copy()
+    sies_smoother.iteration = int(state.attrs["iteration"])
+    return sies_smoother
 
 
 def analysis_IES(
@@ -668,13 +967,14 @@ def analysis_IES(
         )
         raise ErtAnalysisError(msg)
 
-    # if the algorithm object is not passed, initialize it
+    # If the algorithm object is not passed, resume from the state saved by the
+    # update that created the source ensemble, or initialize it
+    if sies_smoother is None:
+        sies_smoother = load_sies_smoother(source_ensemble, analysis_config)
     if sies_smoother is None:
-        # The sies smoother must be initialized with the full parameter ensemble
-        # Get relevant active realizations
-        parameter_ensemble_active = _all_parameters(source_ensemble, iens_active_index)
-        sies_smoother = ies.SIES(
-            parameters=parameter_ensemble_active,
+        sies_smoother = _create_sies_smoother(
+            source_ensemble,
+            iens_active_index,
             covariance=observation_errors**2,
             observations=observation_values,
             seed=rng,
@@ -696,13 +996,15 @@ def analysis_IES(
     # Store transition matrix for later use on sies object
     sies_smoother.W[:, masking_of_initial_parameters] = proposed_W
 
+    # X_posterior = X + X @ W / sqrt(N - 1) = X @ (I + W / sqrt(N - 1))
+    transition_matrix = sies_smoother.W / np.sqrt(len(iens_active_index) - 1)
+    np.fill_diagonal(transition_matrix, transition_matrix.diagonal() + 1)
+
     for param_group in parameters:
         param_ensemble_array = _load_param_ensemble_array(
             source_ensemble, param_group, iens_active_index
         )
-        param_ensemble_array += (
-            param_ensemble_array @ sies_smoother.W / np.sqrt(len(iens_active_index) - 1)
-        )
+        _multiply_in_place(param_ensemble_array, transition_matrix)
 
         progress_callback(AnalysisStatusEvent(msg=f"Storing data for {param_group}.."))
         _save_param_ensemble_array_to_disk(
@@ -721,6 +1023,9 @@ def analysis_IES(
 
     # Increment the iteration number
     sies_smoother.iteration += 1
+    target_ensemble.experiment.save_sies_state(
+        _sies_state(sies_smoother, target_ensemble)
+    )
 
     # Return the sies smoother so it may be iterated over
     return sies_smoother
@@ -3,10 +3,14 @@
 import numpy as np
 import numpy.typing as npt
 from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.stats import spearmanr
+from scipy.stats import rankdata
 
 logger = logging.getLogger(__name__)
 
+# The number of observations clustered hierarchically, whose condensed
+# distance matrix takes MAX_CLUSTERED_OBSERVATIONS**2 * 4 bytes
+MAX_CLUSTERED_OBSERVATIONS = 4000
+
 
 def get_scaling_factor(nr_observations: int, nr_components: int) -> float:
     """Calculates an observation scaling factor which is
@@ -45,19 +49,91 @@ def get_nr_primary_components(
     return len([1 for i in variance_ratio[:-1] if i < threshold])
 
 
+def _correlation_features(
+    responses: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Represent observations as points in ensemble space, such that the euclidean
+    distance between two observations equals the euclidean distance between
+    their rows of the Spearman correlation matrix.
+
+    With Z the centered and normalized ranks, of shape
+    (n_observations, n_realizations), the correlation matrix is Z @ Z.T, and
+    the squared distance between rows i and j is
+    (z_i - z_j) @ Z.T @ Z @ (z_i - z_j). Given the SVD Z = U @ diag(s) @ Vt,
+    this is the squared distance between z_i @ Vt.T @ diag(s) and
+    z_j @ Vt.T @ diag(s). This takes O(n_observations * n_realizations)
+    memory instead of O(n_observations**2).
+
+    Observations with the same ranks have the same row in the correlation
+    matrix, so the SVD is taken of the distinct rows, each weighted by the
+    square root of its count, and duplicates get exactly the same point.
+    """
+    ranks, inverse, counts = np.unique(
+        rankdata(responses, axis=1), axis=0, return_inverse=True, return_counts=True
+    )
+    ranks -= ranks.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(ranks, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    ranks /= norms
+    _, singulars, vt = np.linalg.svd(
+        ranks * np.sqrt(counts)[:, np.newaxis], full_matrices=False
+    )
+    return ((ranks @ vt.T) * singulars)[inverse.reshape(-1)]
+
+
+def _nearest_centroid(
+    features: npt.NDArray[np.float64],
+    centroids: npt.NDArray[np.float64],
+    chunk_size: int = 10000,
+) -> npt.NDArray[np.int_]:
+    nearest = np.empty(len(features), dtype=int)
+    centroid_norms = (centroids**2).sum(axis=1)
+    for start in range(0, len(features), chunk_size):
+        chunk = features[start : start + chunk_size]
+        # Squared distances up to the norm of each feature, which is
+        # the same for all centroids
+        distances = centroid_norms - 2 * chunk @ centroids.T
+        nearest[start : start + chunk_size] = distances.argmin(axis=1)
+    return nearest
+
+
 def cluster_responses(
     responses: npt.NDArray[np.float64],
     nr_clusters: int,
+    max_clustered_observations: int = MAX_CLUSTERED_OBSERVATIONS,
 ) -> npt.NDArray[np.int_]:
     """
     Cluster responses using hierarchical clustering based on Spearman correlation.
     Observations that tend to vary similarly across different simulation runs will be clustered together.
+
+    The clustering is done on the observations' points in ensemble space, see
+    _correlation_features. When there are more than max_clustered_observations
+    observations, the hierarchical clustering is done on a random sample of
+    them, and the other observations are put in the cluster with the nearest
+    mean. This bounds the memory of the distance matrix of the clustering.
     """
-    correlation = spearmanr(responses).statistic
-    if isinstance(correlation, np.float64):
-        correlation = np.array([[1, correlation], [correlation, 1]])
-    linkage_matrix = linkage(correlation, "average", "euclidean")
-    return fcluster(linkage_matrix, nr_clusters, criterion="maxclust", depth=2)
+    features = _correlation_features(responses.T)
+    if len(features) <= max_clustered_observations:
+        linkage_matrix = linkage(features, "average", "euclidean")
+        return fcluster(linkage_matrix, nr_clusters, criterion="maxclust", depth=2)
+
+    sample = np.sort(
+        np.random.default_rng(seed=0).choice(
+            len(features), max_clustered_observations, replace=False
+        )
+    )
+    linkage_matrix = linkage(features[sample], "average", "euclidean")
+    sample_clusters = fcluster(
+        linkage_matrix, nr_clusters, criterion="maxclust", depth=2
+    )
+    labels = np.unique(sample_clusters)
+    centroids = np.array(
+        [features[sample[sample_clusters == label]].mean(axis=0) for label in labels]
+    )
+    clusters = labels[_nearest_centroid(features, centroids)]
+    clusters[sample] = sample_clusters
+    return clusters
 
 
 def main(
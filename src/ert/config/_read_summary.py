@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import os
 import os.path
 import re
+import struct
 from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import (
     Any,
+    NamedTuple,
     TypeVar,
 )
 
@@ -176,7 +179,9 @@ def read_summary(
 ) -> tuple[datetime, list[str], Sequence[datetime], Any]:
     summary, spec = _get_summary_filenames(filepath)
     try:
-        date_index, start_date, date_units, keys, indices = _read_spec(spec, fetch_keys)
+        date_index, start_date, date_units, keys, indices = _read_spec_cached(
+            spec, fetch_keys
+        )
         fetched, time_map = _read_summary(
             summary, start_date, date_units, indices, date_index
         )
@@ -233,6 +238,33 @@ def _fetch_keys_to_matcher(fetch_keys: Sequence[str]) -> Callable[[str], bool]:
     return lambda s: regex.fullmatch(s) is not None
 
 
+class _SpecIndex(NamedTuple):
+    date_index: int
+    start_date: datetime
+    date_unit: DateUnit
+    keys: list[str]
+    indices: npt.NDArray[np.int64]
+
+
+# Parsed summary specifications, keyed by the size and hash of the smspec
+# file and the fetched keys. All realizations of an ensemble normally have
+# identical smspec files, so the specification is only parsed once.
+_SPEC_CACHE_SIZE = 32
+_spec_cache: dict[tuple[int, bytes, tuple[str, ...]], _SpecIndex] = {}
+
+
+def _read_spec_cached(spec: str, fetch_keys: Sequence[str]) -> _SpecIndex:
+    with open(spec, "rb") as fp:
+        contents = fp.read()
+    cache_key = (len(contents), hashlib.sha256(contents).digest(), tuple(fetch_keys))
+    if (spec_index := _spec_cache.get(cache_key)) is None:
+        spec_index = _SpecIndex(*_read_spec(spec, fetch_keys))
+        if len(_spec_cache) >= _SPEC_CACHE_SIZE:
+            del _spec_cache[next(iter(_spec_cache))]
+        _spec_cache[cache_key] = spec_index
+    return spec_index._replace(keys=list(spec_index.keys))
+
+
 def _read_spec(
     spec: str, fetch_keys: Sequence[str]
 ) -> tuple[int, datetime, DateUnit, list[str], npt.NDArray[np.int64]]:
@@ -363,6 +395,7 @@ def optional_get(arr: npt.NDArray[Any] | None, idx: int) -> Any:
     keys_array = keys_array[rearranged]
 
     indices_array = np.array(indices, dtype=np.int64)[rearranged]
+    indices_array.flags.writeable = False
 
     units = arrays["UNITS   "]
     if units is None:
@@ -406,6 +439,145 @@ def _read_summary(
     unit: DateUnit,
     indices: npt.NDArray[np.int64],
     date_index: int,
+) -> tuple[npt.NDArray[np.float32], list[datetime]]:
+    if not summary.lower().endswith("funsmry"):
+        params = _read_unformatted_params(summary, np.append(indices, date_index))
+        if params is not None:
+            if len(params) == 0:
+                return np.array([], dtype=np.float32), []
+            dates = [
+                _round_to_seconds(start_date + unit.make_delta(float(time)))
+                for time in params[:, -1]
+            ]
+            return params[:, :-1].T, dates
+    return _read_summary_with_resfo(summary, start_date, unit, indices, date_index)
+
+
+_ITEM_SIZES = {b"INTE": 4, b"REAL": 4, b"LOGI": 4, b"DOUB": 8, b"CHAR": 8, b"MESS": 0}
+
+
+def _read_unformatted_params(
+    summary: str, columns: npt.NDArray[np.int64]
+) -> npt.NDArray[np.float32] | None:
+    """Reads the given columns of the last PARAMS of each report step into a
+    (report steps x columns) array.
+
+    Only the keyword headers and record markers are read while walking the
+    memory mapped file. Every PARAMS keyword has the same record layout, so
+    after the first one they are skipped and their record markers are checked
+    all at once. The values are then gathered from all report steps at once.
+
+    Returns None if the file is not laid out as expected, in which case it
+    should be read with resfo.
+    """
+    if os.path.getsize(summary) == 0:
+        return np.empty((0, len(columns)), dtype=np.float32)
+    data = np.memmap(summary, dtype=np.uint8, mode="r")
+    size = len(data)
+
+    # Start of the data records of the last PARAMS in each report step
+    params_starts: list[int] = []
+    last_params: int | None = None
+    # Start of the data records of the PARAMS which were skipped
+    skipped_params: list[int] = []
+    # Length, offsets of the data records and number of items in each
+    # record of the first PARAMS
+    params_length = -1
+    record_offsets: list[int] = []
+    record_items: list[int] = []
+
+    position = 0
+    while position < size:
+        if position + 24 > size:
+            return None
+        head, keyword, length, dtype, tail = struct.unpack_from(
+            ">i8si4si", data, position
+        )
+        if head != 16 or tail != 16:
+            return None
+        position += 24
+        data_start = position
+
+        if keyword == b"PARAMS  " and record_offsets:
+            if dtype != b"REAL" or length != params_length:
+                return None
+            skipped_params.append(data_start)
+            position += record_offsets[-1] + 4 * record_items[-1] + 4
+            last_params = data_start
+            continue
+
+        if dtype in _ITEM_SIZES:
+            item_size = _ITEM_SIZES[dtype]
+        elif dtype.startswith(b"C0") and dtype[2:].isdigit():
+            item_size = int(dtype[2:])
+        else:
+            return None
+        offsets = []
+        items = []
+        remaining = length * item_size
+        while remaining > 0:
+            if position + 4 > size:
+                return None
+            (record_length,) = struct.unpack_from(">i", data, position)
+            end = position + 4 + record_length
+            if (
+                record_length <= 0
+                or end + 4 > size
+                or struct.unpack_from(">i", data, end)[0] != record_length
+            ):
+                return None
+            offsets.append(position + 4 - data_start)
+            items.append(record_length // max(item_size, 1))
+            remaining -= record_length
+            position = end + 4
+        if remaining < 0:
+            return None
+
+        if keyword == b"SEQHDR  " and last_params is not None:
+            params_starts.append(last_params)
+            last_params = None
+        elif keyword == b"PARAMS  ":
+            if dtype != b"REAL" or not offsets:
+                return None
+            params_length, record_offsets, record_items = length, offsets, items
+            last_params = data_start
+    if last_params is not None:
+        params_starts.append(last_params)
+
+    if not params_starts:
+        return np.empty((0, len(columns)), dtype=np.float32)
+    if position > size or (len(columns) > 0 and columns.max() >= params_length):
+        return None
+
+    starts = np.array(params_starts, dtype=np.int64)
+    skipped = np.array(skipped_params, dtype=np.int64)
+    offsets_array = np.array(record_offsets, dtype=np.int64)
+    items_array = np.array(record_items, dtype=np.int64)
+    if np.any(starts % 4) or np.any(skipped % 4) or np.any(offsets_array % 4):
+        return None
+
+    words = np.ndarray(shape=(size // 4,), dtype=">i4", buffer=data)
+    record_starts = skipped[:, np.newaxis] // 4 + offsets_array // 4
+    if np.any(words[record_starts - 1] != 4 * items_array) or np.any(
+        words[record_starts + items_array] != 4 * items_array
+    ):
+        return None
+
+    record_ends = np.cumsum(items_array)
+    record = np.searchsorted(record_ends, columns, side="right")
+    column_offsets = (
+        offsets_array[record] // 4 + columns - (record_ends - items_array)[record]
+    )
+    floats = np.ndarray(shape=(size // 4,), dtype=">f4", buffer=data)
+    return floats[starts[:, np.newaxis] // 4 + column_offsets].astype(np.float32)
+
+
+def _read_summary_with_resfo(
+    summary: str,
+    start_date: datetime,
+    unit: DateUnit,
+    indices: npt.NDArray[np.int64],
+    date_index: int,
 ) -> tuple[npt.NDArray[np.float32], list[datetime]]:
     if summary.lower().endswith("funsmry"):
         mode = "rt"
@@ -42,6 +42,18 @@ def _lower(v: str) -> str:
         U, w, V.T = svd(D_delta) then we assume that U @ U.T = I.
     """
 
+PrecisionType = Annotated[Literal["float64", "float32"], BeforeValidator(_lower)]
+precision_description = """
+    The floating point precision of the update. The options are:
+
+    * `float64`:
+        Parameters are updated in the precision they are stored with.
+    * `float32`:
+        Parameters, responses, perturbed observations and the transition
+        matrix are all kept in single precision, which halves the memory
+        needed to update large fields.
+    """
+
 
 InversionTypeIES = Annotated[
     Literal["direct", "subspace_exact", "subspace_projected"], BeforeValidator(_lower)
@@ -74,6 +86,14 @@ class ESSettings(BaseSettings):
             title="Adaptive localization correlation threshold",
         ),
     ] = None
+    precision: Annotated[
+        PrecisionType,
+        Field(title="Numerical precision", description=precision_description),
+    ] = "float64"
+    memory_budget: Annotated[
+        int | None,
+        Field(gt=0, title="Memory budget of the update in megabytes"),
+    ] = None
 
     def correlation_threshold(self, ensemble_size: int) -> float:
         """Decides whether to use user-defined or default threshold.
@@ -1,12 +1,16 @@
 # mypy: ignore-errors
 import copy
+import hashlib
 import importlib
 import logging
 import os
+import shutil
+import warnings
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import field
 from datetime import datetime
+from functools import partial
 from os import path
 from pathlib import Path
 from typing import (
@@ -23,6 +27,7 @@
 from pydantic.dataclasses import dataclass, rebuild_dataclass
 
 from ert.plugins import ErtPluginManager
+from ert.shared import __version__
 from ert.substitutions import Substitutions
 
 from ._get_num_cpu import get_num_cpu_from_data_file
@@ -36,7 +41,7 @@
 )
 from .model_config import ModelConfig
 from .observation_vector import ObsVector
-from .observations import EnkfObs
+from .observations import EnkfObs, TimeMap
 from .parse_arg_types_list import parse_arg_types_list
 from .parsing import (
     ConfigDict,
@@ -57,6 +62,7 @@
 from .parsing import (
     parse as parse_config,
 )
+from .parsing.lark_parser import _load_from_cache, _parse_cache_dir, _save_to_cache
 from .parsing.observations_parser import (
     GenObsValues,
     HistoryValues,
@@ -81,76 +87,143 @@ def site_config_location() -> str:
     )
 
 
-def create_forward_model_json(
+_REAL_ITER_KEYS = ("<IENS>", "<ITER>", "<GEO_ID>")
+
+
+class _Substituter:
+    """Substitutes the strings of one forward model step.
+
+    Strings are substituted as by :meth:`Substitutions.substitute_real_iter`,
+    after the private arguments of the step are applied. The result for
+    each string is memoized when it does not depend on the realization
+    or iteration, which is the case unless a realization or iteration
+    define is reached while substituting.
+    """
+
+    def __init__(
+        self,
+        context: Substitutions,
+        static_context: Substitutions,
+        fm_step: ForwardModelStep,
+    ) -> None:
+        fm_step_args = ",".join(
+            [f"{key}={value}" for key, value in fm_step.private_args.items()]
+        )
+        fm_step_description = f"{fm_step.name}({fm_step_args})"
+        self.substitution_context_hint = (
+            f"parsing forward model step `FORWARD_MODEL {fm_step_description}` - "
+            "reconstructed, with defines applied during parsing"
+        )
+        self.context = context
+        self.static_context = static_context
+        self.private_args = fm_step.private_args
+        static_private_args = {
+            key: self._substitute_static(val)
+            for key, val in fm_step.private_args.items()
+        }
+        self.static_private_args: Substitutions | None = (
+            Substitutions(static_private_args)
+            if None not in static_private_args.values()
+            else None
+        )
+        self._substituted: dict[str, str | None] = {}
+
+    def _substitute_static(self, string: str) -> str | None:
+        """The substitution of string, or None if it depends on the
+        realization or iteration.
+
+        Defines that are never replaced are kept as they are, so if no
+        realization or iteration define is left, none were reached.
+        """
+        substituted = self.static_context.substitute(string)
+        if any(key in substituted for key in _REAL_ITER_KEYS):
+            return None
+        return substituted
+
+    def _substitute_private_args(self, string: str, iens: int, itr: int) -> str:
+        private_args = self.static_private_args
+        if private_args is None:
+            private_args = Substitutions(
+                {
+                    key: self.context.substitute_real_iter(val, iens, itr)
+                    for key, val in self.private_args.items()
+                }
+            )
+        return private_args.substitute(
+            string, self.substitution_context_hint, 1, warn_max_iter=False
+        )
+
+    @overload
+    def substitute(self, string: str, iens: int, itr: int) -> str: ...
+
+    @overload
+    def substitute(self, string: None, iens: int, itr: int) -> None: ...
+
+    def substitute(self, string, iens, itr):
+        if string is None:
+            return string
+        if self.static_private_args is None:
+            return self.context.substitute_real_iter(
+                self._substitute_private_args(string, iens, itr), iens, itr
+            )
+        if string not in self._substituted:
+            self._substituted[string] = self._substitute_static(
+                self._substitute_private_args(string, iens, itr)
+            )
+        substituted = self._substituted[string]
+        if substituted is None:
+            return self.context.substitute_real_iter(
+                self._substitute_private_args(string, iens, itr), iens, itr
+            )
+        return substituted
+
+    def filter_env_dict(
+        self, env_dict: dict[str, str], iens: int, itr: int
+    ) -> dict[str, str] | None:
+        substituted_dict = {}
+        for key, value in env_dict.items():
+            substituted_key = self.substitute(key, iens, itr)
+            substituted_value = self.substitute(value, iens, itr)
+            if substituted_value is None:
+                substituted_dict[substituted_key] = None
+            elif not substituted_value:
+                substituted_dict[substituted_key] = ""
+            elif not (substituted_value[0] == "<" and substituted_value[-1] == ">"):
+                # Remove values containing "<XXX>". These are expected to be
+                # replaced by substitute, but were not.
+                substituted_dict[substituted_key] = substituted_value
+            else:
+                logger.warning(
+                    f"Environment variable {substituted_key} skipped due to"
+                    f" unmatched define {substituted_value}",
+                )
+        # Its expected that empty dicts be replaced with "null"
+        # in jobs.json
+        if not substituted_dict:
+            return None
+        return substituted_dict
+
+
+def forward_model_json_renderer(
     context: Substitutions,
     forward_model_steps: list[ForwardModelStep],
-    run_id: str | None,
-    iens: int = 0,
-    itr: int = 0,
     user_config_file: str | None = "",
     env_vars: dict[str, str] | None = None,
     env_pr_fm_step: dict[str, dict[str, Any]] | None = None,
     skip_pre_experiment_validation: bool = False,
-) -> dict[str, Any]:
+) -> Callable[[str | None, int, int], dict[str, Any]]:
+    """Prepares the forward model of an experiment for rendering jobs.json.
+
+    The returned function gives the content of jobs.json for a run id,
+    realization and iteration, as :func:`create_forward_model_json`.
+    Substitutions that do not depend on the realization or iteration
+    are done once, and reused for all realizations.
+    """
     if env_vars is None:
         env_vars = {}
     if env_pr_fm_step is None:
         env_pr_fm_step = {}
 
-    class Substituter:
-        def __init__(self, fm_step):
-            fm_step_args = ",".join(
-                [f"{key}={value}" for key, value in fm_step.private_args.items()]
-            )
-            fm_step_description = f"{fm_step.name}({fm_step_args})"
-            self.substitution_context_hint = (
-                f"parsing forward model step `FORWARD_MODEL {fm_step_description}` - "
-                "reconstructed, with defines applied during parsing"
-            )
-            self.copy_private_args = Substitutions()
-            for key, val in fm_step.private_args.items():
-                self.copy_private_args[key] = context.substitute_real_iter(
-                    val, iens, itr
-                )
-
-        @overload
-        def substitute(self, string: str) -> str: ...
-
-        @overload
-        def substitute(self, string: None) -> None: ...
-
-        def substitute(self, string):
-            if string is None:
-                return string
-            string = self.copy_private_args.substitute(
-                string, self.substitution_context_hint, 1, warn_max_iter=False
-            )
-            return context.substitute_real_iter(string, iens, itr)
-
-        def filter_env_dict(self, env_dict: dict[str, str]) -> dict[str, str] | None:
-            substituted_dict = {}
-            for key, value in env_dict.items():
-                substituted_key = self.substitute(key)
-                substituted_value = self.substitute(value)
-                if substituted_value is None:
-                    substituted_dict[substituted_key] = None
-                elif not substituted_value:
-                    substituted_dict[substituted_key] = ""
-                elif not (substituted_value[0] == "<" and substituted_value[-1] == ">"):
-                    # Remove values containing "<XXX>". These are expected to be
-                    # replaced by substitute, but were not.
-                    substituted_dict[substituted_key] = substituted_value
-                else:
-                    logger.warning(
-                        f"Environment variable {substituted_key} skipped due to"
-                        f" unmatched define {substituted_value}",
-                    )
-            # Its expected that empty dicts be replaced with "null"
-            # in jobs.json
-            if not substituted_dict:
-                return None
-            return substituted_dict
-
     def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
         return fm_step.default_mapping.get(arg, arg)
 
@@ -165,62 +238,97 @@ def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
     config_path = str(config_file_path.parent) if config_file_path else ""
     config_file = str(config_file_path.name) if config_file_path else ""
 
-    job_list_errors = []
-    job_list: list[ForwardModelStepJSON] = []
-    for idx, fm_step in enumerate(forward_model_steps):
-        substituter = Substituter(fm_step)
-        fm_step_json = {
-            "name": substituter.substitute(fm_step.name),
-            "executable": substituter.substitute(fm_step.executable),
-            "target_file": substituter.substitute(fm_step.target_file),
-            "error_file": substituter.substitute(fm_step.error_file),
-            "start_file": substituter.substitute(fm_step.start_file),
-            "stdout": (
-                substituter.substitute(fm_step.stdout_file) + f".{idx}"
-                if fm_step.stdout_file
-                else None
-            ),
-            "stderr": (
-                substituter.substitute(fm_step.stderr_file) + f".{idx}"
-                if fm_step.stderr_file
-                else None
-            ),
-            "stdin": substituter.substitute(fm_step.stdin_file),
-            "argList": [
-                handle_default(fm_step, substituter.substitute(arg))
-                for arg in fm_step.arglist
-            ],
-            "environment": substituter.filter_env_dict(
-                dict(env_pr_fm_step.get(fm_step.name, {}), **fm_step.environment)
-            ),
-            "exec_env": substituter.filter_env_dict(fm_step.exec_env),
-            "max_running_minutes": fm_step.max_running_minutes,
-        }
+    static_context = Substitutions(
+        {key: val for key, val in context.items() if key not in _REAL_ITER_KEYS}
+    )
+    substituters = [
+        _Substituter(context, static_context, fm_step)
+        for fm_step in forward_model_steps
+    ]
+
+    def render(run_id: str | None, iens: int = 0, itr: int = 0) -> dict[str, Any]:
+        job_list_errors = []
+        job_list: list[ForwardModelStepJSON] = []
+        for idx, (fm_step, substituter) in enumerate(
+            zip(forward_model_steps, substituters, strict=True)
+        ):
+            substitute = partial(substituter.substitute, iens=iens, itr=itr)
+            fm_step_json = {
+                "name": substitute(fm_step.name),
+                "executable": substitute(fm_step.executable),
+                "target_file": substitute(fm_step.target_file),
+                "error_file": substitute(fm_step.error_file),
+                "start_file": substitute(fm_step.start_file),
+                "stdout": (
+                    substitute(fm_step.stdout_file) + f".{idx}"
+                    if fm_step.stdout_file
+                    else None
+                ),
+                "stderr": (
+                    substitute(fm_step.stderr_file) + f".{idx}"
+                    if fm_step.stderr_file
+                    else None
+                ),
+                "stdin": substitute(fm_step.stdin_file),
+                "argList": [
+                    handle_default(fm_step, substitute(arg)) for arg in fm_step.arglist
+                ],
+                "environment": substituter.filter_env_dict(
+                    dict(env_pr_fm_step.get(fm_step.name, {}), **fm_step.environment),
+                    iens,
+                    itr,
+                ),
+                "exec_env": substituter.filter_env_dict(fm_step.exec_env, iens, itr),
+                "max_running_minutes": fm_step.max_running_minutes,
+            }
 
-        try:
-            if not skip_pre_experiment_validation:
-                fm_step_json = fm_step.validate_pre_realization_run(fm_step_json)
-        except ForwardModelStepValidationError as exc:
-            job_list_errors.append(
-                ErrorInfo(
-                    message=f"Validation failed for "
-                    f"forward model step {fm_step.name}: {exc!s}"
-                ).set_context(fm_step.name)
-            )
+            try:
+                if not skip_pre_experiment_validation:
+                    fm_step_json = fm_step.validate_pre_realization_run(fm_step_json)
+            except ForwardModelStepValidationError as exc:
+                job_list_errors.append(
+                    ErrorInfo(
+                        message=f"Validation failed for "
+                        f"forward model step {fm_step.name}: {exc!s}"
+                    ).set_context(fm_step.name)
+                )
+
+            job_list.append(fm_step_json)
+
+        if job_list_errors:
+            raise ConfigValidationError.from_collected(job_list_errors)
+
+        return {
+            "global_environment": env_vars,
+            "config_path": config_path,
+            "config_file": config_file,
+            "jobList": job_list,
+            "run_id": run_id,
+            "ert_pid": str(os.getpid()),
+        }
 
-        job_list.append(fm_step_json)
+    return render
 
-    if job_list_errors:
-        raise ConfigValidationError.from_collected(job_list_errors)
 
-    return {
-        "global_environment": env_vars,
-        "config_path": config_path,
-        "config_file": config_file,
-        "jobList": job_list,
-        "run_id": run_id,
-        "ert_pid": str(os.getpid()),
-    }
+def create_forward_model_json(
+    context: Substitutions,
+    forward_model_steps: list[ForwardModelStep],
+    run_id: str | None,
+    iens: int = 0,
+    itr: int = 0,
+    user_config_file: str | None = "",
+    env_vars: dict[str, str] | None = None,
+    env_pr_fm_step: dict[str, dict[str, Any]] | None = None,
+    skip_pre_experiment_validation: bool = False,
+) -> dict[str, Any]:
+    return forward_model_json_renderer(
+        context,
+        forward_model_steps,
+        user_config_file=user_config_file,
+        env_vars=env_vars,
+        env_pr_fm_step=env_pr_fm_step,
+        skip_pre_experiment_validation=skip_pre_experiment_validation,
+    )(run_id, iens, itr)
 
 
 @dataclass
@@ -967,16 +1075,9 @@ def _installed_forward_model_steps_from_dict(
             fm_steps[name] = new_fm_step
 
         for fm_step_path in config_dict.get(ConfigKeys.INSTALL_JOB_DIRECTORY, []):
-            for file_name in _get_files_in_directory(fm_step_path, errors):
-                if not path.isfile(file_name):
-                    continue
-                try:
-                    new_fm_step = _forward_model_step_from_config_file(
-                        config_file=file_name
-                    )
-                except ConfigValidationError as e:
-                    errors.append(e)
-                    continue
+            for file_name, new_fm_step in _forward_model_steps_from_directory(
+                fm_step_path, errors
+            ):
                 name = new_fm_step.name
                 if name in fm_steps:
                     ConfigWarning.warn(
@@ -1016,6 +1117,7 @@ def _create_observations(
             obs_time_list = time_map
 
         time_len = len(obs_time_list)
+        time_index = TimeMap(obs_time_list)
         config_errors: list[ErrorInfo] = []
         for obs_name, values in obs_config_content:
             try:
@@ -1034,7 +1136,7 @@ def _create_observations(
                         **EnkfObs._handle_summary_observation(
                             values,
                             obs_name,
-                            obs_time_list,
+                            time_index,
                             bool(ensemble_config.refcase),
                         )
                     )
@@ -1044,7 +1146,7 @@ def _create_observations(
                             ensemble_config,
                             values,
                             obs_name,
-                            obs_time_list,
+                            time_index,
                             bool(ensemble_config.refcase),
                         )
                     )
@@ -1086,6 +1188,111 @@ def _get_files_in_directory(job_path, errors):
     return files
 
 
+def _job_directory_cache_path(job_path: str) -> str | None:
+    cache_dir = _parse_cache_dir()
+    if cache_dir is None:
+        return None
+    key = hashlib.sha256(f"{__version__}\0{path.abspath(job_path)}".encode())
+    return path.join(cache_dir, f"job-directory-{key.hexdigest()}.pickle")
+
+
+def _cacheable_forward_model_step(
+    config_file: str,
+) -> tuple["ForwardModelStep", bool]:
+    """Parses a forward model step, and tells whether it may be cached.
+
+    Steps that give warnings, or may depend on environment variables, are not
+    cached, so that they give the same result and warnings on every load.
+    """
+    with warnings.catch_warnings(record=True) as recorded:
+        warnings.simplefilter("always")
+        fm_step = _forward_model_step_from_config_file(config_file=config_file)
+    for warning in recorded:
+        if isinstance(warning.message, ConfigWarning):
+            ConfigWarning._formatted_warn(warning.message)
+        else:
+            warnings.warn_explicit(
+                warning.message, warning.category, warning.filename, warning.lineno
+            )
+    return fm_step, not recorded and "$" not in read_file(config_file)
+
+
+def _executable_signature(executable: str) -> tuple[Any, ...] | None:
+    """The state outside the job file that the validation of its
+    EXECUTABLE depends on: where it resolves to on PATH, whether it exists,
+    is a directory, and is executable."""
+    resolved = executable if path.isabs(executable) else shutil.which(executable)
+    if resolved is None:
+        return None
+    try:
+        mode = os.stat(resolved).st_mode
+    except OSError:
+        return (resolved, None)
+    return (resolved, mode, os.access(resolved, os.X_OK))
+
+
+def _forward_model_steps_from_directory(
+    job_path: str, errors: list[ConfigValidationError]
+) -> list[tuple[str, "ForwardModelStep"]]:
+    """Parses the forward model steps in a job directory.
+
+    The parsed steps are cached between runs. A cached step is used as long
+    as the size and modification time of its file, and the state of its
+    executable, are unchanged, so an unchanged directory costs one listing
+    and a stat per file and executable.
+    """
+    if not path.isdir(job_path):
+        errors.append(
+            ConfigValidationError.with_context(
+                f"Unable to locate job directory {job_path!r}", job_path
+            )
+        )
+        return []
+
+    cache_path = _job_directory_cache_path(job_path)
+    cached = (_load_from_cache(cache_path) if cache_path else None) or {}
+    entries = {}
+    fm_steps = []
+    found_files = False
+    updated = False
+    with os.scandir(job_path) as directory:
+        for entry in directory:
+            if not entry.is_file():
+                continue
+            found_files = True
+            file_name = path.abspath(entry.path)
+            stat = entry.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if (
+                file_name in cached
+                and cached[file_name][0] == signature
+                and cached[file_name][1]
+                == _executable_signature(cached[file_name][2].executable)
+            ):
+                fm_step = cached[file_name][2]
+                entries[file_name] = cached[file_name]
+            else:
+                try:
+                    fm_step, cacheable = _cacheable_forward_model_step(file_name)
+                except ConfigValidationError as e:
+                    errors.append(e)
+                    continue
+                if cacheable:
+                    entries[file_name] = (
+                        signature,
+                        _executable_signature(fm_step.executable),
+                        fm_step,
+                    )
+                    updated = True
+            fm_steps.append((file_name, fm_step))
+
+    if not found_files:
+        ConfigWarning.warn(f"No files found in job directory {job_path}", job_path)
+    if cache_path is not None and (updated or entries.keys() != cached.keys()):
+        _save_to_cache(cache_path, entries)
+    return fm_steps
+
+
 def _substitutions_from_dict(config_dict) -> Substitutions:
     subst_list = {}
 
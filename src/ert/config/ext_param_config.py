@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -81,18 +81,18 @@ def write_to_runpath(
         )
         Path.mkdir(file_path.parent, exist_ok=True, parents=True)
 
+        dataset = ensemble.load_parameters(self.name, real_nr)
         data: MutableDataType = {}
-        for da in ensemble.load_parameters(self.name, real_nr)["values"]:
-            assert isinstance(da, xr.DataArray)
-            name = str(da.names.values)
-            try:
-                outer, inner = name.split("\0")
-
-                if outer not in data:
-                    data[outer] = {}
-                data[outer][inner] = float(da)  # type: ignore
-            except ValueError:
-                data[name] = float(da)
+        for name, value in zip(
+            dataset["names"].values.tolist(),
+            dataset["values"].values.tolist(),
+            strict=True,
+        ):
+            outer, _, inner = name.partition("\0")
+            if inner:
+                data.setdefault(outer, {})[inner] = value  # type: ignore
+            else:
+                data[name] = value
 
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(data, f)
@@ -132,6 +132,20 @@ def to_dataset(data: DataType) -> xr.Dataset:
             }
         )
 
+    @staticmethod
+    def matrix_to_dataset(
+        names: Sequence[str], values: npt.NDArray[np.float64]
+    ) -> xr.Dataset:
+        """Creates a dataset for several realizations from a matrix with one
+        row of values per realization, and names flattened as by to_dataset"""
+        return xr.Dataset(
+            {
+                "values": (("realizations", "names"), values),
+                "names": list(names),
+            },
+            coords={"realizations": np.arange(values.shape[0])},
+        )
+
     def __len__(self) -> int:
         return len(self.input_keys)
 
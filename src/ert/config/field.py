@@ -41,6 +41,7 @@ class Field(ParameterConfig):
     output_file: Path
     grid_file: str
     mask_file: Path | None = None
+    memory_map: bool = False
 
     @classmethod
     def from_config_list(
@@ -60,6 +61,7 @@ def from_config_list(
         min_ = options.get("MIN")
         max_ = options.get("MAX")
         init_files = options.get("INIT_FILES")
+        memory_map = str_to_bool(options.get("MEMORY_MAP", "FALSE"))
         if input_transform:
             ConfigWarning.warn(
                 f"Got INPUT_TRANSFORM for FIELD: {name}, "
@@ -130,6 +132,7 @@ def from_config_list(
             output_file=out_file,
             grid_file=os.path.abspath(grid_file_path),
             update=update_parameter,
+            memory_map=memory_map,
         )
 
     def __len__(self) -> int:
@@ -189,7 +192,7 @@ def save_parameters(
         data: npt.NDArray[np.float64],
     ) -> None:
         ma = np.ma.MaskedArray(  # type: ignore
-            data=np.zeros(self.mask.size),
+            data=np.zeros(self.mask.size, dtype=data.dtype),
             mask=self.mask,
             fill_value=np.nan,
         )
@@ -201,23 +204,28 @@ def save_parameters(
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
-        )
-        return da.T.to_numpy()
+        active = ~self.mask.ravel()
+        # Filling a preallocated matrix avoids holding every realization
+        # twice in memory, as stacking a list of columns would.
+        parameters: npt.NDArray[np.floating] | None = None
+        for i, real in enumerate(realizations):
+            values = ensemble.load_parameter_values(group, int(real)).reshape(-1)
+            if parameters is None:
+                parameters = np.empty(
+                    (int(active.sum()), len(realizations)), dtype=values.dtype
+                )
+            parameters[:, i] = values[active]
+        if parameters is None:
+            return np.empty((int(active.sum()), 0), dtype=np.float32)
+        return parameters
 
-    def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray:
-        da = ensemble.load_parameters(self.name, real_nr)["values"]
-        assert isinstance(da, xr.DataArray)
-        return da
+    def _fetch_from_ensemble(
+        self, real_nr: int, ensemble: Ensemble
+    ) -> npt.NDArray[np.floating]:
+        return ensemble.load_parameter_values(self.name, real_nr)
 
     def _transform_data(
-        self, data_array: xr.DataArray
+        self, data_array: npt.NDArray[np.floating]
     ) -> np.ma.MaskedArray[Any, np.dtype[np.float32]]:
         return np.ma.MaskedArray(  # type: ignore
             _field_truncate(
@@ -1,10 +1,12 @@
 import dataclasses
+import io
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Self
 
 import numpy as np
+import numpy.typing as npt
 import polars
 
 from ert.substitutions import substitute_runpath_name
@@ -117,61 +119,43 @@ def from_config_dict(cls, config_dict: ConfigDict) -> Self | None:
         )
 
     def read_from_file(self, run_path: str, iens: int, iter: int) -> polars.DataFrame:
-        def _read_file(filename: Path, report_step: int) -> polars.DataFrame:
-            try:
-                data = np.loadtxt(filename, ndmin=1)
-            except ValueError as err:
-                raise InvalidResponseFile(str(err)) from err
-            active_information_file = filename.parent / (filename.name + "_active")
-            if active_information_file.exists():
-                try:
-                    active_list = np.loadtxt(active_information_file)
-                except ValueError as err:
-                    raise InvalidResponseFile(str(err)) from err
-                data[active_list == 0] = np.nan
-            return polars.DataFrame(
-                {
-                    "report_step": polars.Series(
-                        np.full(len(data), report_step), dtype=polars.UInt16
-                    ),
-                    "index": polars.Series(np.arange(len(data)), dtype=polars.UInt16),
-                    "values": polars.Series(data, dtype=polars.Float32),
-                }
-            )
-
-        errors = []
+        errors: list[Exception] = []
 
         run_path_ = Path(run_path)
-        datasets_per_name = []
+        key_indices = []
+        report_steps_per_file = []
+        data_per_file = []
 
-        for name, input_file, report_steps in zip(
-            self.keys, self.input_files, self.report_steps_list, strict=False
+        for key_index, (input_file, report_steps) in enumerate(
+            zip(self.input_files, self.report_steps_list, strict=False)
         ):
-            datasets_per_report_step = []
             if report_steps is None:
-                try:
-                    filename = substitute_runpath_name(input_file, iens, iter)
-                    datasets_per_report_step.append(_read_file(run_path_ / filename, 0))
-                except (InvalidResponseFile, FileNotFoundError) as err:
-                    errors.append(err)
+                files = [(0, substitute_runpath_name(input_file, iens, iter))]
             else:
-                for report_step in report_steps:
-                    filename = substitute_runpath_name(
-                        input_file % report_step, iens, iter
+                files = [
+                    (
+                        report_step,
+                        substitute_runpath_name(input_file % report_step, iens, iter),
                     )
-                    try:
-                        datasets_per_report_step.append(
-                            _read_file(run_path_ / filename, report_step)
-                        )
-                    except (InvalidResponseFile, FileNotFoundError) as err:
-                        errors.append(err)
-
-            if len(datasets_per_report_step) > 0:
-                ds_all_report_steps = polars.concat(datasets_per_report_step)
-                ds_all_report_steps.insert_column(
-                    0, polars.Series("response_key", [name] * len(ds_all_report_steps))
-                )
-                datasets_per_name.append(ds_all_report_steps)
+                    for report_step in report_steps
+                ]
+            found_report_steps = []
+            filenames = []
+            for report_step, filename in files:
+                if (run_path_ / filename).is_file():
+                    found_report_steps.append(report_step)
+                    filenames.append(run_path_ / filename)
+                else:
+                    errors.append(
+                        FileNotFoundError(f"{run_path_ / filename} not found.")
+                    )
+            for report_step, data in zip(
+                found_report_steps, _read_gen_data_files(filenames, errors), strict=True
+            ):
+                if data is not None:
+                    key_indices.append(key_index)
+                    report_steps_per_file.append(report_step)
+                    data_per_file.append(data)
 
         if errors:
             if all(isinstance(err, FileNotFoundError) for err in errors):
@@ -185,8 +169,26 @@ def _read_file(filename: Path, report_step: int) -> polars.DataFrame:
                     f"{self.name}, errors: {','.join([str(err) for err in errors])}"
                 )
 
-        combined = polars.concat(datasets_per_name)
-        return combined
+        lengths = [len(data) for data in data_per_file]
+        offsets = np.cumsum(lengths, dtype=np.int64) - lengths
+        return polars.DataFrame(
+            {
+                "response_key": polars.Series(self.keys, dtype=polars.String).gather(
+                    np.repeat(key_indices, lengths)
+                ),
+                "report_step": polars.Series(
+                    np.repeat(report_steps_per_file, lengths), dtype=polars.UInt16
+                ),
+                "index": polars.Series(
+                    np.arange(sum(lengths)) - np.repeat(offsets, lengths),
+                    dtype=polars.UInt16,
+                ),
+                "values": polars.Series(
+                    np.concatenate(data_per_file) if data_per_file else [],
+                    dtype=polars.Float32,
+                ),
+            }
+        )
 
     def get_args_for_key(self, key: str) -> tuple[str | None, list[int] | None]:
         for i, _key in enumerate(self.keys):
@@ -204,4 +206,79 @@ def primary_key(self) -> list[str]:
         return ["report_step", "index"]
 
 
+def _parse_single_column(contents: list[bytes]) -> list[npt.NDArray[np.float64]]:
+    """Parses files with one number per line in one pass.
+
+    Raises ValueError if any file has another format, such as blank
+    lines, comments or several numbers on a line.
+    """
+    contents = [
+        content if not content or content.endswith(b"\n") else content + b"\n"
+        for content in contents
+    ]
+    try:
+        values = polars.read_csv(
+            io.BytesIO(b"".join(contents)),
+            has_header=False,
+            schema={"values": polars.Float64},
+            separator="\0",
+            quote_char=None,
+        )["values"]
+    except polars.exceptions.PolarsError as err:
+        raise ValueError(str(err)) from err
+    lengths = [content.count(b"\n") for content in contents]
+    if values.null_count() > 0 or len(values) != sum(lengths):
+        raise ValueError("Not one number per line")
+    return np.split(values.to_numpy(writable=True), np.cumsum(lengths[:-1]))
+
+
+def _read_gen_data_files(
+    filenames: list[Path], errors: list[Exception]
+) -> list[npt.NDArray[np.float64] | None]:
+    """Reads the values of GEN_DATA files, where values are set to nan
+    where the corresponding _active file, if any, has 0.
+
+    The files are parsed together in one pass when they have one number
+    per line, otherwise each file is parsed with np.loadtxt. Errors are
+    appended to errors, and the data of the failing files are None.
+    """
+
+    def _loadtxt(filename: Path, ndmin: int) -> npt.NDArray[np.float64] | None:
+        try:
+            return np.loadtxt(filename, ndmin=ndmin)
+        except ValueError as err:
+            errors.append(InvalidResponseFile(str(err)))
+            return None
+
+    try:
+        data_per_file: list[npt.NDArray[np.float64] | None] = list(
+            _parse_single_column([filename.read_bytes() for filename in filenames])
+        )
+    except ValueError:
+        data_per_file = [_loadtxt(filename, ndmin=1) for filename in filenames]
+
+    active_files = [
+        (i, filename.parent / (filename.name + "_active"))
+        for i, filename in enumerate(filenames)
+        if data_per_file[i] is not None
+    ]
+    active_files = [(i, path) for i, path in active_files if path.exists()]
+    if not active_files:
+        return data_per_file
+    try:
+        active_lists: list[npt.NDArray[np.float64] | None] = list(
+            _parse_single_column([path.read_bytes() for _, path in active_files])
+        )
+    except ValueError:
+        active_lists = [_loadtxt(path, ndmin=0) for _, path in active_files]
+    for (i, _), active_list in zip(active_files, active_lists, strict=True):
+        data = data_per_file[i]
+        if active_list is None:
+            data_per_file[i] = None
+        elif data is not None:
+            # As np.loadtxt, a single value in the _active file applies to all
+            data[np.squeeze(active_list) == 0] = np.nan
+    return data_per_file
+
+
 responses_index.add_response_type(GenDataConfig)
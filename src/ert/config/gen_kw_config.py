@@ -13,7 +13,6 @@
 import numpy as np
 import pandas as pd
 import xarray as xr
-from scipy.stats import norm
 from typing_extensions import TypedDict
 
 from ert.substitutions import substitute_runpath_name
@@ -557,6 +556,8 @@ def trans_errf(x: float, arg: list[float]) -> float:
         Skewness > 0 => Shifts towards the right
         The width is a relavant scale for the value of skewness.
         """
+        from scipy.stats import norm  # noqa: PLC0415
+
         min_, max_, skew, width = arg[0], arg[1], arg[2], arg[3]
         y = norm(loc=0, scale=width).cdf(x + skew)
         if np.isnan(y):
@@ -607,12 +608,16 @@ def trans_derrf(x: float, arg: list[float]) -> float:
 
     @staticmethod
     def trans_unif(x: float, arg: list[float]) -> float:
+        from scipy.stats import norm  # noqa: PLC0415
+
         min_, max_ = arg[0], arg[1]
         y = norm.cdf(x)
         return y * (max_ - min_) + min_
 
     @staticmethod
     def trans_dunif(x: float, arg: list[float]) -> float:
+        from scipy.stats import norm  # noqa: PLC0415
+
         steps, min_, max_ = int(arg[0]), arg[1], arg[2]
         y = norm.cdf(x)
         return (math.floor(y * steps) / (steps - 1)) * (max_ - min_) + min_
@@ -636,6 +641,8 @@ def trans_lognormal(x: float, arg: list[float]) -> float:
 
     @staticmethod
     def trans_logunif(x: float, arg: list[float]) -> float:
+        from scipy.stats import norm  # noqa: PLC0415
+
         log_min, log_max = math.log(arg[0]), math.log(arg[1])
         tmp = norm.cdf(x)
         log_y = log_min + tmp * (log_max - log_min)  # Shift according to max / min
@@ -643,6 +650,8 @@ def trans_logunif(x: float, arg: list[float]) -> float:
 
     @staticmethod
     def trans_triangular(x: float, arg: list[float]) -> float:
+        from scipy.stats import norm  # noqa: PLC0415
+
         min_, mode, max_ = arg[0], arg[1], arg[2]
         inv_norm_left = (max_ - min_) * (mode - min_)
         inv_norm_right = (max_ - min_) * (max_ - mode)
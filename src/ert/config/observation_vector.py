@@ -8,11 +8,13 @@
 
 from .enkf_observation_implementation_type import EnkfObservationImplementationType
 from .general_observation import GenObservation
-from .summary_observation import SummaryObservation
+from .summary_observation import SummaryObservation, SummaryObservationSeries
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    import numpy.typing as npt
+
 import polars
 
 
@@ -21,7 +23,10 @@ class ObsVector:
     observation_type: EnkfObservationImplementationType
     observation_key: str
     data_key: str
-    observations: dict[int | datetime, GenObservation | SummaryObservation]
+    observations: (
+        dict[int | datetime, GenObservation | SummaryObservation]
+        | SummaryObservationSeries
+    )
 
     def __iter__(self) -> Iterable[SummaryObservation | GenObservation]:
         """Iterate over active report steps; return node"""
@@ -59,31 +64,67 @@ def to_dataset(self, active_list: list[int]) -> polars.DataFrame:
             combined = polars.concat(dataframes)
             return combined
         elif self.observation_type == EnkfObservationImplementationType.SUMMARY_OBS:
-            observations = []
-            actual_response_key = self.observation_key
-            actual_observation_keys = []
-            errors = []
-            dates = list(self.observations.keys())
             if active_list:
-                dates = [date for i, date in enumerate(dates) if i in active_list]
-
-            for time_step in dates:
-                n = self.observations[time_step]
-                assert isinstance(n, SummaryObservation)
-                actual_observation_keys.append(n.observation_key)
-                observations.append(n.value)
-                errors.append(n.std)
-
-            dates_series = polars.Series(dates).dt.cast_time_unit("ms")
-
-            return polars.DataFrame(
-                {
-                    "response_key": actual_response_key,
-                    "observation_key": actual_observation_keys,
-                    "time": dates_series,
-                    "observations": polars.Series(observations, dtype=polars.Float32),
-                    "std": polars.Series(errors, dtype=polars.Float32),
-                }
-            )
+                dates = list(self.observations.keys())
+                active = ObsVector(
+                    self.observation_type,
+                    self.observation_key,
+                    self.data_key,
+                    {
+                        date: self.observations[date]
+                        for i, date in enumerate(dates)
+                        if i in active_list
+                    },
+                )
+                return summary_observations_to_dataset([active])
+            return summary_observations_to_dataset([self])
         else:
             raise ValueError(f"Unknown observation type {self.observation_type}")
+
+
+def summary_observations_to_dataset(vectors: Iterable[ObsVector]) -> polars.DataFrame:
+    """Builds one summary observation dataset from several vectors.
+
+    The columns of all vectors are gathered before the frame is created,
+    so the cost does not grow with one frame per observation vector.
+    """
+    response_keys: list[str] = []
+    observation_keys: list[str] = []
+    dates: list[datetime] = []
+    observations: list[npt.NDArray[np.double]] = []
+    errors: list[npt.NDArray[np.double]] = []
+    for vector in vectors:
+        nodes = vector.observations
+        response_keys.extend([vector.observation_key] * len(nodes))
+        if isinstance(nodes, SummaryObservationSeries):
+            observation_keys.extend([nodes.observation_key] * len(nodes))
+            dates.extend(nodes.dates)
+            observations.append(nodes.observations)
+            errors.append(nodes.stds)
+            continue
+        for date, node in nodes.items():
+            assert isinstance(node, SummaryObservation)
+            observation_keys.append(node.observation_key)
+            dates.append(date)  # type: ignore
+        observations.append(
+            np.array([node.value for node in nodes.values()], dtype=np.double)  # type: ignore
+        )
+        errors.append(
+            np.array([node.std for node in nodes.values()], dtype=np.double)  # type: ignore
+        )
+
+    return polars.DataFrame(
+        {
+            "response_key": polars.Series(response_keys, dtype=polars.String),
+            "observation_key": polars.Series(observation_keys, dtype=polars.String),
+            "time": polars.Series(dates, dtype=polars.Datetime("us")).dt.cast_time_unit(
+                "ms"
+            ),
+            "observations": polars.Series(
+                np.concatenate(observations or [np.empty(0)]), dtype=polars.Float32
+            ),
+            "std": polars.Series(
+                np.concatenate(errors or [np.empty(0)]), dtype=polars.Float32
+            ),
+        }
+    )
@@ -1,9 +1,10 @@
 import os
-from collections.abc import Iterator
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 import numpy as np
 import polars
@@ -13,7 +14,7 @@
 from .enkf_observation_implementation_type import EnkfObservationImplementationType
 from .gen_data_config import GenDataConfig
 from .general_observation import GenObservation
-from .observation_vector import ObsVector
+from .observation_vector import ObsVector, summary_observations_to_dataset
 from .parsing import ConfigWarning, HistorySource
 from .parsing.observations_parser import (
     DateValues,
@@ -23,7 +24,7 @@
     ObservationConfigError,
     SummaryValues,
 )
-from .summary_observation import SummaryObservation
+from .summary_observation import SummaryObservation, SummaryObservationSeries
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -33,6 +34,54 @@
 DEFAULT_TIME_DELTA = timedelta(seconds=30)
 
 
+class TimeMap(Sequence[datetime]):
+    """A time map with a sorted index for finding the nearest report step.
+
+    The index is built once, so that each lookup is a binary search
+    instead of a scan of the whole time map. The time map does not
+    have to be sorted.
+    """
+
+    def __init__(self, dates: Sequence[datetime]) -> None:
+        self._dates = list(dates)
+        # sorted is stable, so equal dates are ordered by report step
+        self._order = sorted(range(len(self._dates)), key=self._dates.__getitem__)
+        self._sorted = [self._dates[i] for i in self._order]
+
+    @overload
+    def __getitem__(self, index: int) -> datetime: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[datetime]: ...
+    def __getitem__(self, index: int | slice) -> datetime | list[datetime]:
+        return self._dates[index]
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def find_nearest(
+        self, time: datetime, threshold: timedelta = DEFAULT_TIME_DELTA
+    ) -> int:
+        """The first report step closest to time, closer than threshold.
+
+        Raises IndexError if there is no such report step.
+        """
+        after = bisect_left(self._sorted, time)
+        candidates = []
+        if after < len(self._sorted):
+            candidates.append(after)
+        if after > 0:
+            # the first of the dates equal to the closest date before time
+            candidates.append(bisect_left(self._sorted, self._sorted[after - 1]))
+        nearest = [
+            (abs(time - self._sorted[i]), self._order[i])
+            for i in candidates
+            if abs(time - self._sorted[i]) < threshold
+        ]
+        if not nearest:
+            raise IndexError(f"{time} is not in the time map")
+        return min(nearest)[1]
+
+
 def history_key(key: str) -> str:
     keyword, *rest = key.split(":")
     return ":".join([keyword + "H", *rest])
@@ -44,26 +93,24 @@ class EnkfObs:
     obs_time: list[datetime] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        grouped: dict[str, list[polars.DataFrame]] = {}
+        summary_vectors: list[ObsVector] = []
+        gen_data_dfs: list[polars.DataFrame] = []
         for vec in self.obs_vectors.values():
             if vec.observation_type == EnkfObservationImplementationType.SUMMARY_OBS:
-                if "summary" not in grouped:
-                    grouped["summary"] = []
-
-                grouped["summary"].append(vec.to_dataset([]))
+                summary_vectors.append(vec)
 
             elif vec.observation_type == EnkfObservationImplementationType.GEN_OBS:
-                if "gen_data" not in grouped:
-                    grouped["gen_data"] = []
-
-                grouped["gen_data"].append(vec.to_dataset([]))
+                gen_data_dfs.append(vec.to_dataset([]))
 
         datasets: dict[str, polars.DataFrame] = {}
 
-        for name, dfs in grouped.items():
-            non_empty_dfs = [df for df in dfs if not df.is_empty()]
-            if len(non_empty_dfs) > 0:
-                datasets[name] = polars.concat(non_empty_dfs).sort("observation_key")
+        summary = summary_observations_to_dataset(summary_vectors)
+        if not summary.is_empty():
+            datasets["summary"] = summary.sort("observation_key")
+
+        non_empty_dfs = [df for df in gen_data_dfs if not df.is_empty()]
+        if len(non_empty_dfs) > 0:
+            datasets["gen_data"] = polars.concat(non_empty_dfs).sort("observation_key")
 
         self.datasets = datasets
 
@@ -129,7 +176,6 @@ def _handle_history_observation(
         refcase = ensemble_config.refcase
         if refcase is None:
             raise ObservationConfigError("REFCASE is required for HISTORY_OBSERVATION")
-        error = history_observation.error
 
         if history_type == HistorySource.REFCASE_HISTORY:
             local_key = history_key(summary_key)
@@ -177,16 +223,19 @@ def _handle_history_observation(
                 values[start:stop],
                 segment_instance,
             )
-        data: dict[int | datetime, GenObservation | SummaryObservation] = {}
-        for date, error, value in zip(refcase.dates, std_dev, values, strict=False):
-            data[date] = SummaryObservation(summary_key, summary_key, value, error)
-
+        num_dates = min(len(refcase.dates), len(values))
         return {
             summary_key: ObsVector(
                 EnkfObservationImplementationType.SUMMARY_OBS,
                 summary_key,
                 "summary",
-                data,
+                SummaryObservationSeries(
+                    summary_key,
+                    summary_key,
+                    list(refcase.dates[:num_dates]),
+                    np.asarray(values[:num_dates], dtype=np.double),
+                    np.asarray(std_dev[:num_dates], dtype=np.double),
+                ),
             )
         }
 
@@ -222,26 +271,19 @@ def _get_time(date_dict: DateValues, start_time: datetime) -> tuple[datetime, st
 
     @staticmethod
     def _find_nearest(
-        time_map: list[datetime],
+        time_map: Sequence[datetime],
         time: datetime,
         threshold: timedelta = DEFAULT_TIME_DELTA,
     ) -> int:
-        nearest_index = -1
-        nearest_diff = None
-        for i, t in enumerate(time_map):
-            diff = abs(time - t)
-            if diff < threshold and (nearest_diff is None or nearest_diff > diff):
-                nearest_diff = diff
-                nearest_index = i
-        if nearest_diff is None:
-            raise IndexError(f"{time} is not in the time map")
-        return nearest_index
+        if not isinstance(time_map, TimeMap):
+            time_map = TimeMap(time_map)
+        return time_map.find_nearest(time, threshold)
 
     @staticmethod
     def _get_restart(
         date_dict: DateValues,
         obs_name: str,
-        time_map: list[datetime],
+        time_map: Sequence[datetime],
         has_refcase: bool,
     ) -> int:
         if date_dict.restart is not None:
@@ -300,7 +342,7 @@ def _handle_summary_observation(
         cls,
         summary_dict: SummaryValues,
         obs_key: str,
-        time_map: list[datetime],
+        time_map: Sequence[datetime],
         has_refcase: bool,
     ) -> dict[str, ObsVector]:
         summary_key = summary_dict.key
@@ -405,7 +447,7 @@ def _handle_general_observation(
         ensemble_config: "EnsembleConfig",
         general_observation: GenObsValues,
         obs_key: str,
-        time_map: list[datetime],
+        time_map: Sequence[datetime],
         has_refcase: bool,
     ) -> dict[str, ObsVector]:
         response_key = general_observation.data
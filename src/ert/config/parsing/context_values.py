@@ -47,6 +47,9 @@ def __deepcopy__(self, memo):
         memo[id(self)] = new_instance
         return new_instance
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextInt, (int(self), self.token, self.keyword_token))
+
 
 class ContextFloat(float):
     def __new__(
@@ -63,6 +66,9 @@ def __deepcopy__(self, memo):
         memo[id(self)] = new_instance
         return new_instance
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextFloat, (float(self), self.token, self.keyword_token))
+
 
 class ContextString(str):
     @classmethod
@@ -83,6 +89,9 @@ def __deepcopy__(self, memo):
         memo[id(self)] = new_instance
         return new_instance
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextString, (str(self), self.token, self.keyword_token))
+
 
 T = TypeVar("T")
 
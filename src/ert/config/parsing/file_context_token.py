@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, cast
 
 from lark import Token
 
@@ -27,6 +27,22 @@ def __new__(cls, token: Token, filename: str) -> "FileContextToken":
         inst_fct.filename = filename
         return inst_fct
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            _file_context_token,
+            (
+                self.type,
+                self.value,
+                self.start_pos,
+                self.line,
+                self.column,
+                self.end_line,
+                self.end_column,
+                self.end_pos,
+                self.filename,
+            ),
+        )
+
     def __repr__(self) -> str:
         return f"{self.value!r}"
 
@@ -81,3 +97,20 @@ def replace_value(self, old: str, new: str, count: int = -1) -> "FileContextToke
             replaced = self.value.replace(old, new, count)
             return FileContextToken(self.update(value=replaced), filename=self.filename)
         return self
+
+
+def _file_context_token(
+    type_: str,
+    value: str,
+    start_pos: int | None,
+    line: int | None,
+    column: int | None,
+    end_line: int | None,
+    end_column: int | None,
+    end_pos: int | None,
+    filename: str,
+) -> FileContextToken:
+    return FileContextToken(
+        Token(type_, value, start_pos, line, column, end_line, end_column, end_pos),
+        filename,
+    )
@@ -1,8 +1,13 @@
 # mypy: ignore-errors
+import contextlib
 import datetime
+import hashlib
+import logging
 import os
 import os.path
-from typing import Self
+import pickle
+import tempfile
+from typing import Any, Self
 
 from lark import Discard, Lark, Token, Transformer, Tree, UnexpectedCharacters
 
@@ -13,6 +18,8 @@
 from .schema_dict import SchemaItemDict
 from .types import Defines, FileContextToken, Instruction, MaybeWithContext
 
+logger = logging.getLogger(__name__)
+
 grammar = r"""
 %import common.CNAME
 %import common.SIGNED_NUMBER    -> NUMBER
@@ -131,6 +138,117 @@ def NEWLINE(_token):
 _parser = Lark(grammar, propagate_positions=True)
 
 
+# Parsed files smaller than this are faster to parse than to read from cache
+_MIN_CACHED_SIZE = 1024
+
+# Change when the parsed tree changes, to invalidate existing cache entries
+_CACHE_VERSION = "2"
+_cache_salt = hashlib.sha256(f"{_CACHE_VERSION}\0{grammar}".encode()).digest()
+
+
+def _parse_cache_dir() -> str | None:
+    """The directory of the parsed config cache, or None if disabled.
+
+    Set by the environment variable ERT_CONFIG_CACHE_DIR, where an empty
+    value disables the cache. Defaults to ert/config in the user cache
+    directory.
+    """
+    cache_dir = os.environ.get("ERT_CONFIG_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "ert",
+            "config",
+        )
+    return cache_dir or None
+
+
+def _cache_path(cache_dir: str, content: str, file: str) -> str:
+    key = hashlib.sha256(_cache_salt)
+    key.update(f"{file}\0{content}".encode(errors="surrogatepass"))
+    return os.path.join(cache_dir, key.hexdigest() + ".pickle")
+
+
+# Cache entries not used for this long are removed
+_MAX_CACHE_AGE = datetime.timedelta(days=30)
+
+# The oldest cache entries are removed when the cache grows beyond this size
+_MAX_CACHE_SIZE = 200 * 1024 * 1024
+
+
+def _is_private(stat: os.stat_result) -> bool:
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _load_from_cache(path: str) -> Any:
+    """Reads a cache entry, or returns None on a cache miss.
+
+    As unpickling can run arbitrary code, entries are only read when both
+    the entry and the cache directory are owned by the user, and not
+    writable by others.
+    """
+    try:
+        if not _is_private(os.stat(os.path.dirname(path))):
+            logger.warning(
+                f"Not using config cache {os.path.dirname(path)}, "
+                "as it is not owned by the user or is writable by others"
+            )
+            return None
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        with open(fd, "rb") as f:
+            if not _is_private(os.fstat(fd)):
+                logger.warning(
+                    f"Not using cache entry {path}, "
+                    "as it is not owned by the user or is writable by others"
+                )
+                return None
+            value = pickle.load(f)
+            # Marks the entry as recently used, see _prune_cache
+            os.utime(fd)
+            return value
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        # A corrupt or outdated entry is a cache miss
+        logger.debug(f"Could not read cache entry {path}: {err}")
+        return None
+
+
+def _prune_cache(cache_dir: str) -> None:
+    """Removes the entries not used within _MAX_CACHE_AGE, and the least
+    recently used entries beyond _MAX_CACHE_SIZE."""
+    oldest = datetime.datetime.now().timestamp() - _MAX_CACHE_AGE.total_seconds()
+    entries = []
+    with os.scandir(cache_dir) as directory:
+        for entry in directory:
+            if entry.name.endswith((".pickle", ".tmp")) and entry.is_file(
+                follow_symlinks=False
+            ):
+                stat = entry.stat(follow_symlinks=False)
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    size = 0
+    for mtime, entry_size, entry_path in sorted(entries, reverse=True):
+        size += entry_size
+        if mtime < oldest or size > _MAX_CACHE_SIZE:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry_path)
+
+
+def _save_to_cache(path: str, value: Any) -> None:
+    cache_dir = os.path.dirname(path)
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            f.write(data)
+        os.replace(f.name, path)
+        _prune_cache(cache_dir)
+    except Exception as err:
+        logger.debug(f"Could not write cache entry {path}: {err}")
+
+
 def _substitute_token(
     defines: Defines,
     token: FileContextToken,
@@ -406,10 +524,21 @@ def _handle_includes(
 
 
 def _parse_contents(content: str, file: str) -> Tree[Instruction]:
+    """Parses the contents of file into a tree of instructions.
+
+    Parsed trees of large files are cached on disk, keyed by the file name
+    and contents. A fresh tree is returned on every call, as the tree is
+    modified when includes and aliases are resolved.
+    """
     file = os.path.normpath(os.path.abspath(file))
+    cache_dir = _parse_cache_dir() if len(content) >= _MIN_CACHED_SIZE else None
+    if cache_dir is not None:
+        cache_path = _cache_path(cache_dir, content, file)
+        if (tree := _load_from_cache(cache_path)) is not None:
+            return tree
     try:
         tree = _parser.parse(content + "\n")
-        return (
+        tree = (
             StringQuotationTransformer()
             * FileContextTransformer(file)
             * ArgumentToStringTransformer()
@@ -432,6 +561,9 @@ def _parse_contents(content: str, file: str) -> Tree[Instruction]:
                 filename=file,
             )
         ) from e
+    if cache_dir is not None:
+        _save_to_cache(cache_path, tree)
+    return tree
 
 
 def read_file(file: str) -> str:
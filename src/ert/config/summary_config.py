@@ -5,6 +5,8 @@
 from datetime import datetime
 from typing import Any, no_type_check
 
+import numpy as np
+
 from ert.substitutions import substitute_runpath_name
 
 from ._read_summary import read_summary
@@ -49,16 +51,14 @@ def read_from_file(self, run_path: str, iens: int, iter: int) -> polars.DataFram
 
         # Important: Pick lowest unit resolution to allow for using
         # datetimes many years into the future
-        time_map_series = polars.Series(time_map).dt.cast_time_unit("ms")
-        df = polars.DataFrame(
+        times = np.array(time_map, dtype="datetime64[ms]")
+        return polars.DataFrame(
             {
-                "response_key": keys,
-                "time": [time_map_series for _ in data],
-                "values": [polars.Series(row, dtype=polars.Float32) for row in data],
+                "response_key": np.repeat(keys, len(times)),
+                "time": np.tile(times, len(keys)),
+                "values": np.asarray(data, dtype=np.float32).ravel(),
             }
         )
-        df = df.explode("values", "time")
-        return df
 
     @property
     def response_type(self) -> str:
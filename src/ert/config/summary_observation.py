@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 
 @dataclass
@@ -14,3 +25,59 @@ class SummaryObservation:
     def __post_init__(self) -> None:
         if self.std <= 0:
             raise ValueError("Observation uncertainty must be strictly > 0")
+
+
+@dataclass(eq=False)
+class SummaryObservationSeries(Mapping[datetime, SummaryObservation]):
+    """Summary observations of one key at many dates, stored column-wise.
+
+    Behaves as a mapping from date to :class:`SummaryObservation`, but
+    the observations are only created when looked up, so that long
+    histories can be turned into observation datasets directly from
+    the observation and std arrays.
+    """
+
+    summary_key: str
+    observation_key: str
+    dates: list[datetime]
+    observations: npt.NDArray[np.double]
+    stds: npt.NDArray[np.double]
+
+    def __post_init__(self) -> None:
+        if np.any(self.stds <= 0):
+            raise ValueError("Observation uncertainty must be strictly > 0")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        _source_type: Any,
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        # Serialized as the equivalent dict of observations
+        as_dict = handler.generate_schema(dict[datetime, SummaryObservation])
+        return core_schema.json_or_python_schema(
+            json_schema=as_dict,
+            python_schema=core_schema.is_instance_schema(cls),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                dict, return_schema=as_dict
+            ),
+        )
+
+    @cached_property
+    def _positions(self) -> dict[datetime, int]:
+        return {date: i for i, date in enumerate(self.dates)}
+
+    def __getitem__(self, date: datetime) -> SummaryObservation:
+        i = self._positions[date]
+        return SummaryObservation(
+            self.summary_key,
+            self.observation_key,
+            float(self.observations[i]),
+            float(self.stds[i]),
+        )
+
+    def __iter__(self) -> Iterator[datetime]:
+        return iter(self.dates)
+
+    def __len__(self) -> int:
+        return len(self.dates)
@@ -6,7 +6,6 @@
 
 import numpy as np
 import xarray as xr
-import xtgeo
 
 from ert.substitutions import substitute_runpath_name
 
@@ -34,6 +33,7 @@ class SurfaceConfig(ParameterConfig):
     forward_init_file: str
     output_file: Path
     base_surface_path: str
+    memory_map: bool = False
 
     @classmethod
     def from_config_list(cls, surface: list[str]) -> Self:
@@ -44,6 +44,7 @@ def from_config_list(cls, surface: list[str]) -> Self:
         base_surface = options.get("BASE_SURFACE")
         forward_init = str_to_bool(options.get("FORWARD_INIT", "FALSE"))
         update_parameter = str_to_bool(options.get("UPDATE", "TRUE"))
+        memory_map = str_to_bool(options.get("MEMORY_MAP", "FALSE"))
         errors = []
         if not out_file:
             errors.append(
@@ -70,6 +71,9 @@ def from_config_list(cls, surface: list[str]) -> Self:
         assert init_file is not None
         assert out_file is not None
         assert base_surface is not None
+        # xtgeo takes long to import, so it is only imported when used
+        import xtgeo  # noqa: PLC0415
+
         try:
             surf = xtgeo.surface_from_file(
                 base_surface, fformat="irap_ascii", dtype=np.float32
@@ -93,6 +97,7 @@ def from_config_list(cls, surface: list[str]) -> Self:
             output_file=Path(out_file),
             base_surface_path=base_surface,
             update=update_parameter,
+            memory_map=memory_map,
         )
 
     def __len__(self) -> int:
@@ -101,6 +106,8 @@ def __len__(self) -> int:
     def read_from_runpath(
         self, run_path: Path, real_nr: int, iteration: int
     ) -> xr.Dataset:
+        import xtgeo  # noqa: PLC0415
+
         file_name = substitute_runpath_name(self.forward_init_file, real_nr, iteration)
         file_path = run_path / file_name
         if not file_path.exists():
@@ -124,7 +131,9 @@ def read_from_runpath(
     def write_to_runpath(
         self, run_path: Path, real_nr: int, ensemble: Ensemble
     ) -> None:
-        data = ensemble.load_parameters(self.name, real_nr)["values"]
+        import xtgeo  # noqa: PLC0415
+
+        data = ensemble.load_parameter_values(self.name, real_nr)
 
         surf = xtgeo.RegularSurface(
             ncol=self.ncol,
@@ -135,7 +144,7 @@ def write_to_runpath(
             yinc=self.yinc,
             rotation=self.rotation,
             yflip=self.yflip,
-            values=data.values,
+            values=np.array(data),
         )
 
         file_path = run_path / substitute_runpath_name(
@@ -165,6 +174,10 @@ def save_parameters(
     def load_parameters(
         ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        return ds["values"].values.reshape(ensemble_size, -1).T
+        return np.stack(
+            [
+                ensemble.load_parameter_values(group, int(real)).reshape(-1)
+                for real in realizations
+            ],
+            axis=1,
+        )
@@ -1,7 +1,7 @@
 import contextlib
 import logging
 from collections.abc import Callable, Iterator
-from typing import Any
+from typing import Any, NamedTuple
 from uuid import UUID
 
 import numpy as np
@@ -16,9 +16,15 @@
 
 logger = logging.getLogger(__name__)
 
-response_key_to_displayed_key: dict[str, Callable[[tuple[Any, ...]], str]] = {
-    "summary": lambda t: t[0],
-    "gen_data": lambda t: f"{t[0]}@{t[1]}",
+# Expressions giving the displayed key of each row in the observation
+# dataset of the response type
+response_key_to_displayed_key: dict[str, polars.Expr] = {
+    "summary": polars.col("response_key"),
+    "gen_data": polars.concat_str(
+        polars.col("response_key"),
+        polars.lit("@"),
+        polars.col("report_step").cast(polars.String),
+    ),
 }
 
 
@@ -43,9 +49,12 @@ def _parse_gendata_response_key(display_key: str) -> tuple[Any, ...]:
 
 
 def ensemble_parameters(storage: Storage, ensemble_id: UUID) -> list[dict[str, Any]]:
+    return experiment_parameters(storage.get_ensemble(ensemble_id).experiment)
+
+
+def experiment_parameters(experiment: Experiment) -> list[dict[str, Any]]:
     param_list = []
-    ensemble = storage.get_ensemble(ensemble_id)
-    for config in ensemble.experiment.parameter_configuration.values():
+    for config in experiment.parameter_configuration.values():
         match config:
             case GenKwConfig(name=name, transform_functions=transform_functions):
                 for tf in transform_functions:
@@ -86,7 +95,11 @@ def get_response_names(ensemble: Ensemble) -> list[str]:
 
 
 def gen_data_display_keys(ensemble: Ensemble) -> Iterator[str]:
-    gen_data_config = ensemble.experiment.response_configuration.get("gen_data")
+    yield from _gen_data_display_keys(ensemble.experiment)
+
+
+def _gen_data_display_keys(experiment: Experiment) -> Iterator[str]:
+    gen_data_config = experiment.response_configuration.get("gen_data")
 
     if gen_data_config:
         assert isinstance(gen_data_config, GenDataConfig)
@@ -100,6 +113,118 @@ def gen_data_display_keys(ensemble: Ensemble) -> Iterator[str]:
                     yield f"{key}@{report_step}"
 
 
+def response_names_with_observations(experiment: Experiment) -> set[str]:
+    """Returns the displayed keys of all responses in the experiment which
+    have at least one observation"""
+    response_configuration = experiment.response_configuration
+    names: set[str] = set()
+    for response_type, obs_ds in experiment.observations.items():
+        if (
+            response_type not in response_configuration
+            or response_type not in response_key_to_displayed_key
+        ):
+            continue
+        names.update(
+            obs_ds.select(response_key_to_displayed_key[response_type].alias("key"))
+            .unique()
+            .to_series()
+            .to_list()
+        )
+    return names
+
+
+def experiment_responses(experiment: Experiment) -> dict[str, dict[str, Any]]:
+    """Returns the displayed response keys of the experiment, with the origin
+    of the data and whether there are observations for it"""
+    with_observations = response_names_with_observations(experiment)
+    responses: dict[str, dict[str, Any]] = {}
+    for name in experiment.response_type_to_response_keys.get("summary", []):
+        responses[str(name)] = {
+            "name": name,
+            "userdata": {"data_origin": "Summary"},
+            "has_observations": name in with_observations,
+        }
+
+    if "gen_data" in experiment.response_type_to_response_keys:
+        for name in _gen_data_display_keys(experiment):
+            responses[str(name)] = {
+                "name": name,
+                "userdata": {"data_origin": "GEN_DATA"},
+                "has_observations": name in with_observations,
+            }
+    return responses
+
+
+class _ExperimentKeyCatalog(NamedTuple):
+    stamp: tuple[int, ...]
+    responses: list[dict[str, Any]]
+    parameters: list[dict[str, Any]]
+
+
+_key_catalog_cache: dict[UUID, _ExperimentKeyCatalog] = {}
+
+
+def _experiment_key_catalog(experiment: Experiment) -> _ExperimentKeyCatalog:
+    """The keys of an experiment only change when the response configuration
+    is finalized by the first loaded realization, so the catalog is cached per
+    experiment and invalidated by the modification time of its configuration"""
+    stamp = tuple(
+        (experiment.mount_point / filename).stat().st_mtime_ns
+        for filename in (
+            experiment._responses_file,
+            experiment._parameter_file,
+        )
+    )
+    cached = _key_catalog_cache.get(experiment.id)
+    if cached is not None and cached.stamp == stamp:
+        return cached
+
+    responses = [
+        {**response, "dimensionality": 2, "index_type": "VALUE"}
+        for response in experiment_responses(experiment).values()
+    ]
+    parameters = [
+        {
+            "name": parameter["name"],
+            "userdata": parameter["userdata"],
+            "has_observations": False,
+            "dimensionality": parameter["dimensionality"],
+            "index_type": None,
+        }
+        for parameter in experiment_parameters(experiment)
+    ]
+    catalog = _ExperimentKeyCatalog(stamp, responses, parameters)
+    _key_catalog_cache[experiment.id] = catalog
+    return catalog
+
+
+def key_catalog(storage: Storage) -> list[dict[str, Any]]:
+    """Returns the definitions of all response and parameter keys in the
+    storage. Responses are only listed for experiments where at least one
+    ensemble has data, and a key is marked as having observations if it has
+    observations in any experiment."""
+    all_keys: dict[str, dict[str, Any]] = {}
+    for experiment in storage.experiments:
+        ensembles = list(experiment.ensembles)
+        if not ensembles:
+            continue
+
+        catalog = _experiment_key_catalog(experiment)
+        if any(ensemble.has_data() for ensemble in ensembles):
+            for response in catalog.responses:
+                previous = all_keys.get(response["name"])
+                all_keys[response["name"]] = {
+                    **response,
+                    "has_observations": response["has_observations"]
+                    or bool(previous and previous["has_observations"]),
+                }
+
+        for parameter in catalog.parameters:
+            all_keys[parameter["name"]] = parameter
+
+    return list(all_keys.values())
+
+
 def data_for_key(
     ensemble: Ensemble,
     key: str,
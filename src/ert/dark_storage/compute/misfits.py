@@ -1,38 +1,36 @@
-from collections.abc import Mapping
+from datetime import datetime
 
 import numpy as np
-import numpy.typing as npt
 import pandas as pd
+import polars
+from dateutil.parser import parse
 
 
-def _calculate_misfit(
-    obs_value: npt.NDArray[np.float64],
-    response_value: npt.NDArray[np.float64],
-    obs_std: npt.NDArray[np.float64],
-) -> list[float]:
-    difference = response_value - obs_value
-    misfit = (difference / obs_std) ** 2
-    return (misfit * np.sign(difference)).tolist()
+def _parse_index(index: str) -> int | datetime:
+    # The index joins the primary key columns of the response, and the
+    # last of them is the x-axis value
+    x = index.split(", ")[-1]
+    try:
+        return int(x)
+    except ValueError:
+        return parse(x)
 
 
-def calculate_misfits_from_pandas(
-    reponses_dict: Mapping[int, pd.DataFrame],
-    observation: pd.DataFrame,
+def misfits_to_pandas(
+    misfits: polars.DataFrame,
+    realizations: list[int],
     summary_misfits: bool = False,
 ) -> pd.DataFrame:
     """
-    Compute misfits from reponses_dict (real_id, values in dataframe)
-    and observation
+    Convert misfits with one row per observation and one column per
+    realization to a dataframe with realizations as rows and the observation
+    x-axis as columns
     """
-    misfits_dict = {}
-    for realization_index in reponses_dict:
-        misfits_dict[realization_index] = _calculate_misfit(
-            observation["values"],
-            reponses_dict[realization_index].loc[:, observation.index].values.flatten(),
-            observation["errors"],
-        )
-
-    df = pd.DataFrame(data=misfits_dict, index=observation.index)
+    df = pd.DataFrame(
+        data=misfits.select([str(real) for real in realizations]).to_numpy().T,
+        index=realizations,
+        columns=[_parse_index(x) for x in misfits["index"]],
+    ).sort_index(axis=1, kind="stable")
     if summary_misfits:
-        df = pd.DataFrame([df.abs().sum(axis=0)], columns=df.columns, index=[0])
-    return df.T
+        df = pd.DataFrame({0: np.abs(df).sum(axis=1)})
+    return df
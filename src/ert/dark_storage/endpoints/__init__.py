@@ -3,6 +3,7 @@
 from .compute.misfits import router as misfits_router
 from .ensembles import router as ensembles_router
 from .experiments import router as experiments_router
+from .keys import router as keys_router
 from .observations import router as observations_router
 from .records import router as records_router
 from .updates import router as updates_router
@@ -10,6 +11,7 @@
 router = APIRouter()
 router.include_router(experiments_router)
 router.include_router(ensembles_router)
+router.include_router(keys_router)
 router.include_router(records_router)
 router.include_router(observations_router)
 router.include_router(updates_router)
@@ -1,20 +1,14 @@
-from datetime import datetime
-from typing import Any
 from uuid import UUID
 
-import pandas as pd
-from dateutil.parser import parse
+import numpy as np
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import Response
 
 from ert.dark_storage import exceptions as exc
-from ert.dark_storage.common import (
-    data_for_key,
-    get_observation_keys_for_response,
-    get_observations_for_obs_keys,
-)
-from ert.dark_storage.compute.misfits import calculate_misfits_from_pandas
+from ert.dark_storage.common import get_observation_keys_for_response
+from ert.dark_storage.compute.misfits import misfits_to_pandas
 from ert.dark_storage.enkf import get_storage
+from ert.data import calculate_misfits
 from ert.storage import Storage
 
 router = APIRouter(tags=["misfits"])
@@ -38,38 +32,21 @@ async def get_response_misfits(
     summary_misfits: bool = False,
 ) -> Response:
     ensemble = storage.get_ensemble(ensemble_id)
-    dataframe = data_for_key(ensemble, response_name)
-    if realization_index is not None:
-        dataframe = pd.DataFrame(dataframe.loc[realization_index]).T
-
-    response_dict = {}
-    for index, data in dataframe.iterrows():
-        data_df = pd.DataFrame(data).T
-        response_dict[index] = data_df
-
     obs_keys = get_observation_keys_for_response(ensemble, response_name)
-    obs = get_observations_for_obs_keys(ensemble, obs_keys)
-
     if not obs_keys:
         raise ValueError(f"No observations for key {response_name}")
-    if not obs:
-        raise ValueError(f"Cant fetch observations for key {response_name}")
-    o = obs[0]
-
-    def parse_index(x: Any) -> int | datetime:
-        try:
-            return int(x)
-        except ValueError:
-            return parse(x)
 
-    observation_df = pd.DataFrame(
-        data={"values": o["values"], "errors": o["errors"]},
-        index=[parse_index(x) for x in o["x_axis"]],
+    realizations = (
+        [realization_index]
+        if realization_index is not None
+        else ensemble.get_realization_list_with_responses()
     )
     try:
-        result_df = calculate_misfits_from_pandas(
-            response_dict, observation_df, summary_misfits
+        misfits = calculate_misfits(
+            ensemble.get_observations_and_responses(obs_keys, np.array(realizations)),
+            signed=True,
         )
+        result_df = misfits_to_pandas(misfits, realizations, summary_misfits)
     except Exception as misfits_exc:
         raise exc.UnprocessableError(
             f"Unable to compute misfits: {misfits_exc}"
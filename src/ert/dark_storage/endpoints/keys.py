@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from ert.dark_storage import json_schema as js
+from ert.dark_storage.common import key_catalog
+from ert.dark_storage.enkf import get_storage
+from ert.storage import Storage
+
+router = APIRouter(tags=["keys"])
+
+DEFAULT_STORAGE = Depends(get_storage)
+
+
+@router.get("/keys", response_model=list[js.KeyOut])
+def get_keys(
+    *,
+    storage: Storage = DEFAULT_STORAGE,
+) -> list[js.KeyOut]:
+    return [js.KeyOut(**key) for key in key_catalog(storage)]
@@ -1,21 +1,22 @@
 import io
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Annotated, Any
 from urllib.parse import unquote
 from uuid import UUID, uuid4
 
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from ert.dark_storage import json_schema as js
 from ert.dark_storage.common import (
     data_for_key,
     ensemble_parameters,
-    gen_data_display_keys,
+    experiment_responses,
     get_observation_keys_for_response,
     get_observations_for_obs_keys,
-    response_key_to_displayed_key,
 )
 from ert.dark_storage.enkf import get_storage
 from ert.storage import Storage
@@ -27,6 +28,22 @@
 DEFAULT_FILE = File(...)
 DEFAULT_HEADER = Header("application/json")
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+# Marks the end of an arrow IPC stream, see
+# https://arrow.apache.org/docs/format/Columnar.html#ipc-streaming-format
+_ARROW_END_OF_STREAM = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+_ARROW_BATCH_SIZE = 64
+
+
+def _arrow_ipc_stream(dataframe: pd.DataFrame) -> Iterator[bytes | memoryview]:
+    """Serializes the dataframe as an arrow IPC stream, one message at a time,
+    without first writing the whole stream to an in-memory buffer"""
+    table = pa.Table.from_pandas(dataframe)
+    yield memoryview(table.schema.serialize())
+    for batch in table.to_batches(max_chunksize=_ARROW_BATCH_SIZE):
+        yield memoryview(batch.serialize())
+    yield _ARROW_END_OF_STREAM
+
 
 @router.get("/ensembles/{ensemble_id}/records/{response_name}/observations")
 async def get_record_observations(
@@ -65,6 +82,7 @@ async def get_record_observations(
                 "application/json": {},
                 "text/csv": {},
                 "application/x-parquet": {},
+                ARROW_STREAM_MEDIA_TYPE: {},
             }
         },
         status.HTTP_401_UNAUTHORIZED: {
@@ -87,7 +105,12 @@ async def get_ensemble_record(
     except PermissionError as e:
         raise HTTPException(status_code=401, detail=str(e)) from e
     media_type = accept if accept is not None else "text/csv"
-    if media_type == "application/x-parquet":
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        dataframe.columns = [str(s) for s in dataframe.columns]
+        return StreamingResponse(
+            _arrow_ipc_stream(dataframe), media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+    elif media_type == "application/x-parquet":
         dataframe.columns = [str(s) for s in dataframe.columns]
         stream = io.BytesIO()
         dataframe.to_parquet(stream)
@@ -119,49 +142,15 @@ def get_ensemble_responses(
     storage: Storage = DEFAULT_STORAGE,
     ensemble_id: UUID,
 ) -> Mapping[str, js.RecordOut]:
-    response_map: dict[str, js.RecordOut] = {}
     ensemble = storage.get_ensemble(ensemble_id)
 
-    response_names_with_observations = set()
-    observations = ensemble.experiment.observations
-
     if len(ensemble.has_data()) == 0:
         return {}
 
-    for (
-        response_type,
-        response_config,
-    ) in ensemble.experiment.response_configuration.items():
-        if response_type in observations:
-            obs_ds = observations[response_type]
-            display_key_fn = response_key_to_displayed_key[response_type]
-            obs_with_responses = (
-                obs_ds.select(["response_key", *response_config.primary_key])
-                .map_rows(display_key_fn)
-                .unique()
-                .to_series()
-                .to_list()
-            )
-            response_names_with_observations.update(set(obs_with_responses))
-
-    for name in ensemble.experiment.response_type_to_response_keys.get("summary", []):
-        response_map[str(name)] = js.RecordOut(
-            id=UUID(int=0),
-            name=name,
-            userdata={"data_origin": "Summary"},
-            has_observations=name in response_names_with_observations,
-        )
-
-    if "gen_data" in ensemble.experiment.response_type_to_response_keys:
-        for name in gen_data_display_keys(ensemble):
-            response_map[str(name)] = js.RecordOut(
-                id=UUID(int=0),
-                name=name,
-                userdata={"data_origin": "GEN_DATA"},
-                has_observations=name in response_names_with_observations,
-            )
-
-    return response_map
+    return {
+        name: js.RecordOut(id=UUID(int=0), **response)
+        for name, response in experiment_responses(ensemble.experiment).items()
+    }
 
 
 @router.get("/ensembles/{ensemble_id}/records/{key}/std_dev")
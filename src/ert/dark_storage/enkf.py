@@ -23,5 +23,5 @@ def get_storage() -> Storage:
             return (_storage := open_storage(os.environ["ERT_STORAGE_ENS_PATH"]))
         except RuntimeError as err:
             raise InternalServerError(f"{err!s}") from err
-    _storage.refresh()
+    _storage.refresh_if_changed()
     return _storage
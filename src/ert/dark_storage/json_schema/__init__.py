@@ -7,5 +7,5 @@
     ObservationTransformationOut,
 )
 from .prior import Prior
-from .record import RecordOut
+from .record import KeyOut, RecordOut
 from .update import UpdateIn, UpdateOut
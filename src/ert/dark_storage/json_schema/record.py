@@ -17,3 +17,12 @@ class RecordOut(_Record):
     name: str
     userdata: Mapping[str, Any]
     has_observations: bool | None
+
+
+@dataclass(config=ConfigDict(from_attributes=True))
+class KeyOut:
+    name: str
+    userdata: Mapping[str, Any]
+    dimensionality: int
+    has_observations: bool
+    index_type: str | None
@@ -1,3 +1,4 @@
 from ._measured_data import MeasuredData
+from ._misfits import calculate_misfits, load_misfits
 
-__all__ = ["MeasuredData"]
+__all__ = ["MeasuredData", "calculate_misfits", "load_misfits"]
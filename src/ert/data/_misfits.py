@@ -0,0 +1,109 @@
+"""
+Misfits between observations and simulated responses.
+
+The misfits are computed directly on the observation/response matrix
+returned by :meth:`LocalEnsemble.get_observations_and_responses`, where
+every row is an observation and every realization is a column. All
+realizations are handled with one columnar expression, and misfits are
+summed per observation key with a single group-by.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars
+
+if TYPE_CHECKING:
+    from ert.storage import Ensemble
+
+_OBSERVATION_COLUMNS = (
+    "response_key",
+    "index",
+    "observation_key",
+    "observations",
+    "std",
+)
+
+
+def _realization_columns(observations_and_responses: polars.DataFrame) -> list[str]:
+    return [
+        column
+        for column in observations_and_responses.columns
+        if column not in _OBSERVATION_COLUMNS
+    ]
+
+
+def calculate_misfits(
+    observations_and_responses: polars.DataFrame, signed: bool = False
+) -> polars.DataFrame:
+    """Replaces every realization column with the misfit of its responses.
+
+    The misfit is ((response - observation) / std) ** 2. If signed is True,
+    the misfit is given the sign of response - observation.
+    """
+    realizations = _realization_columns(observations_and_responses)
+    difference = polars.col(realizations) - polars.col("observations")
+    misfit = (difference / polars.col("std")) ** 2
+    if signed:
+        misfit *= difference.sign()
+    return observations_and_responses.with_columns(misfit)
+
+
+def load_misfits(
+    ensemble: Ensemble,
+    observation_keys: Iterable[str] | None = None,
+    realizations: Iterable[int] | None = None,
+) -> polars.DataFrame:
+    """Loads the misfit per observation key and realization of an ensemble.
+
+    Responses missing for an observation do not contribute to the misfit.
+
+    Parameters:
+        ensemble: The ensemble to compute misfits for.
+        observation_keys: Observations to include, defaults to all
+            observations of the experiment.
+        realizations: Realizations to include, defaults to all realizations
+            with responses.
+
+    Returns:
+        DataFrame: One row per realization, with a "realization" column,
+            a "MISFIT:<observation_key>" column per observation key, sorted
+            by key, and a "MISFIT:TOTAL" column. The frame is empty if there
+            are no observations or no realizations with responses.
+    """
+    keys = sorted(
+        ensemble.experiment.observation_keys
+        if observation_keys is None
+        else observation_keys
+    )
+    reals = (
+        ensemble.get_realization_list_with_responses()
+        if realizations is None
+        else sorted(realizations)
+    )
+    if not keys or not reals:
+        return polars.DataFrame()
+
+    misfits = calculate_misfits(
+        ensemble.get_observations_and_responses(keys, np.array(reals))
+    )
+    realization_columns = _realization_columns(misfits)
+    per_key = (
+        misfits.group_by("observation_key")
+        .agg(polars.col(realization_columns).fill_nan(None).sum())
+        .sort("observation_key")
+    )
+    matrix = per_key.select(realization_columns).to_numpy().T
+    return polars.DataFrame(
+        {
+            "realization": [int(real) for real in realization_columns],
+            **{
+                f"MISFIT:{key}": matrix[:, i]
+                for i, key in enumerate(per_key["observation_key"])
+            },
+            "MISFIT:TOTAL": matrix.sum(axis=1),
+        }
+    )
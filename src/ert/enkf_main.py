@@ -14,7 +14,7 @@
 import xarray as xr
 from numpy.random import SeedSequence
 
-from ert.config.ert_config import create_forward_model_json
+from ert.config.ert_config import forward_model_json_renderer
 from ert.config.forward_model_step import ForwardModelStep
 from ert.config.model_config import ModelConfig
 from ert.substitutions import Substitutions, substitute_runpath_name
@@ -232,6 +232,13 @@ def create_run_path(
         context_env = {}
     t = time.perf_counter()
     runpaths.set_ert_ensemble(ensemble.name)
+    render_forward_model_json = forward_model_json_renderer(
+        context=substitutions,
+        forward_model_steps=forward_model_steps,
+        user_config_file=user_config_file,
+        env_vars={**env_vars, **context_env},
+        env_pr_fm_step=env_pr_fm_step,
+    )
     for run_arg in run_args:
         run_path = Path(run_arg.runpath)
         if run_arg.active:
@@ -272,15 +279,8 @@ def create_run_path(
             path = run_path / "jobs.json"
             _backup_if_existing(path)
 
-            forward_model_output: dict[str, Any] = create_forward_model_json(
-                context=substitutions,
-                forward_model_steps=forward_model_steps,
-                user_config_file=user_config_file,
-                env_vars={**env_vars, **context_env},
-                env_pr_fm_step=env_pr_fm_step,
-                run_id=run_arg.run_id,
-                iens=run_arg.iens,
-                itr=ensemble.iteration,
+            forward_model_output: dict[str, Any] = render_forward_model_json(
+                run_arg.run_id, run_arg.iens, ensemble.iteration
             )
             with open(run_path / "jobs.json", mode="wb") as fptr:
                 fptr.write(
@@ -20,7 +20,7 @@
 from _ert.forward_model_runner.client import Client
 from ert.config import ForwardModelStep, QueueConfig
 from ert.run_arg import RunArg
-from ert.scheduler import Scheduler, create_driver
+from ert.scheduler import Driver, Scheduler, create_driver
 
 from .config import EvaluatorServerConfig
 from .snapshot import EnsembleSnapshot, FMStepSnapshot, RealizationSnapshot
@@ -210,6 +210,7 @@ async def evaluate(
         config: EvaluatorServerConfig,
         scheduler_queue: asyncio.Queue[Event] | None = None,
         manifest_queue: asyncio.Queue[Event] | None = None,
+        driver: Driver | None = None,
     ) -> None:
         self._config = config
         ce_unary_send_method_name = "_ce_unary_send"
@@ -227,6 +228,7 @@ async def evaluate(
                 event_unary_send=getattr(self, ce_unary_send_method_name),
                 scheduler_queue=scheduler_queue,
                 manifest_queue=manifest_queue,
+                driver=driver,
             )
         except asyncio.CancelledError:
             print("Cancelling evaluator task!")
@@ -236,6 +238,7 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
         event_unary_send: Callable[[Event], Awaitable[None]],
         scheduler_queue: asyncio.Queue[Event] | None = None,
         manifest_queue: asyncio.Queue[Event] | None = None,
+        driver: Driver | None = None,
     ) -> None:
         """
         This (inner) coroutine does the actual work of evaluating the ensemble. It
@@ -248,6 +251,9 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
         event_unary_send determines how Events are dispatched. This
         is a function (or bound method) that only takes an Event as a positional
         argument.
+
+        If a driver is given, it is assumed to be polled by the caller, so
+        that it can be reused for several ensembles.
         """
         event_creator = self.generate_event_creator()
 
@@ -257,9 +263,8 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
             raise ValueError("no config")  # mypy
 
         try:
-            driver = create_driver(self._queue_config.queue_options)
             self._scheduler = Scheduler(
-                driver,
+                driver or create_driver(self._queue_config.queue_options),
                 self.active_reals,
                 manifest_queue,
                 scheduler_queue,
@@ -269,6 +274,7 @@ async def _evaluate_inner(  # pylint: disable=too-many-branches
                 ens_id=self.id_,
                 ee_uri=self._config.get_connection_info().router_uri,
                 ee_token=self._config.token,
+                poll_driver=driver is None,
             )
             logger.info(
                 f"Experiment ran on ORCHESTRATOR: scheduler on {self._queue_config.queue_system} queue"
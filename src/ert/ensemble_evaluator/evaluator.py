@@ -29,6 +29,7 @@
 )
 from _ert.forward_model_runner.client import ACK_MSG, CONNECT_MSG, DISCONNECT_MSG
 from ert.ensemble_evaluator import identifiers as ids
+from ert.scheduler import Driver
 
 from ._ensemble import FMStepSnapshot
 from ._ensemble import LegacyEnsemble as Ensemble
@@ -66,6 +67,7 @@ def __init__(self, ensemble: Ensemble, config: EvaluatorServerConfig):
         self._max_batch_size: int = 500
         self._batching_interval: float = 2.0
         self._complete_batch: asyncio.Event = asyncio.Event()
+        self._ensemble_finished: asyncio.Event = asyncio.Event()
         self._server_started: asyncio.Event = asyncio.Event()
         self._clients_connected: set[bytes] = set()
         self._clients_empty: asyncio.Event = asyncio.Event()
@@ -73,6 +75,7 @@ def __init__(self, ensemble: Ensemble, config: EvaluatorServerConfig):
         self._dispatchers_connected: set[bytes] = set()
         self._dispatchers_empty: asyncio.Event = asyncio.Event()
         self._dispatchers_empty.set()
+        self._driver: Driver | None = None
 
     async def _publisher(self) -> None:
         await self._server_started.wait()
@@ -102,6 +105,12 @@ async def _process_event_buffer(self) -> None:
             batch_start_time = asyncio.get_running_loop().time()
             for func, events in function_to_events_map.items():
                 await func(events)
+            if self._ensemble.status in {
+                ENSEMBLE_STATE_STOPPED,
+                ENSEMBLE_STATE_FAILED,
+                ENSEMBLE_STATE_CANCELLED,
+            }:
+                self._ensemble_finished.set()
             processing_time = asyncio.get_running_loop().time() - batch_start_time
             if processing_time > 0.01:
                 logger.info(
@@ -139,6 +148,14 @@ def set_event_handler(event_types: set[type[Event]], func: Any) -> None:
                     self._events.task_done()
                 except TimeoutError:
                     continue
+                if type(event) in {
+                    EnsembleSucceeded,
+                    EnsembleCancelled,
+                    EnsembleFailed,
+                }:
+                    # Nothing more is expected for the ensemble, so there is
+                    # no need to wait for the rest of the batching interval
+                    break
             self._complete_batch.set()
             await self._batch_processing_queue.put(batch)
             if self._events.qsize() > 0:
@@ -339,7 +356,7 @@ def _signal_cancel(self) -> None:
             logger.debug("Stopping current ensemble")
             self.stop()
 
-    async def _start_running(self) -> None:
+    async def _start_server(self) -> None:
         if not self._config:
             raise ValueError("no config for evaluator")
         self._loop = asyncio.get_running_loop()
@@ -354,6 +371,9 @@ async def _start_running(self) -> None:
         ]
 
         await self._server_started.wait()
+
+    async def _start_running(self) -> None:
+        await self._start_server()
         self._ee_tasks.append(
             asyncio.create_task(
                 self._ensemble.evaluate(
@@ -409,28 +429,84 @@ def log_exception(task_exception: BaseException, task_name: str) -> None:
             f"Traceback: {exc_traceback}"
         )
 
+    async def _cancel_tasks(self) -> None:
+        self._server_done.set()
+        self._clients_empty.set()
+        self._dispatchers_empty.set()
+        for task in self._ee_tasks:
+            if not task.done():
+                task.cancel()
+        results = await asyncio.gather(*self._ee_tasks, return_exceptions=True)
+        for result in results or []:
+            if not isinstance(result, asyncio.CancelledError) and isinstance(
+                result, Exception
+            ):
+                logger.error(str(result))
+                raise RuntimeError(result) from result
+
     async def run_and_get_successful_realizations(self) -> list[int]:
         await self._start_running()
 
         try:
             await self._monitor_and_handle_tasks()
         finally:
-            self._server_done.set()
-            self._clients_empty.set()
-            self._dispatchers_empty.set()
-            for task in self._ee_tasks:
-                if not task.done():
-                    task.cancel()
-            results = await asyncio.gather(*self._ee_tasks, return_exceptions=True)
-            for result in results or []:
-                if not isinstance(result, asyncio.CancelledError) and isinstance(
-                    result, Exception
-                ):
-                    logger.error(str(result))
-                    raise RuntimeError(result) from result
+            await self._cancel_tasks()
         logger.debug("Evaluator is done")
         return self._ensemble.get_successful_realizations()
 
+    async def start_session(self, driver: Driver) -> None:
+        """
+        Starts the server and the polling of the driver without evaluating
+        any ensemble. Ensembles are then evaluated one after another with
+        evaluate_ensemble, reusing the server and the driver, until
+        stop_session is called.
+        """
+        self._driver = driver
+        await self._start_server()
+        self._ee_tasks.append(asyncio.create_task(driver.poll(), name="poll_task"))
+
+    async def evaluate_ensemble(self, ensemble: Ensemble) -> list[int]:
+        """
+        Evaluates an ensemble in a session started with start_session, and
+        returns when all events from the ensemble have been published.
+        """
+        assert self._driver is not None
+        self._ensemble = ensemble
+        self._ensemble_finished.clear()
+        ensemble_task = asyncio.create_task(
+            ensemble.evaluate(
+                self._config, self._events, self._manifest_queue, self._driver
+            ),
+            name="ensemble_task",
+        )
+        pending: Iterable[asyncio.Task[None]] = [ensemble_task, *self._ee_tasks]
+        try:
+            while not ensemble_task.done():
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task_exception := task.exception():
+                        self.log_exception(task_exception, task.get_name())
+                        raise task_exception
+            await self._ensemble_finished.wait()
+            await self._batch_processing_queue.join()
+            await self._events_to_send.join()
+        finally:
+            if not ensemble_task.done():
+                ensemble_task.cancel()
+        return ensemble.get_successful_realizations()
+
+    async def stop_session(self) -> None:
+        self.stop()
+        try:
+            await next(
+                task for task in self._ee_tasks if task.get_name() == "server_task"
+            )
+        finally:
+            await self._cancel_tasks()
+        logger.debug("Evaluator session is done")
+
     @staticmethod
     def _get_ens_id(source: str) -> str:
         # the ens_id will be found at /ert/ensemble/ens_id/...
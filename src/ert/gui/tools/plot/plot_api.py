@@ -10,6 +10,7 @@
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
 from pandas.errors import ParserError
 
 from ert.services import StorageService
@@ -101,56 +102,21 @@ def all_data_type_keys(self) -> list[PlotApiKeyDefinition]:
         For each key a dict is returned with info about
         the key"""
 
-        all_keys: dict[str, PlotApiKeyDefinition] = {}
-
         with StorageService.session() as client:
-            response = client.get("/experiments", timeout=self._timeout)
+            response = client.get("/keys", timeout=self._timeout)
             self._check_response(response)
 
-            for experiment in response.json():
-                response = client.get(
-                    f"/experiments/{experiment['id']}/ensembles", timeout=self._timeout
+            return [
+                PlotApiKeyDefinition(
+                    key=key["name"],
+                    index_type=key["index_type"],
+                    observations=key["has_observations"],
+                    dimensionality=key["dimensionality"],
+                    metadata=key["userdata"],
+                    log_scale=key["name"].startswith("LOG10_"),
                 )
-                self._check_response(response)
-
-                for ensemble in response.json():
-                    response = client.get(
-                        f"/ensembles/{ensemble['id']}/responses", timeout=self._timeout
-                    )
-                    self._check_response(response)
-                    for key, value in response.json().items():
-                        assert isinstance(key, str)
-
-                        has_observation = value["has_observations"]
-                        k = all_keys.get(key)
-                        if k and k.observations:
-                            has_observation = True
-
-                        all_keys[key] = PlotApiKeyDefinition(
-                            key=key,
-                            index_type="VALUE",
-                            observations=has_observation,
-                            dimensionality=2,
-                            metadata=value["userdata"],
-                            log_scale=key.startswith("LOG10_"),
-                        )
-
-                    response = client.get(
-                        f"/ensembles/{ensemble['id']}/parameters", timeout=self._timeout
-                    )
-                    self._check_response(response)
-                    for e in response.json():
-                        key = e["name"]
-                        all_keys[key] = PlotApiKeyDefinition(
-                            key=key,
-                            index_type=None,
-                            observations=False,
-                            dimensionality=e["dimensionality"],
-                            metadata=e["userdata"],
-                            log_scale=key.startswith("LOG10_"),
-                        )
-
-        return list(all_keys.values())
+                for key in response.json()
+            ]
 
     def data_for_key(self, ensemble_id: str, key: str) -> pd.DataFrame:
         """Returns a pandas DataFrame with the datapoints for a given key for a given
@@ -167,13 +133,12 @@ def data_for_key(self, ensemble_id: str, key: str) -> pd.DataFrame:
         with StorageService.session() as client:
             response = client.get(
                 f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}",
-                headers={"accept": "application/x-parquet"},
+                headers={"accept": "application/vnd.apache.arrow.stream"},
                 timeout=self._timeout,
             )
             self._check_response(response)
 
-            stream = io.BytesIO(response.content)
-            df = pd.read_parquet(stream)
+            df = pa.ipc.open_stream(pa.py_buffer(response.content)).read_pandas()
 
             try:
                 df.columns = pd.to_datetime(df.columns, format="%Y-%m-%d %H:%M:%S")
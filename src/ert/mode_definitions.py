@@ -7,6 +7,8 @@
 EVALUATE_ENSEMBLE_MODE = "evaluate_ensemble"
 MANUAL_UPDATE_MODE = "manual_update"
 
+ES_MDA_DEFAULT_WEIGHTS = "4, 2, 1"
+
 MODULE_MODE = {
     "EnsembleSmoother": ENSEMBLE_SMOOTHER_MODE,
     "EnsembleExperiment": ENSEMBLE_EXPERIMENT_MODE,
@@ -4,6 +4,7 @@
 import os.path
 import re
 import socket
+import struct
 import subprocess
 import sys
 import time
@@ -57,6 +58,79 @@ def failed_due_to_license_problems(self) -> bool:
 slave_run_paths = r"^\s@\s+STARTING SLAVE\s+[^ ]+RUNNING \([^ ]\)\s*$"
 slave_run_paths = r"\s@\s+STARTING SLAVE .* RUNNING (\w+)\s*^\s@\s+ON HOST.*IN DIRECTORY\s*^\s@\s+(.*)"
 
+# The PRT file is read in chunks of this many characters, so that the memory
+# used when checking for errors does not grow with the size of the file.
+PRT_CHUNK_SIZE = 1024 * 1024
+
+# Number of lines at the end of a chunk which are kept and searched again
+# together with the next chunk, as a message can start in one chunk and end
+# in the next.
+_PRT_OVERLAP_LINES = 10
+
+
+def _start_of_last_lines(text: str, num_lines: int) -> int:
+    pos = len(text)
+    for _ in range(num_lines):
+        pos = text.rfind("\n", 0, pos)
+        if pos < 0:
+            return 0
+    return pos + 1
+
+
+def find_all_in_file(
+    file_path: Path, regexps: list[re.Pattern[str]], chunk_size: int = PRT_CHUNK_SIZE
+) -> list[list[str]]:
+    """Finds all non-overlapping matches of each of the regexps in a file.
+
+    The file is read chunk by chunk, and only the unsearched part of the
+    current chunk is kept in memory. A match is only accepted once the line
+    following it has been read, so that matches spanning several chunks are
+    found in full.
+    """
+    matches: list[list[str]] = [[] for _ in regexps]
+    positions = [0] * len(regexps)
+    buffer = ""
+    with open(file_path, encoding="utf-8") as filehandle:
+        while True:
+            chunk = filehandle.read(chunk_size)
+            at_end = not chunk
+            buffer += chunk
+            # Everything after the start of the last complete line may still
+            # be extended by the next chunk:
+            last_line = buffer.rfind("\n", 0, buffer.rfind("\n")) + 1
+            overlap = _start_of_last_lines(buffer, _PRT_OVERLAP_LINES)
+            for i, regexp in enumerate(regexps):
+                while match := regexp.search(buffer, positions[i]):
+                    if not at_end and match.end() >= last_line:
+                        positions[i] = max(positions[i], min(match.start(), overlap))
+                        break
+                    matches[i].append(match.group())
+                    positions[i] = match.end()
+                else:
+                    positions[i] = max(positions[i], overlap)
+            if at_end:
+                return matches
+            consumed = min(positions)
+            buffer = buffer[consumed:]
+            positions = [pos - consumed for pos in positions]
+
+
+def read_lines_backwards(file_path: Path, chunk_size: int = PRT_CHUNK_SIZE):
+    """Yields the lines of a file, last line first, reading the file
+    chunk by chunk from the end"""
+    with open(file_path, "rb") as filehandle:
+        position = filehandle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            filehandle.seek(position)
+            lines = (filehandle.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode("utf-8")
+        yield remainder.decode("utf-8")
+
 
 def make_LSB_MCPU_machine_list(LSB_MCPU_HOSTS):
     host_numcpu_list = LSB_MCPU_HOSTS.split()
@@ -179,8 +253,101 @@ def _is_unsmry(base: str, path: str) -> bool:
     return Path(candidates[0])
 
 
+_ITEM_SIZES = {
+    b"INTE": 4,
+    b"REAL": 4,
+    b"LOGI": 4,
+    b"DOUB": 8,
+    b"CHAR": 8,
+    b"MESS": 0,
+}
+
+
+def _item_size(dtype: bytes) -> int:
+    if dtype in _ITEM_SIZES:
+        return _ITEM_SIZES[dtype]
+    if dtype.startswith(b"C0"):
+        return int(dtype[1:])
+    raise ValueError(f"Unknown keyword type {dtype!r}")
+
+
+class UnsmryRecordCounter:
+    """Counts the keywords in a summary file which is still being written.
+
+    The position after the last complete keyword is remembered between calls
+    to count(), so only the bytes appended since the previous call are read
+    for unformatted files. Formatted files are read in full by resfo.
+    """
+
+    def __init__(self, smry_path: Path | str) -> None:
+        self.smry_path = smry_path
+        self.num_keywords = 0
+        self.last_keyword: str | None = None
+        self._offset = 0
+
+    def count(self) -> int:
+        """Returns the number of complete keywords in the file
+
+        Raises an exception if the file can not be read, or if it ends with
+        an incomplete keyword."""
+        if str(self.smry_path).lower().endswith(".funsmry"):
+            keywords = [r.read_keyword() for r in resfo.lazy_read(self.smry_path)]
+            self.num_keywords = len(keywords)
+            self.last_keyword = keywords[-1].strip() if keywords else None
+            return self.num_keywords
+
+        with open(self.smry_path, "rb") as filehandle:
+            if filehandle.seek(0, os.SEEK_END) < self._offset:
+                # The file has been truncated, start from the beginning
+                self.num_keywords, self.last_keyword, self._offset = 0, None, 0
+            filehandle.seek(self._offset)
+            data = filehandle.read()
+
+        position = 0
+        while position < len(data):
+            end = self._end_of_keyword(data, position)
+            if end is None:
+                raise ValueError(f"Incomplete keyword at end of {self.smry_path}")
+            self.num_keywords += 1
+            self.last_keyword = data[position + 4 : position + 12].decode().strip()
+            self._offset += end - position
+            position = end
+        return self.num_keywords
+
+    @staticmethod
+    def _end_of_keyword(data: bytes, position: int) -> int | None:
+        """Returns the position after the keyword header and data records
+        starting at position, or None if the keyword is incomplete"""
+        if position + 24 > len(data):
+            return None
+        head_marker, _, length, dtype, tail_marker = struct.unpack_from(
+            ">i8si4si", data, position
+        )
+        if head_marker != 16 or tail_marker != 16:
+            raise ValueError("Invalid keyword header in summary file")
+        position += 24
+        remaining = length * _item_size(dtype)
+        while remaining > 0:
+            if position + 4 > len(data):
+                return None
+            (record_length,) = struct.unpack_from(">i", data, position)
+            if position + record_length + 8 > len(data):
+                return None
+            (end_marker,) = struct.unpack_from(">i", data, position + 4 + record_length)
+            if end_marker != record_length or record_length <= 0:
+                raise ValueError("Invalid data record in summary file")
+            remaining -= record_length
+            position += record_length + 8
+        if remaining < 0:
+            raise ValueError("Data record exceeds keyword length in summary file")
+        return position
+
+
 def await_completed_unsmry_file(
-    smry_path: Path, max_wait: float = 15, poll_interval: float = 1.0
+    smry_path: Path,
+    max_wait: float = 15,
+    poll_interval: float = 1.0,
+    require_params_trailer: bool = False,
 ) -> float:
     """This function will wait until the provided smry file does not grow in size
     during one poll interval.
@@ -191,7 +358,9 @@ def await_completed_unsmry_file(
     If the file does not exist or is completely unreadable to resfo, this function
     will timeout to max_wait. If NOSIM is included, this will happen.
 
-    Size is defined in terms of readable data elementes through resfo.
+    Size is defined in terms of readable data elementes through resfo. Only the
+    data appended since the previous poll is read. If require_params_trailer is
+    set, the file is also required to end with the PARAMS keyword of a ministep.
 
     This function will always wait for at least one poll interval, the polling
     interval is specified in seconds.
@@ -199,15 +368,17 @@ def await_completed_unsmry_file(
     The return value is the waited time (in seconds)"""
     start_time = datetime.datetime.now()
     prev_len = 0
+    counter = UnsmryRecordCounter(smry_path)
     while (datetime.datetime.now() - start_time).total_seconds() < max_wait:
         try:
-            resfo_sum = [r.read_keyword() for r in resfo.lazy_read(smry_path)]
+            current_len = counter.count()
         except Exception:
             time.sleep(poll_interval)
             continue
 
-        current_len = len(resfo_sum)
-        if prev_len == current_len:
+        if prev_len == current_len and (
+            not require_params_trailer or counter.last_keyword == "PARAMS"
+        ):
             # smry file is regarded complete
             break
         else:
@@ -491,17 +662,19 @@ def readECLEND(self):
         if not os.path.isfile(report_file):
             report_file = self.prt_path
 
+        # The error summary is at the end of the file, so the file is read
+        # backwards, and the last reported counts are used:
         errors = None
         bugs = None
-        with open(report_file, encoding="utf-8") as filehandle:
-            for line in filehandle.readlines():
-                error_match = re.match(error_regexp, line)
-                if error_match:
-                    errors = int(error_match.group(1))
-
-                bug_match = re.match(bug_regexp, line)
-                if bug_match:
-                    bugs = int(bug_match.group(1))
+        for line in read_lines_backwards(Path(report_file)):
+            if errors is None and (error_match := re.match(error_regexp, line)):
+                errors = int(error_match.group(1))
+
+            if bugs is None and (bug_match := re.match(bug_regexp, line)):
+                bugs = int(bug_match.group(1))
+
+            if errors is not None and bugs is not None:
+                break
         if errors is None:
             raise ValueError(f"Could not read errors from {report_file}")
         if bugs is None:
@@ -511,26 +684,13 @@ def readECLEND(self):
 
     def parseErrors(self) -> list[str]:
         """Extract multiline ERROR messages from the PRT file"""
-        error_list = []
         error_e100_regexp = re.compile(error_pattern_e100, re.MULTILINE)
         error_e300_regexp = re.compile(error_pattern_e300, re.MULTILINE)
         slave_started_regexp = re.compile(slave_started_pattern, re.MULTILINE)
-        with open(self.prt_path, encoding="utf-8") as filehandle:
-            content = filehandle.read()
-
-        for regexp in [error_e100_regexp, error_e300_regexp, slave_started_regexp]:
-            offset = 0
-            while True:
-                match = regexp.search(content[offset:])
-                if match:
-                    error_list.append(
-                        content[offset + match.start() : offset + match.end()]
-                    )
-                    offset += match.end()
-                else:
-                    break
-
-        return error_list
+        matches = find_all_in_file(
+            self.prt_path, [error_e100_regexp, error_e300_regexp, slave_started_regexp]
+        )
+        return [error for regexp_matches in matches for error in regexp_matches]
 
 
 def run(config: EclConfig, argv):
@@ -1,12 +1,19 @@
+import contextlib
 import json
 import os
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from fnmatch import fnmatch
 
+import numpy as np
 import pandas
+import polars
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ert import ErtScript, LibresFacade
-from ert.config import ErtConfig
-from ert.storage import Storage
+from ert.storage import Ensemble, Storage
+
+INDEX_COLUMNS = ["Realization", "Iteration", "Date", "Ensemble"]
 
 
 def loadDesignMatrix(filename: str) -> pandas.DataFrame:
@@ -32,6 +39,16 @@ class CSVExportJob(ErtScript):
 
     design_matrix: a path to a file containing the design matrix
 
+    drop_const_cols: drop the columns which have the same value in every row
+
+    summary_keys: a comma separated list of summary keys to export, where
+                  each key may contain wildcards, e.g. "FOPR,WOPR:*".
+                  Defaults to all summary keys
+
+    The data is written one realization at a time, so the whole export is
+    never held in memory. If output_file ends with ".parquet" the data is
+    written as Parquet instead of CSV.
+
     The script also looks for default values for output path and design matrix
     path to present in the GUI. These can be specified with DATA_KW keyword in
     the config file:
@@ -52,7 +69,6 @@ def getDescription() -> str:
 
     def run(
         self,
-        ert_config: ErtConfig,
         storage: Storage,
         workflow_args: Sequence[str],
     ) -> str:
@@ -61,7 +77,12 @@ def run(
         design_matrix_path = None if len(workflow_args) < 3 else workflow_args[2]
         _ = True if len(workflow_args) < 4 else workflow_args[3]
         drop_const_cols = False if len(workflow_args) < 5 else workflow_args[4]
-        facade = LibresFacade(ert_config)
+        summary_keys = None if len(workflow_args) < 6 else workflow_args[5]
+        summary_patterns = (
+            [key.strip() for key in summary_keys.split(",") if key.strip()]
+            if summary_keys
+            else []
+        )
 
         ensemble_data_as_dict = (
             json.loads(ensemble_data_as_json) if ensemble_data_as_json else {}
@@ -70,10 +91,10 @@ def run(
         # Use the keys (UUIDs as strings) to get ensembles
         ensembles = []
         for ensemble_id in ensemble_data_as_dict:
-            assert self.storage is not None
-            ensemble = self.storage.get_ensemble(ensemble_id)
+            ensemble = storage.get_ensemble(ensemble_id)
             ensembles.append(ensemble)
 
+        design_matrix_data = None
         if design_matrix_path is not None:
             if not os.path.exists(design_matrix_path):
                 raise UserWarning("The design matrix file does not exist!")
@@ -81,48 +102,148 @@ def run(
             if not os.path.isfile(design_matrix_path):
                 raise UserWarning("The design matrix is not a file!")
 
-        data = pandas.DataFrame()
+            design_matrix_data = loadDesignMatrix(design_matrix_path)
 
+        sources = []
         for ensemble in ensembles:
             if not ensemble.has_data():
                 raise UserWarning(
                     f"The ensemble '{ensemble.name}' does not have any data!"
                 )
+            sources.append(
+                _EnsembleExport(ensemble, design_matrix_data, summary_patterns)
+            )
 
-            ensemble_data = ensemble.load_all_gen_kw_data()
+        columns = list(dict.fromkeys(c for source in sources for c in source.columns))
+        if drop_const_cols:
+            columns = _varying_columns(sources, columns)
+
+        chunks = (chunk for source in sources for chunk in source.chunks(columns))
+        if str(output_file).endswith(".parquet"):
+            num_rows = _write_parquet(output_file, chunks)
+        else:
+            num_rows = _write_csv(output_file, chunks, columns)
 
-            if design_matrix_path is not None:
-                design_matrix_data = loadDesignMatrix(design_matrix_path)
-                if not design_matrix_data.empty:
-                    ensemble_data = ensemble_data.join(design_matrix_data, how="outer")
+        return f"Exported {num_rows} rows and {len(columns)} columns to {output_file}."
 
-            misfit_data = facade.load_all_misfit_data(ensemble)
-            if not misfit_data.empty:
-                ensemble_data = ensemble_data.join(misfit_data, how="outer")
 
-            summary_data = ensemble.load_all_summary_data()
-            if not summary_data.empty:
-                ensemble_data = ensemble_data.join(summary_data, how="outer")
-            else:
-                ensemble_data["Date"] = None
-                ensemble_data.set_index(["Date"], append=True, inplace=True)
+class _EnsembleExport:
+    """
+    The data of one ensemble, read one realization at a time. The scalar
+    data (GEN_KW, design matrix and misfits) has one row per realization and
+    is kept in memory, while the summary data of each realization is only
+    read when its chunk is produced.
+    """
 
-            ensemble_data["Iteration"] = ensemble.iteration
-            ensemble_data["Ensemble"] = ensemble.name
-            ensemble_data.set_index(
-                ["Ensemble", "Iteration"], append=True, inplace=True
+    def __init__(
+        self,
+        ensemble: Ensemble,
+        design_matrix_data: pandas.DataFrame | None,
+        summary_patterns: list[str],
+    ) -> None:
+        self.ensemble = ensemble
+
+        scalars = ensemble.load_all_gen_kw_data()
+        if design_matrix_data is not None and not design_matrix_data.empty:
+            scalars = scalars.join(design_matrix_data, how="outer")
+        misfit_data = LibresFacade.load_all_misfit_data(ensemble)
+        if not misfit_data.empty:
+            scalars = scalars.join(misfit_data, how="outer")
+        self.scalars = scalars
+
+        self.summary_keys = sorted(
+            key
+            for key in ensemble.experiment.response_type_to_response_keys.get(
+                "summary", []
             )
+            if not summary_patterns
+            or any(fnmatch(key, pattern) for pattern in summary_patterns)
+        )
+        self.columns = [*scalars.columns, *self.summary_keys]
+        self.realizations = sorted(
+            {int(r) for r in scalars.index}
+            | set(ensemble.get_realization_list_with_responses())
+        )
 
-            data = pandas.concat([data, ensemble_data])
+    def _load_summary(self, realization: int) -> pandas.DataFrame:
+        summary = polars.DataFrame()
+        if self.summary_keys:
+            with contextlib.suppress(KeyError):
+                summary = (
+                    self.ensemble.scan_responses("summary", (realization,))
+                    .filter(polars.col("response_key").is_in(self.summary_keys))
+                    .select("response_key", "time", "values")
+                    .collect()
+                )
+        if summary.is_empty():
+            return pandas.DataFrame({"Date": pandas.Series([pandas.NaT])})
+        return (
+            summary.pivot(on="response_key", index="time", sort_columns=True)
+            .sort("time")
+            .rename({"time": "Date"})
+            .to_pandas()
+        )
 
-        data = data.reorder_levels(["Realization", "Iteration", "Date", "Ensemble"])
-        if drop_const_cols:
-            data = data.loc[:, (data != data.iloc[0]).any()]
+    def chunks(self, columns: list[str]) -> Iterator[pandas.DataFrame]:
+        for realization in self.realizations:
+            summary = self._load_summary(realization)
+            num_rows = len(summary)
+            chunk = summary.assign(
+                Realization=realization,
+                Iteration=self.ensemble.iteration,
+                Ensemble=self.ensemble.name,
+            )
+            if realization in self.scalars.index:
+                scalars = self.scalars.loc[[realization] * num_rows].reset_index(
+                    drop=True
+                )
+                chunk = pandas.concat([chunk, scalars], axis=1)
+            yield chunk.set_index(INDEX_COLUMNS).reindex(columns=columns)
 
-        data.to_csv(output_file, float_format="%.6f")
 
-        export_info = (
-            f"Exported {len(data.index)} rows and {len(data.columns)} "
-            f"columns to {output_file}."
-        )
-        return export_info
+def _varying_columns(sources: list[_EnsembleExport], columns: list[str]) -> list[str]:
+    """
+    Streaming pre-pass over all chunks, finding the columns with at least one
+    value different from the value in the first row
+    """
+    first_row: pandas.Series | None = None
+    varying = np.zeros(len(columns), dtype=bool)
+    for source in sources:
+        for chunk in source.chunks(columns):
+            if chunk.empty:
+                continue
+            if first_row is None:
+                first_row = chunk.iloc[0]
+            varying |= (chunk != first_row).any().to_numpy()
+    return [column for column, keep in zip(columns, varying, strict=True) if keep]
+
+
+def _write_csv(
+    output_file: str, chunks: Iterator[pandas.DataFrame], columns: list[str]
+) -> int:
+    num_rows = 0
+    with open(output_file, "w", encoding="utf-8") as fout:
+        for chunk in chunks:
+            chunk.to_csv(fout, header=num_rows == 0, float_format="%.6f")
+            num_rows += len(chunk)
+        if num_rows == 0:
+            pandas.DataFrame(columns=[*INDEX_COLUMNS, *columns]).to_csv(
+                fout, index=False
+            )
+    return num_rows
+
+
+def _write_parquet(output_file: str, chunks: Iterator[pandas.DataFrame]) -> int:
+    num_rows = 0
+    writer: pq.ParquetWriter | None = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk.reset_index(), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_file, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            num_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return num_rows
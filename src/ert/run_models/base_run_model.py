@@ -11,7 +11,7 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Generator, MutableSequence
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from queue import SimpleQueue
 from typing import TYPE_CHECKING, cast
@@ -56,6 +56,7 @@
 )
 from ert.mode_definitions import MODULE_MODE
 from ert.runpaths import Runpaths
+from ert.scheduler import create_driver
 from ert.storage import Ensemble, Storage
 from ert.trace import tracer
 from ert.workflow_runner import WorkflowRunner
@@ -176,6 +177,8 @@ def __init__(
         self.active_realizations = copy.copy(active_realizations)
         self.start_iteration = start_iteration
         self.restart = False
+        self._session_runner: asyncio.Runner | None = None
+        self._session_evaluator: EnsembleEvaluator | None = None
 
     def log_at_startup(self) -> None:
         keys_to_drop = [
@@ -491,7 +494,10 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
             )
 
     async def run_monitor(
-        self, ee_config: EvaluatorServerConfig, iteration: int
+        self,
+        ee_config: EvaluatorServerConfig,
+        iteration: int,
+        keep_evaluator_running: bool = False,
     ) -> bool:
         try:
             logger.debug("connecting to new monitor...")
@@ -513,6 +519,9 @@ async def run_monitor(
                             ENSEMBLE_STATE_STOPPED,
                             ENSEMBLE_STATE_FAILED,
                         }:
+                            if keep_evaluator_running:
+                                logger.debug("observed evaluation stopped event")
+                                return True
                             logger.debug(
                                 "observed evaluation stopped event, signal done"
                             )
@@ -578,6 +587,64 @@ async def run_ensemble_evaluator_async(
 
         return evaluator_task.result()
 
+    async def _run_ensemble_evaluator_in_session(
+        self,
+        run_args: list[RunArg],
+        ensemble: Ensemble,
+        ee_config: EvaluatorServerConfig,
+    ) -> list[int]:
+        if not self._end_queue.empty():
+            logger.debug("Run model canceled - pre evaluation")
+            self._end_queue.get()
+            return []
+        ee_ensemble = self._build_ensemble(run_args, ensemble.experiment_id)
+        if self._session_evaluator is None:
+            self._session_evaluator = EnsembleEvaluator(ee_ensemble, ee_config)
+            await self._session_evaluator.start_session(
+                create_driver(self._queue_config.queue_options)
+            )
+        evaluator = self._session_evaluator
+        evaluator_task = asyncio.create_task(evaluator.evaluate_ensemble(ee_ensemble))
+        if not (
+            await self.run_monitor(
+                ee_config, ensemble.iteration, keep_evaluator_running=True
+            )
+        ):
+            # The evaluator is stopped when cancelled, so a new one is started
+            # for the next ensemble
+            self._session_evaluator = None
+            evaluator_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await evaluator_task
+            await evaluator.stop_session()
+            return []
+
+        await evaluator_task
+        if not self._end_queue.empty():
+            logger.debug("Run model canceled - post evaluation")
+            self._end_queue.get()
+            return []
+        ensemble.refresh_ensemble_state()
+
+        return evaluator_task.result()
+
+    @contextmanager
+    def evaluator_session(self) -> Generator[None, None, None]:
+        """
+        Evaluates all ensembles run within the context with the same
+        evaluator server, event loop and queue driver, instead of starting
+        and stopping them for every ensemble.
+        """
+        with asyncio.Runner() as runner:
+            self._session_runner = runner
+            try:
+                yield
+            finally:
+                if self._session_evaluator is not None:
+                    runner.run(self._session_evaluator.stop_session())
+                self._session_evaluator = None
+                self._session_runner = None
+
     # This function needs to be there for the sake of testing that expects sync ee run
     @tracer.start_as_current_span(f"{__name__}.run_ensemble_evaluator")
     def run_ensemble_evaluator(
@@ -586,6 +653,10 @@ def run_ensemble_evaluator(
         ensemble: Ensemble,
         ee_config: EvaluatorServerConfig,
     ) -> list[int]:
+        if self._session_runner is not None:
+            return self._session_runner.run(
+                self._run_ensemble_evaluator_in_session(run_args, ensemble, ee_config)
+            )
         successful_realizations = asyncio.run(
             self.run_ensemble_evaluator_async(run_args, ensemble, ee_config)
         )
@@ -800,5 +871,6 @@ def update(
                 "Update algorithm failed for iteration:"
                 f"{posterior.iteration}. The following error occurred {e}"
             ) from e
+        self._storage.flush()
         self.run_workflows(HookRuntime.POST_UPDATE, self._storage, prior)
         return posterior
@@ -204,8 +204,9 @@ def run_experiment(
             optimizer, self._everest_config.optimization_output_dir
         )
 
-        # Run the optimization:
-        optimizer_exit_code = optimizer.run().exit_code
+        # Run the optimization, evaluating all batches with the same evaluator:
+        with self.evaluator_session():
+            optimizer_exit_code = optimizer.run().exit_code
 
         # Extract the best result from the storage.
         self._result = OptimalResult.from_seba_optimal_result(
@@ -363,8 +364,7 @@ def _forward_model_evaluator(
             name=f"batch_{self._batch_id}",
             ensemble_size=len(batch_data),
         )
-        for sim_id, controls in enumerate(batch_data.values()):
-            self._setup_sim(sim_id, controls, ensemble)
+        self._save_controls(batch_data, evaluator_context, ensemble)
 
         # Evaluate the batch:
         run_args = self._get_run_args(ensemble, evaluator_context, batch_data)
@@ -421,48 +421,26 @@ def _init_batch_data(
         control_values: NDArray[np.float64],
         evaluator_context: EvaluatorContext,
         cached_results: dict[int, Any],
-    ) -> dict[int, dict[str, Any]]:
-        def add_control(
-            controls: dict[str, Any],
-            control_name: tuple[Any, ...],
-            control_value: float,
-        ) -> None:
-            group_name = control_name[0]
-            variable_name = control_name[1]
-            group = controls.get(group_name, {})
-            if len(control_name) > 2:
-                index_name = str(control_name[2])
-                if variable_name in group:
-                    group[variable_name][index_name] = control_value
-                else:
-                    group[variable_name] = {index_name: control_value}
-            else:
-                group[variable_name] = control_value
-            controls[group_name] = group
-
-        batch_data = {}
-        for control_idx in range(control_values.shape[0]):
-            if control_idx not in cached_results and (
+    ) -> dict[int, NDArray[np.float64]]:
+        return {
+            control_idx: control_values[control_idx, :]
+            for control_idx in range(control_values.shape[0])
+            if control_idx not in cached_results
+            and (
                 evaluator_context.active is None
                 or evaluator_context.active[evaluator_context.realizations[control_idx]]
-            ):
-                controls: dict[str, Any] = {}
-                assert evaluator_context.config.variables.names is not None
-                for control_name, control_value in zip(
-                    evaluator_context.config.variables.names,
-                    control_values[control_idx, :],
-                    strict=False,
-                ):
-                    add_control(controls, control_name, control_value)
-                batch_data[control_idx] = controls
-        return batch_data
+            )
+        }
+
+    def _get_control_columns(
+        self, variable_names: tuple[Any, ...]
+    ) -> dict[str, tuple[list[str], list[int]]]:
+        """
+        Checks the names of the optimizer variables against the controls, and
+        returns for each control the names of its variables in storage
+        together with their columns in the matrix of control values.
+        """
 
-    def _setup_sim(
-        self,
-        sim_id: int,
-        controls: dict[str, dict[str, Any]],
-        ensemble: Ensemble,
-    ) -> None:
         def _check_suffix(
             ext_config: ExtParamConfig,
             key: str,
@@ -491,10 +469,19 @@ def _check_suffix(
                         f"Key {key} has suffixes, a suffix must be specified"
                     )
 
+        controls: dict[str, dict[str, Any]] = defaultdict(dict)
+        for column, control_name in enumerate(variable_names):
+            group = controls[control_name[0]]
+            if len(control_name) > 2:
+                group.setdefault(control_name[1], {})[str(control_name[2])] = column
+            else:
+                group[control_name[1]] = column
+
         if set(controls.keys()) != set(self._everest_config.control_names):
             err_msg = "Mismatch between initialized and provided control names."
             raise KeyError(err_msg)
 
+        control_columns: dict[str, tuple[list[str], list[int]]] = {}
         for control_name, control in controls.items():
             ext_config = self.ert_config.ensemble_config.parameter_configs[control_name]
             if isinstance(ext_config, ExtParamConfig):
@@ -504,12 +491,41 @@ def _check_suffix(
                         f"control {control_name}, "
                         f"received {len(control.keys())}."
                     )
+                names: list[str] = []
+                columns: list[int] = []
                 for var_name, var_setting in control.items():
                     _check_suffix(ext_config, var_name, var_setting)
-
-                ensemble.save_parameters(
-                    control_name, sim_id, ExtParamConfig.to_dataset(control)
-                )
+                    if isinstance(var_setting, dict):
+                        for suffix, column in var_setting.items():
+                            names.append(f"{var_name}\0{suffix}")
+                            columns.append(column)
+                    else:
+                        names.append(var_name)
+                        columns.append(var_setting)
+                control_columns[control_name] = (names, columns)
+        return control_columns
+
+    def _save_controls(
+        self,
+        batch_data: dict[int, NDArray[np.float64]],
+        evaluator_context: EvaluatorContext,
+        ensemble: Ensemble,
+    ) -> None:
+        if not batch_data:
+            return
+        assert evaluator_context.config.variables.names is not None
+        control_columns = self._get_control_columns(
+            evaluator_context.config.variables.names
+        )
+        # One row of control values per simulation in the batch:
+        control_values = np.stack(list(batch_data.values()))
+        simulations = np.arange(len(batch_data))
+        for control_name, (names, columns) in control_columns.items():
+            ensemble.save_parameters(
+                control_name,
+                simulations,
+                ExtParamConfig.matrix_to_dataset(names, control_values[:, columns]),
+            )
 
     def _get_run_args(
         self,
@@ -4,11 +4,16 @@
 import logging
 from queue import SimpleQueue
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 import numpy as np
 from iterative_ensemble_smoother import steplength_exponential
 
-from ert.analysis import ErtAnalysisError, iterative_smoother_update
+from ert.analysis import (
+    ErtAnalysisError,
+    iterative_smoother_update,
+    load_sies_smoother,
+)
 from ert.config import ErtConfig, HookRuntime
 from ert.enkf_main import sample_prior
 from ert.ensemble_evaluator import EvaluatorServerConfig
@@ -22,8 +27,6 @@
 from .event import RunModelStatusEvent, RunModelUpdateBeginEvent
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
     import numpy.typing as npt
 
     from ert.config import QueueConfig
@@ -48,6 +51,7 @@ def __init__(
         analysis_config: IESSettings,
         update_settings: UpdateSettings,
         status_queue: SimpleQueue[StatusEvents],
+        prior_ensemble_id: str | None = None,
     ):
         self.support_restart = False
         self.analysis_config = analysis_config
@@ -61,6 +65,17 @@ def __init__(
         )
         self.target_ensemble_format = target_ensemble
         self.experiment_name = experiment_name
+        # When set, the run continues with the update of this ensemble
+        self.prior_ensemble_id = prior_ensemble_id
+        start_iteration = 0
+        if self.prior_ensemble_id is not None:
+            start_iteration = storage.get_ensemble(prior_ensemble_id).iteration
+            number_of_iterations -= start_iteration
+            if number_of_iterations < 1:
+                raise ValueError(
+                    f"Prior ensemble is at iteration {start_iteration}, "
+                    "which is not before the last iteration"
+                )
 
         super().__init__(
             config,
@@ -69,6 +84,7 @@ def __init__(
             status_queue,
             active_realizations=active_realizations,
             total_iterations=number_of_iterations,
+            start_iteration=start_iteration,
             random_seed=random_seed,
             minimum_required_realizations=minimum_required_realizations,
         )
@@ -115,6 +131,7 @@ def analyzeStep(
             raise ErtRunError(
                 f"Update algorithm failed with the following error: {e}"
             ) from e
+        self._storage.flush()
         self.run_workflows(HookRuntime.POST_UPDATE, self._storage, posterior_storage)
 
     @tracer.start_as_current_span(f"{__name__}.run_experiment")
@@ -124,40 +141,50 @@ def run_experiment(
         self.log_at_startup()
         self.restart = restart
         target_ensemble_format = self.target_ensemble_format
-        experiment = self._storage.create_experiment(
-            parameters=self.ert_config.ensemble_config.parameter_configuration,
-            observations=self.ert_config.observations,
-            responses=self.ert_config.ensemble_config.response_configuration,
-            name=self.experiment_name,
-        )
-        prior = self._storage.create_ensemble(
-            experiment=experiment,
-            ensemble_size=self.ensemble_size,
-            name=target_ensemble_format % 0,
-        )
-        self.set_env_key("_ERT_ENSEMBLE_ID", str(prior.id))
-        self.set_env_key("_ERT_EXPERIMENT_ID", str(experiment.id))
-
         initial_mask = np.array(self.active_realizations, dtype=bool)
-        prior_args = create_run_arguments(
-            self.run_paths,
-            np.array(self.active_realizations, dtype=bool),
-            ensemble=prior,
-        )
+        if self.prior_ensemble_id is not None:
+            prior = self._restart_ensemble()
+            experiment = prior.experiment
+            self.set_env_key("_ERT_ENSEMBLE_ID", str(prior.id))
+            self.set_env_key("_ERT_EXPERIMENT_ID", str(experiment.id))
+            prior_args = create_run_arguments(
+                self.run_paths, initial_mask, ensemble=prior
+            )
+        else:
+            experiment = self._storage.create_experiment(
+                parameters=self.ert_config.ensemble_config.parameter_configuration,
+                observations=self.ert_config.observations,
+                responses=self.ert_config.ensemble_config.response_configuration,
+                name=self.experiment_name,
+            )
+            prior = self._storage.create_ensemble(
+                experiment=experiment,
+                ensemble_size=self.ensemble_size,
+                name=target_ensemble_format % 0,
+            )
+            self.set_env_key("_ERT_ENSEMBLE_ID", str(prior.id))
+            self.set_env_key("_ERT_EXPERIMENT_ID", str(experiment.id))
 
-        sample_prior(
-            prior,
-            np.where(self.active_realizations)[0],
-            random_seed=self.random_seed,
-        )
-        self._evaluate_and_postprocess(
-            prior_args,
-            prior,
-            evaluator_server_config,
-        )
+            prior_args = create_run_arguments(
+                self.run_paths, initial_mask, ensemble=prior
+            )
+
+            sample_prior(
+                prior,
+                np.where(self.active_realizations)[0],
+                random_seed=self.random_seed,
+            )
+            self._evaluate_and_postprocess(
+                prior_args,
+                prior,
+                evaluator_server_config,
+            )
 
-        self.run_workflows(HookRuntime.PRE_FIRST_UPDATE, self._storage, prior)
-        for prior_iter in range(self._total_iterations):
+        if prior.iteration == 0:
+            self.run_workflows(HookRuntime.PRE_FIRST_UPDATE, self._storage, prior)
+        for prior_iter in range(
+            self.start_iteration, self.start_iteration + self._total_iterations
+        ):
             self.send_event(
                 RunModelUpdateBeginEvent(iteration=prior_iter, run_id=prior.id)
             )
@@ -218,6 +245,29 @@ def run_experiment(
                 )
             prior = posterior
 
+    def _restart_ensemble(self) -> Ensemble:
+        """The ensemble the restarted run continues from.
+
+        The smoother is resumed from the state saved by the update that
+        created the ensemble, so that it continues with the same weights.
+        """
+        try:
+            prior = self._storage.get_ensemble(UUID(self.prior_ensemble_id))
+        except (KeyError, ValueError) as err:
+            raise ErtRunError(
+                f"Prior ensemble with ID: {self.prior_ensemble_id} does not exists"
+            ) from err
+        try:
+            self.sies_smoother = load_sies_smoother(prior, self.analysis_config)
+        except ErtAnalysisError as err:
+            raise ErtRunError(str(err)) from err
+        if self.sies_smoother is None and prior.iteration > 0:
+            raise ErtRunError(
+                f"Cannot restart from ensemble {prior.name}, as the state of "
+                "the iterated ensemble smoother that created it was not saved"
+            )
+        return prior
+
     @classmethod
     def name(cls) -> str:
         return "Iterated ensemble smoother"
@@ -290,6 +290,7 @@ def _setup_iterative_ensemble_smoother(
         analysis_config=config.analysis_config.ies_module,
         update_settings=update_settings,
         status_queue=status_queue,
+        prior_ensemble_id=getattr(args, "restart_ensemble_id", None),
     )
 
 
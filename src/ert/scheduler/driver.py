@@ -35,6 +35,10 @@ def __init__(self, activate_script: str = "") -> None:
         self._event_queue: asyncio.Queue[Event] | None = None
         self._job_error_message_by_iens: dict[int, str] = {}
         self.activate_script = activate_script
+        # Jobs which were killed, but not reported as finished before the
+        # ensemble which submitted them was done, by realization. The event
+        # is set when the job is reported as finished.
+        self.abandoned_jobs: dict[int, asyncio.Event] = {}
 
     @property
     def event_queue(self) -> asyncio.Queue[Event]:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import time
 from contextlib import suppress
@@ -12,6 +11,7 @@
 from lxml import etree
 from pydantic_core._pydantic_core import ValidationError
 
+from _ert.checksum import md5_checksum, sampled_md5_checksum
 from _ert.events import Id, RealizationTimeout, event_from_dict
 from ert.callbacks import forward_model_ok
 from ert.constant_filenames import ERROR_file
@@ -103,6 +103,7 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
         timeout_task: asyncio.Task[None] | None = None
 
         try:
+            await self._scheduler._wait_for_abandoned_job(self.iens)
             if self._scheduler.submit_sleep_state:
                 await self._scheduler.submit_sleep_state.sleep_until_we_can_submit()
             await self._send(JobState.SUBMITTING)
@@ -121,6 +122,7 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
                 logger.error(f"Failed to submit: {err}")
                 self.returncode.cancel()
                 return
+            self._scheduler._job_submitted(self.iens)
 
             await self._send(JobState.PENDING)
             await self.started.wait()
@@ -147,7 +149,7 @@ async def run(
         self,
         sem: asyncio.BoundedSemaphore,
         forward_model_ok_lock: asyncio.Lock,
-        checksum_lock: asyncio.Lock,
+        checksum_semaphore: asyncio.Semaphore,
         max_submit: int = 1,
     ) -> None:
         with tracer.start_as_current_span(f"{__name__}.run.realization_{self.iens}"):
@@ -160,7 +162,7 @@ async def run(
 
                 if self.returncode.result() == 0:
                     if self._scheduler._manifest_queue is not None:
-                        await self._verify_checksum(checksum_lock)
+                        await self._verify_checksum(checksum_semaphore)
                     async with forward_model_ok_lock:
                         await self._handle_finished_forward_model()
                     break
@@ -191,18 +193,20 @@ async def _max_runtime_task(self) -> None:
 
     async def _verify_checksum(
         self,
-        checksum_lock: asyncio.Lock,
+        checksum_semaphore: asyncio.Semaphore,
         timeout: int | None = None,  # noqa: ASYNC109
     ) -> None:
         if timeout is None:
             timeout = self.DEFAULT_CHECKSUM_TIMEOUT
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
         # Wait for job runpath to be in the checksum dictionary
         runpath = self.real.run_arg.runpath
-        while runpath not in self._scheduler.checksum:
-            if timeout <= 0:
-                break
-            timeout -= 1
-            await asyncio.sleep(1)
+        if runpath not in self._scheduler.checksum:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._scheduler.wait_for_checksum(runpath), timeout
+                )
 
         checksum = self._scheduler.checksum.get(runpath)
         if checksum is None:
@@ -217,29 +221,24 @@ async def _verify_checksum(
 
         valid_checksums = [info for info in checksum.values() if "error" not in info]
 
-        # Wait for files in checksum
-        while not all(Path(info["path"]).exists() for info in valid_checksums):
-            if timeout <= 0:
+        # Wait for files in checksum. Files written on other hosts give no
+        # change notifications on network file systems, so this polls, with
+        # the file system calls kept off the event loop.
+        poll_interval = 0.1
+        while not await asyncio.to_thread(
+            lambda: all(Path(info["path"]).exists() for info in valid_checksums)
+        ):
+            if loop.time() >= deadline:
                 break
-            timeout -= 1
             logger.debug("Waiting for disk synchronization")
-            await asyncio.sleep(1)
-        async with checksum_lock:
-            for info in valid_checksums:
-                file_path = Path(info["path"])
-                expected_md5sum = info.get("md5sum")
-                if file_path.exists() and expected_md5sum:
-                    actual_md5sum = hashlib.md5(file_path.read_bytes()).hexdigest()
-                    if expected_md5sum == actual_md5sum:
-                        logger.debug(f"File {file_path} checksum successful.")
-                    else:
-                        logger.warning(
-                            f"File {file_path} checksum verification failed."
-                        )
-                elif file_path.exists() and expected_md5sum is None:
-                    logger.warning(f"Checksum not received for file {file_path}")
-                else:
-                    logger.error(f"Disk synchronization failed for {file_path}")
+            await asyncio.sleep(min(poll_interval, deadline - loop.time()))
+            poll_interval = min(2 * poll_interval, 1.0)
+
+        async def verify(info: dict[str, Any]) -> None:
+            async with checksum_semaphore:
+                await asyncio.to_thread(_verify_file_checksum, info)
+
+        await asyncio.gather(*(verify(info) for info in valid_checksums))
 
     async def _handle_finished_forward_model(self) -> None:
         callback_status, status_msg = await forward_model_ok(
@@ -335,3 +334,21 @@ def log_info_from_exit_file(exit_file_path: Path) -> None:
             *filecontents
         )
     )
+
+
+def _verify_file_checksum(info: dict[str, Any]) -> None:
+    file_path = Path(info["path"])
+    if not file_path.exists():
+        logger.error(f"Disk synchronization failed for {file_path}")
+        return
+    if info.get("sampled_md5sum"):
+        matches = info["sampled_md5sum"] == sampled_md5_checksum(file_path)
+    elif info.get("md5sum"):
+        matches = info["md5sum"] == md5_checksum(file_path)
+    else:
+        logger.warning(f"Checksum not received for file {file_path}")
+        return
+    if matches:
+        logger.debug(f"File {file_path} checksum successful.")
+    else:
+        logger.warning(f"File {file_path} checksum verification failed.")
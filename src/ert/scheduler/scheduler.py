@@ -26,6 +26,8 @@
 
 logger = logging.getLogger(__name__)
 
+_REAP_TIMEOUT = 60.0
+
 
 @dataclass
 class _JobsJson:
@@ -54,6 +56,8 @@ async def sleep_until_we_can_submit(self) -> None:
 
 
 class Scheduler:
+    MAX_CONCURRENT_CHECKSUMS = 4
+
     def __init__(
         self,
         driver: Driver,
@@ -67,8 +71,10 @@ def __init__(
         ens_id: str | None = None,
         ee_uri: str | None = None,
         ee_token: str | None = None,
+        poll_driver: bool = True,
     ) -> None:
         self.driver = driver
+        self._poll_driver = poll_driver
         self._ensemble_evaluator_queue = ensemble_evaluator_queue
         self._manifest_queue = manifest_queue
 
@@ -85,6 +91,11 @@ def __init__(
         self._loop = get_running_loop()
         self._events: asyncio.Queue[Any] = asyncio.Queue()
         self._running: asyncio.Event = asyncio.Event()
+        # Realizations submitted to the driver which it has not yet reported
+        # as finished
+        self._unreaped: set[int] = set()
+        self._all_reaped: asyncio.Event = asyncio.Event()
+        self._all_reaped.set()
 
         self._average_job_runtime: float = 0
         self._completed_jobs_num: int = 0
@@ -102,6 +113,7 @@ def __init__(
         self._ee_token = ee_token
 
         self.checksum: dict[str, dict[str, Any]] = {}
+        self._checksum_received = asyncio.Condition()
 
     def kill_all_jobs(self) -> None:
         assert self._loop
@@ -159,6 +171,51 @@ async def _stop_long_running_jobs(
                             await task
             await asyncio.sleep(0.1)
 
+    def _job_submitted(self, iens: int) -> None:
+        self._unreaped.add(iens)
+        self._all_reaped.clear()
+
+    def _job_reaped(self, iens: int) -> None:
+        self._unreaped.discard(iens)
+        if not self._unreaped:
+            self._all_reaped.set()
+
+    async def _wait_for_jobs_to_be_reaped(self) -> None:
+        """
+        Waits until the driver has reported all submitted jobs as finished,
+        so that no event from this ensemble is left for the next ensemble
+        run on the same driver, which reuses the realization numbers.
+
+        Jobs not reported within _REAP_TIMEOUT are marked as abandoned in the
+        driver. Their events are then dropped by later schedulers, which
+        wait for them before submitting the same realizations again.
+        """
+        try:
+            await asyncio.wait_for(self._all_reaped.wait(), _REAP_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                f"Realizations {sorted(self._unreaped)} were not reported "
+                f"as finished by the driver within {_REAP_TIMEOUT} seconds"
+            )
+            for iens in self._unreaped:
+                self.driver.abandoned_jobs[iens] = asyncio.Event()
+
+    async def _wait_for_abandoned_job(self, iens: int) -> None:
+        """Waits until the job of realization iens abandoned by a previous
+        ensemble is reported as finished, so that none of its events can be
+        taken for the events of the job about to be submitted."""
+        if (reaped := self.driver.abandoned_jobs.get(iens)) is None:
+            return
+        try:
+            await asyncio.wait_for(reaped.wait(), _REAP_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                f"The job of realization {iens} of a previous ensemble was "
+                f"not reported as finished by the driver within {_REAP_TIMEOUT} "
+                "seconds, so its events can not be told apart any longer"
+            )
+            self.driver.abandoned_jobs.pop(iens, None)
+
     def set_realization(self, realization: Realization) -> None:
         self._jobs[realization.iens] = Job(self, realization)
 
@@ -178,8 +235,16 @@ async def _checksum_consumer(self) -> None:
             event = await self._manifest_queue.get()
             if type(event) is ForwardModelStepChecksum:
                 self.checksum.update(event.checksums)
+                async with self._checksum_received:
+                    self._checksum_received.notify_all()
             self._manifest_queue.task_done()
 
+    async def wait_for_checksum(self, runpath: str) -> dict[str, Any]:
+        """Waits until the checksums of the files in runpath are received."""
+        async with self._checksum_received:
+            await self._checksum_received.wait_for(lambda: runpath in self.checksum)
+        return self.checksum[runpath]
+
     async def _publisher(self) -> None:
         if self._ensemble_evaluator_queue is None:
             return
@@ -200,6 +265,18 @@ async def _monitor_and_handle_tasks(
         )
 
         while True:
+            if not self.is_active():
+                if self._ensemble_evaluator_queue is not None:
+                    # if there is a consumer
+                    # we wait till the event queue is processed
+                    await self._events.join()
+                for task in self._job_tasks.values():
+                    if task.cancelled():
+                        continue
+                    if task_exception := task.exception():
+                        raise task_exception
+                return
+
             done, pending = await asyncio.wait(
                 pending,
                 return_when=asyncio.FIRST_COMPLETED,
@@ -221,32 +298,24 @@ async def _monitor_and_handle_tasks(
                         await self._cancel_job_tasks()
                         raise task_exception
 
-            if not self.is_active():
-                if self._ensemble_evaluator_queue is not None:
-                    # if there is a consumer
-                    # we wait till the event queue is processed
-                    await self._events.join()
-                for task in self._job_tasks.values():
-                    if task.cancelled():
-                        continue
-                    if task_exception := task.exception():
-                        raise task_exception
-                return
-
     async def execute(
         self,
         min_required_realizations: int = 0,
     ) -> Id.ENSEMBLE_SUCCEEDED_TYPE | Id.ENSEMBLE_CANCELLED_TYPE:
+        process_event_queue_task = asyncio.create_task(
+            self._process_event_queue(), name="process_event_queue_task"
+        )
         scheduling_tasks = [
             asyncio.create_task(self._publisher(), name="publisher_task"),
-            asyncio.create_task(
-                self._process_event_queue(), name="process_event_queue_task"
-            ),
-            asyncio.create_task(self.driver.poll(), name="poll_task"),
+            process_event_queue_task,
             asyncio.create_task(
                 self._checksum_consumer(), name="checksum_consumer_task"
             ),
         ]
+        if self._poll_driver:
+            scheduling_tasks.append(
+                asyncio.create_task(self.driver.poll(), name="poll_task")
+            )
 
         if min_required_realizations > 0:
             scheduling_tasks.append(
@@ -260,7 +329,10 @@ async def execute(
         # this lock is to assure that no more than 1 task
         # does internalization at a time
         forward_model_ok_lock = asyncio.Lock()
-        verify_checksum_lock = asyncio.Lock()
+        # bounds the number of files having their checksum verified at a time
+        verify_checksum_semaphore = asyncio.BoundedSemaphore(
+            self.MAX_CONCURRENT_CHECKSUMS
+        )
         for iens, job in self._jobs.items():
             await asyncio.sleep(0)
             if job.state != JobState.ABORTED:
@@ -268,7 +340,7 @@ async def execute(
                     job.run(
                         sem,
                         forward_model_ok_lock,
-                        verify_checksum_lock,
+                        verify_checksum_semaphore,
                         self._max_submit,
                     ),
                     name=f"job-{iens}_task",
@@ -292,6 +364,10 @@ async def execute(
             await self._monitor_and_handle_tasks(scheduling_tasks)
             await self.driver.finish()
         finally:
+            if not self._poll_driver and not process_event_queue_task.done():
+                # The driver is shared with later ensembles, so the events of
+                # killed jobs must be processed before returning
+                await self._wait_for_jobs_to_be_reaped()
             for scheduling_task in scheduling_tasks:
                 scheduling_task.cancel()
             # We discard exceptions when cancelling the scheduling tasks
@@ -309,6 +385,14 @@ async def execute(
     async def _process_event_queue(self) -> None:
         while True:
             event = await self.driver.event_queue.get()
+            if event.iens in self.driver.abandoned_jobs:
+                if isinstance(event, FinishedEvent):
+                    self.driver.abandoned_jobs.pop(event.iens).set()
+                logger.debug(f"Ignoring event of abandoned job: {event}")
+                continue
+            if event.iens not in self._jobs:
+                logger.debug(f"Ignoring event for unknown realization: {event}")
+                continue
             job = self._jobs[event.iens]
 
             # Any event implies the job has at least started
@@ -317,6 +401,9 @@ async def _process_event_queue(self) -> None:
             if isinstance(event, StartedEvent | FinishedEvent) and event.exec_hosts:
                 self._jobs[event.iens].exec_hosts = event.exec_hosts
 
+            if isinstance(event, FinishedEvent):
+                self._job_reaped(event.iens)
+
             if (
                 isinstance(event, FinishedEvent)
                 and not self._cancelled
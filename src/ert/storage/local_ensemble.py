@@ -16,10 +16,13 @@
 from pydantic import BaseModel
 from typing_extensions import deprecated
 
+from ert.config.field import Field
 from ert.config.gen_kw_config import GenKwConfig
+from ert.config.surface_config import SurfaceConfig
 from ert.storage.mode import BaseMode, Mode, require_write
 
 from .realization_storage_state import RealizationStorageState
+from .statistics import parameter_statistics
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -343,6 +346,7 @@ def set_failure(
         self._storage._write_transaction(
             filename, error.model_dump_json().encode("utf-8")
         )
+        self._storage._notify_changed(ensemble_id=self.id)
 
     def unset_failure(
         self,
@@ -351,6 +355,7 @@ def unset_failure(
         filename: Path = self._realization_dir(realization) / self._error_log_name
         if filename.exists():
             filename.unlink()
+            self._storage._notify_changed(ensemble_id=self.id)
 
     def has_failure(self, realization: int) -> bool:
         """
@@ -395,6 +400,7 @@ def get_failure(self, realization: int) -> _Failure | None:
     def refresh_ensemble_state(self) -> None:
         self.get_ensemble_state.cache_clear()
         self.get_ensemble_state()
+        self._storage.flush()
 
     @lru_cache  # noqa: B019
     def get_ensemble_state(self) -> list[set[RealizationStorageState]]:
@@ -560,6 +566,35 @@ def load_parameters(
 
         return self._load_dataset(group, realizations)
 
+    def load_parameter_values(
+        self, group: str, realization: int
+    ) -> npt.NDArray[np.floating]:
+        """
+        Load the values of a parameter group for a single realization.
+
+        FIELD and SURFACE parameters configured with MEMORY_MAP are memory
+        mapped from their raw mirror, so only the parts of the array that are
+        accessed are read from disk. Other parameters, and parameters saved
+        without a mirror, are read from the dataset.
+
+        Parameters
+        ----------
+        group : str
+            Name of parameter group to load.
+        realization : int
+            Realization index to load.
+
+        Returns
+        -------
+        values : ndarray
+            Read-only array with the 'values' of the parameter group.
+        """
+        path = self._realization_dir(realization) / f"{_escape_filename(group)}.npy"
+        try:
+            return np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return self.load_parameters(group, realization)["values"].values
+
     def load_cross_correlations(self) -> xr.Dataset:
         input_path = self.mount_point / "corr_XY.nc"
 
@@ -627,6 +662,29 @@ def load_responses(
 
         return self._load_responses_lazy(key, realizations).collect()
 
+    def scan_responses(
+        self, key: str, realizations: tuple[int, ...]
+    ) -> polars.LazyFrame:
+        """Lazily scan responses for key and realizations.
+
+        Filters and column selections applied to the returned LazyFrame are
+        pushed down into the parquet scan, so only the requested data is read.
+
+        Parameters
+        ----------
+        key : str
+            Response key or response type to scan.
+        realizations : tuple of int
+            Realization indices to scan.
+
+        Returns
+        -------
+        responses : LazyFrame
+            Polars LazyFrame over the responses.
+        """
+
+        return self._load_responses_lazy(key, realizations)
+
     def _load_responses_lazy(
         self, key: str, realizations: tuple[int, ...]
     ) -> polars.LazyFrame:
@@ -789,7 +847,7 @@ def load_all_gen_kw_data(
     def save_parameters(
         self,
         group: str,
-        realization: int,
+        realization: int | npt.NDArray[np.int_],
         dataset: xr.Dataset,
     ) -> None:
         """
@@ -817,13 +875,27 @@ def save_parameters(
         if group not in self.experiment.parameter_configuration:
             raise ValueError(f"{group} is not registered to the experiment.")
 
-        path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
-        path.parent.mkdir(exist_ok=True)
-        if "realizations" in dataset.dims:
-            data_to_save = dataset.sel(realizations=[realization])
-        else:
-            data_to_save = dataset.expand_dims(realizations=[realization])
-        self._storage._to_netcdf_transaction(path, data_to_save)
+        # FIELD and SURFACE values configured with MEMORY_MAP are mirrored as
+        # raw .npy arrays, so that single realizations can be memory mapped,
+        # see load_parameter_values
+        config = self.experiment.parameter_configuration[group]
+        mirrored = isinstance(config, Field | SurfaceConfig)
+        for real in np.atleast_1d(realization).tolist():
+            path = self._realization_dir(real) / f"{_escape_filename(group)}.nc"
+            path.parent.mkdir(exist_ok=True)
+            if "realizations" in dataset.dims:
+                data_to_save = dataset.sel(realizations=[real])
+            else:
+                data_to_save = dataset.expand_dims(realizations=[real])
+            if mirrored:
+                path.with_suffix(".npy").unlink(missing_ok=True)
+            self._storage._to_netcdf_transaction(path, data_to_save)
+            if mirrored and config.memory_map:
+                self._storage._to_npy_transaction(
+                    path.with_suffix(".npy"),
+                    data_to_save["values"].isel(realizations=0).values,
+                )
+        self._storage._notify_changed(ensemble_id=self.id)
 
     @require_write
     def save_response(
@@ -871,13 +943,21 @@ def save_response(
         if not self.experiment._has_finalized_response_keys(response_type):
             response_keys = data["response_key"].unique().to_list()
             self.experiment._update_response_keys(response_type, response_keys)
+        self._storage._notify_changed(ensemble_id=self.id)
 
     def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
         if parameter_group not in self.experiment.parameter_configuration:
             raise ValueError(f"{parameter_group} is not registered to the experiment.")
 
-        ds = self.load_parameters(parameter_group)
-        return ds.std("realizations")
+        statistics = parameter_statistics(self, parameter_group)
+        return xr.Dataset(
+            {"values": (statistics.dims, statistics.std())},
+            coords={
+                name: values
+                for name, values in statistics.coords.items()
+                if name in statistics.dims
+            },
+        )
 
     def get_parameter_state(
         self, realization: int
@@ -10,6 +10,7 @@
 
 import numpy as np
 import polars
+import xarray as xr
 import xtgeo
 from pydantic import BaseModel
 
@@ -49,6 +50,7 @@ class LocalExperiment(BaseMode):
     _parameter_file = Path("parameter.json")
     _responses_file = Path("responses.json")
     _metadata_file = Path("metadata.json")
+    _sies_state_file = Path("sies_state.nc")
 
     def __init__(
         self,
@@ -282,6 +284,36 @@ def get_surface(self, name: str) -> xtgeo.RegularSurface:
             dtype=np.float32,
         )
 
+    @require_write
+    def save_sies_state(self, state: xr.Dataset) -> None:
+        """
+        Save the state of the iterated ensemble smoother of this experiment,
+        replacing any previously saved state.
+
+        Parameters
+        ----------
+        state : Dataset
+            The smoother state, as created by the analysis.
+        """
+        self._storage._to_netcdf_transaction(
+            self.mount_point / self._sies_state_file, state
+        )
+
+    def load_sies_state(self) -> xr.Dataset:
+        """
+        Load the state of the iterated ensemble smoother of this experiment.
+
+        Returns
+        -------
+        state : Dataset
+            The last saved smoother state.
+        """
+        path = self.mount_point / self._sies_state_file
+        if not path.exists():
+            raise FileNotFoundError(f"No iterated ensemble smoother state at '{path}'")
+        with xr.open_dataset(path, engine="scipy") as state:
+            return state.load()
+
     @cached_property
     def parameter_configuration(self) -> dict[str, ParameterConfig]:
         params = {}
@@ -394,3 +426,5 @@ def _update_response_keys(
 
         if self.response_type_to_response_keys is not None:
             del self.response_type_to_response_keys
+
+        self._storage._notify_changed(experiment_id=self.id)
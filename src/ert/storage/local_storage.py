@@ -5,6 +5,7 @@
 import logging
 import os
 import shutil
+import threading
 from collections.abc import Generator, MutableSequence
 from datetime import datetime
 from functools import cached_property
@@ -12,9 +13,10 @@
 from tempfile import NamedTemporaryFile
 from textwrap import dedent
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+import numpy as np
 import polars
 import xarray as xr
 from filelock import FileLock, Timeout
@@ -27,6 +29,9 @@
 from ert.storage.mode import BaseMode, Mode, require_write
 from ert.storage.realization_storage_state import RealizationStorageState
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 logger = logging.getLogger(__name__)
 
 _LOCAL_STORAGE_VERSION = 9
@@ -44,6 +49,17 @@ class _Index(BaseModel):
     migrations: MutableSequence[_Migrations] = Field(default_factory=list)
 
 
+class _Generations(BaseModel):
+    """
+    Counter which is increased by every change to the storage, together with
+    the value it had when each experiment and ensemble was last changed.
+    """
+
+    generation: int = 0
+    experiments: dict[UUID, int] = Field(default_factory=dict)
+    ensembles: dict[UUID, int] = Field(default_factory=dict)
+
+
 class LocalStorage(BaseMode):
     """
     A class representing the local storage for ERT experiments and ensembles.
@@ -58,6 +74,9 @@ class LocalStorage(BaseMode):
     EXPERIMENTS_PATH = "experiments"
     ENSEMBLES_PATH = "ensembles"
     SWAP_PATH = "swp"
+    GENERATIONS_FILE = "generations.json"
+    # Seconds changes may wait before they are written to the generations file
+    GENERATIONS_FLUSH_INTERVAL = 1.0
 
     def __init__(
         self,
@@ -85,6 +104,10 @@ def __init__(
         self._experiments: dict[UUID, LocalExperiment]
         self._ensembles: dict[UUID, LocalEnsemble]
         self._index: _Index
+        self._generations: _Generations
+        self._generations_lock = threading.Lock()
+        self._generations_changed = False
+        self._flush_timer: threading.Timer | None = None
 
         try:
             version = _storage_version(self.path)
@@ -127,6 +150,8 @@ def refresh(self) -> None:
         accessed.
         """
 
+        self.flush()
+        self._generations = self._load_generations()
         self._index = self._load_index()
         self._ensembles = self._load_ensembles()
         self._experiments = self._load_experiments()
@@ -134,6 +159,71 @@ def refresh(self) -> None:
         for ens in self._ensembles.values():
             ens.refresh_ensemble_state()
 
+    def refresh_if_changed(self) -> bool:
+        """
+        Reloads the experiments and ensembles which have been changed since
+        the storage was last refreshed.
+
+        Every change to the storage increases a generation counter, so when
+        nothing has changed only the small generations file is read.
+
+        Returns
+        -------
+        changed : bool
+            True if anything was reloaded.
+        """
+
+        generations = self._load_generations()
+        if generations.generation == self._generations.generation:
+            return False
+        if generations.generation < self._generations.generation:
+            # The storage has been replaced, so the generations can not be
+            # compared
+            self.refresh()
+            return True
+
+        previous = self._generations
+        self._generations = generations
+        changed_experiments = {
+            exp_id
+            for exp_id, generation in generations.experiments.items()
+            if generation > previous.experiments.get(exp_id, -1)
+        }
+        changed_ensembles = {
+            ens_id
+            for ens_id, generation in generations.ensembles.items()
+            if generation > previous.ensembles.get(ens_id, -1)
+        }
+
+        new_ensembles = [
+            self._load_ensemble(self._ensemble_path(ens_id))
+            for ens_id in changed_ensembles - self._ensembles.keys()
+        ]
+        if any(ens is not None for ens in new_ensembles):
+            self._ensembles = self._sort_ensembles(
+                [
+                    *self._ensembles.values(),
+                    *(ens for ens in new_ensembles if ens is not None),
+                ]
+            )
+
+        for ens in self._ensembles.values():
+            if ens.experiment_id in changed_experiments or (
+                ens.experiment_id not in self._experiments
+            ):
+                self._experiments[ens.experiment_id] = LocalExperiment(
+                    self, self._experiment_path(ens.experiment_id), self.mode
+                )
+                changed_experiments.discard(ens.experiment_id)
+        for exp_id in changed_experiments & self._experiments.keys():
+            self._experiments[exp_id] = LocalExperiment(
+                self, self._experiment_path(exp_id), self.mode
+            )
+
+        for ens_id in changed_ensembles & self._ensembles.keys():
+            self._ensembles[ens_id].refresh_ensemble_state()
+        return True
+
     def get_experiment(self, uuid: UUID) -> LocalExperiment:
         """
         Retrieves an experiment by UUID.
@@ -205,19 +295,82 @@ def _load_index(self) -> _Index:
         except FileNotFoundError:
             return _Index()
 
-    def _load_ensembles(self) -> dict[UUID, LocalEnsemble]:
-        if not (self.path / "ensembles").exists():
-            return {}
-        ensembles: list[LocalEnsemble] = []
-        for ensemble_path in (self.path / "ensembles").iterdir():
-            try:
-                ensemble = LocalEnsemble(self, ensemble_path, self.mode)
-                ensembles.append(ensemble)
-            except FileNotFoundError:
-                logger.exception(
-                    "Failed to load an ensemble from path: %s", ensemble_path
+    def _load_generations(self) -> _Generations:
+        try:
+            return _Generations.model_validate_json(
+                (self.path / self.GENERATIONS_FILE).read_text(encoding="utf-8")
+            )
+        except FileNotFoundError:
+            return _Generations()
+
+    def _notify_changed(
+        self,
+        *,
+        experiment_id: UUID | None = None,
+        ensemble_id: UUID | None = None,
+        save: bool = False,
+    ) -> None:
+        """
+        Increases the generation of the storage, marking the given experiment
+        and/or ensemble as changed for readers using refresh_if_changed.
+
+        Unless save is True, the generations are written by flush at most
+        GENERATIONS_FLUSH_INTERVAL seconds later, or when an ensemble
+        operation is done, e.g. in LocalEnsemble.refresh_ensemble_state after
+        the realizations have been internalized. So readers see realizations
+        finish while an ensemble runs, without the file being rewritten for
+        each saved realization.
+        """
+
+        if not self.can_write:
+            return
+        with self._generations_lock:
+            self._generations.generation += 1
+            if experiment_id is not None:
+                self._generations.experiments[experiment_id] = (
+                    self._generations.generation
                 )
-                continue
+            if ensemble_id is not None:
+                self._generations.ensembles[ensemble_id] = self._generations.generation
+            self._generations_changed = True
+            if not save and self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.GENERATIONS_FLUSH_INTERVAL, self.flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if save:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the changes marked by _notify_changed, so that readers using
+        refresh_if_changed see them.
+        """
+
+        if not self.can_write:
+            return
+        with self._generations_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._generations_changed:
+                return
+            self._write_transaction(
+                self.path / self.GENERATIONS_FILE,
+                self._generations.model_dump_json().encode("utf-8"),
+            )
+            self._generations_changed = False
+
+    def _load_ensemble(self, ensemble_path: Path) -> LocalEnsemble | None:
+        try:
+            return LocalEnsemble(self, ensemble_path, self.mode)
+        except FileNotFoundError:
+            logger.exception("Failed to load an ensemble from path: %s", ensemble_path)
+            return None
+
+    @staticmethod
+    def _sort_ensembles(ensembles: list[LocalEnsemble]) -> dict[UUID, LocalEnsemble]:
         # Make sure that the ensembles are sorted by name in reverse. Given
         # multiple ensembles with a common name, iterating over the ensemble
         # dictionary will yield the newest ensemble first.
@@ -225,6 +378,16 @@ def _load_ensembles(self) -> dict[UUID, LocalEnsemble]:
             x.id: x for x in sorted(ensembles, key=lambda x: x.started_at, reverse=True)
         }
 
+    def _load_ensembles(self) -> dict[UUID, LocalEnsemble]:
+        if not (self.path / "ensembles").exists():
+            return {}
+        ensembles = [
+            ensemble
+            for ensemble_path in (self.path / "ensembles").iterdir()
+            if (ensemble := self._load_ensemble(ensemble_path)) is not None
+        ]
+        return self._sort_ensembles(ensembles)
+
     def _load_experiments(self) -> dict[UUID, LocalExperiment]:
         experiment_ids = {ens.experiment_id for ens in self._ensembles.values()}
         return {
@@ -288,6 +451,7 @@ def close(self) -> None:
         if not self.can_write:
             return
 
+        self.flush()
         self._save_index()
         self._release_lock()
 
@@ -343,6 +507,7 @@ def create_experiment(
         )
 
         self._experiments[exp.id] = exp
+        self._notify_changed(experiment_id=exp.id, save=True)
         return exp
 
     @require_write
@@ -423,6 +588,7 @@ def create_ensemble(
                     )
 
         self._ensembles[ens.id] = ens
+        self._notify_changed(ensemble_id=ens.id, save=True)
         return ens
 
     @require_write
@@ -572,6 +738,21 @@ def _to_netcdf_transaction(
             dataset.to_netcdf(f, engine="scipy")
             os.rename(f.name, filename)
 
+    def _to_npy_transaction(
+        self, filename: str | os.PathLike[str], array: npt.NDArray[Any]
+    ) -> None:
+        """
+        Writes the array in little-endian .npy format to the filename as a
+        transaction.
+
+        Guarantees to not leave half-written or empty files on disk if the write
+        fails or the process is killed.
+        """
+        self._swap_path.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=self._swap_path, delete=False) as f:
+            np.save(f, array.astype(array.dtype.newbyteorder("<"), copy=False))
+            os.rename(f.name, filename)
+
     def _to_parquet_transaction(
         self, filename: str | os.PathLike[str], dataframe: polars.DataFrame
     ) -> None:
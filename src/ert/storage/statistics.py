@@ -0,0 +1,435 @@
+"""
+Streaming ensemble statistics for parameters and responses.
+
+The functions in this module visit one realization at a time and fold its
+values into online accumulators, so the memory needed is proportional to the
+size of a single realization rather than to the whole ensemble. Mean and
+variance are accumulated with Welford's algorithm, quantiles are estimated
+with the P² algorithm of Jain and Chlamtac, and histograms are counted
+against fixed bin edges. Missing values (NaN) are ignored element-wise.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars
+import xarray as xr
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from ert.storage.local_ensemble import LocalEnsemble
+
+
+@dataclass
+class EnsembleStatistics:
+    """Element-wise statistics over the realizations of an ensemble.
+
+    All arrays have the shape of a single realization, given by ``dims``,
+    except ``histogram`` which has an additional leading bin axis.
+    """
+
+    dims: tuple[str, ...]
+    coords: dict[str, npt.NDArray[np.generic]]
+    count: npt.NDArray[np.int64]
+    mean: npt.NDArray[np.float64]
+    variance: npt.NDArray[np.float64]
+    minimum: npt.NDArray[np.float64]
+    maximum: npt.NDArray[np.float64]
+    quantiles: dict[float, npt.NDArray[np.float64]] = field(default_factory=dict)
+    histogram: npt.NDArray[np.int64] | None = None
+    bin_edges: npt.NDArray[np.float64] | None = None
+
+    def std(self, ddof: int = 0) -> npt.NDArray[np.float64]:
+        """Standard deviation with ``ddof`` delta degrees of freedom."""
+        if ddof == 0:
+            return np.sqrt(self.variance)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(
+                self.count > ddof, self.count / (self.count - ddof), np.nan
+            )
+        return np.sqrt(self.variance * scale)
+
+    def to_dataset(self) -> xr.Dataset:
+        data_vars: dict[str, tuple[Sequence[str], npt.NDArray[np.generic]]] = {
+            "count": (self.dims, self.count),
+            "mean": (self.dims, self.mean),
+            "std": (self.dims, self.std()),
+            "min": (self.dims, self.minimum),
+            "max": (self.dims, self.maximum),
+        }
+        coords: dict[str, tuple[Sequence[str], npt.NDArray[np.generic]]] = {
+            name: (
+                (name if name in self.dims else self.dims[0]),
+                values.astype("datetime64[ns]") if values.dtype.kind == "M" else values,
+            )
+            for name, values in self.coords.items()
+        }
+        if self.quantiles:
+            data_vars["quantiles"] = (
+                ("quantile", *self.dims),
+                np.stack(list(self.quantiles.values())),
+            )
+            coords["quantile"] = (("quantile",), np.array(list(self.quantiles)))
+        if self.histogram is not None and self.bin_edges is not None:
+            data_vars["histogram"] = (("bin", *self.dims), self.histogram)
+            coords["bin_edges"] = (("bin_edge",), self.bin_edges)
+        return xr.Dataset(data_vars, coords=coords)
+
+
+class _P2Quantile:
+    """Vectorized P² estimator of a single quantile for many elements.
+
+    The five marker heights and positions are kept as arrays of shape
+    (5, n_elements). Markers are initialized from the first five valid
+    observations of each element, which the caller keeps in its buffer.
+    """
+
+    def __init__(self, p: float, size: int) -> None:
+        self.p = p
+        self.heights = np.zeros((5, size))
+        self.positions = np.tile(np.arange(5, dtype=np.float64)[:, None], (1, size))
+        self.desired = np.tile(
+            np.array([0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0])[:, None], (1, size)
+        )
+        self.increments = np.array([0.0, p / 2, p, (1 + p) / 2, 1.0])[:, None]
+
+    def initialize(
+        self, mask: npt.NDArray[np.bool_], first_values: npt.NDArray[np.float64]
+    ) -> None:
+        self.heights[:, mask] = np.sort(first_values, axis=0)
+
+    def add(self, x: npt.NDArray[np.float64], mask: npt.NDArray[np.bool_]) -> None:
+        q = self.heights[:, mask]
+        n = self.positions[:, mask]
+        x = x[mask]
+
+        cell = (x[None, :] >= q[1:4]).sum(axis=0)
+        q[0] = np.minimum(q[0], x)
+        q[4] = np.maximum(q[4], x)
+        n += np.arange(5)[:, None] > cell[None, :]
+        desired = self.desired[:, mask] + self.increments
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            adjust = ((d >= 1) & (n[i + 1] - n[i] > 1)) | (
+                (d <= -1) & (n[i - 1] - n[i] < -1)
+            )
+            if not adjust.any():
+                continue
+            step = np.sign(d)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                parabolic = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                neighbour_q = np.where(step > 0, q[i + 1], q[i - 1])
+                neighbour_n = np.where(step > 0, n[i + 1], n[i - 1])
+                linear = q[i] + step * (neighbour_q - q[i]) / (neighbour_n - n[i])
+            inside = (q[i - 1] < parabolic) & (parabolic < q[i + 1])
+            q[i] = np.where(adjust, np.where(inside, parabolic, linear), q[i])
+            n[i] = np.where(adjust, n[i] + step, n[i])
+
+        self.heights[:, mask] = q
+        self.positions[:, mask] = n
+        self.desired[:, mask] = desired
+
+    @property
+    def estimate(self) -> npt.NDArray[np.float64]:
+        return self.heights[2]
+
+
+class StatisticsAccumulator:
+    """Accumulates element-wise statistics one realization at a time."""
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        quantiles: Sequence[float] = (),
+        bin_edges: npt.ArrayLike | None = None,
+    ) -> None:
+        if any(not 0.0 <= p <= 1.0 for p in quantiles):
+            raise ValueError(f"Quantiles must be in the range [0, 1], got {quantiles}")
+        self.shape = shape
+        size = int(np.prod(shape, dtype=np.int64))
+        self._count = np.zeros(size, dtype=np.int64)
+        self._mean = np.zeros(size)
+        self._m2 = np.zeros(size)
+        self._min = np.full(size, np.inf)
+        self._max = np.full(size, -np.inf)
+
+        self._quantiles = [_P2Quantile(p, size) for p in quantiles]
+        self._first_values = np.full((5, size), np.nan) if quantiles else None
+
+        self._bin_edges: npt.NDArray[np.float64] | None = None
+        self._histogram: npt.NDArray[np.int64] | None = None
+        if bin_edges is not None:
+            self._bin_edges = np.asarray(bin_edges, dtype=np.float64)
+            if self._bin_edges.ndim != 1 or len(self._bin_edges) < 2:
+                raise ValueError("bin_edges must be a 1D array with at least 2 edges")
+            if np.any(np.diff(self._bin_edges) < 0):
+                raise ValueError("bin_edges must be monotonically increasing")
+            self._histogram = np.zeros((len(self._bin_edges) - 1, size), dtype=np.int64)
+
+    def add(self, values: npt.ArrayLike) -> None:
+        x = np.asarray(values, dtype=np.float64)
+        if x.shape != self.shape:
+            raise ValueError(
+                f"Expected values of shape {self.shape}, got shape {x.shape}"
+            )
+        x = x.ravel()
+        valid = ~np.isnan(x)
+        previous_count = self._count.copy()
+        self._count += valid
+
+        delta = np.where(valid, x - self._mean, 0.0)
+        self._mean += delta / np.maximum(self._count, 1)
+        self._m2 += np.where(valid, delta * (x - self._mean), 0.0)
+        self._min = np.fmin(self._min, x)
+        self._max = np.fmax(self._max, x)
+
+        if self._first_values is not None:
+            buffering = valid & (previous_count < 5)
+            index = np.flatnonzero(buffering)
+            self._first_values[previous_count[index], index] = x[index]
+            started = buffering & (self._count == 5)
+            updating = valid & (previous_count >= 5)
+            for estimator in self._quantiles:
+                if started.any():
+                    estimator.initialize(started, self._first_values[:, started])
+                if updating.any():
+                    estimator.add(x, updating)
+
+        if self._histogram is not None and self._bin_edges is not None:
+            nbins = len(self._bin_edges) - 1
+            bins = np.searchsorted(self._bin_edges, x, side="right") - 1
+            bins[x == self._bin_edges[-1]] = nbins - 1
+            inside = valid & (bins >= 0) & (bins < nbins)
+            np.add.at(self._histogram, (bins[inside], np.flatnonzero(inside)), 1)
+
+    def result(
+        self,
+        dims: tuple[str, ...] = (),
+        coords: dict[str, npt.NDArray[np.generic]] | None = None,
+    ) -> EnsembleStatistics:
+        empty = self._count == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(empty, np.nan, self._m2 / self._count)
+
+        quantiles: dict[float, npt.NDArray[np.float64]] = {}
+        if self._first_values is not None:
+            few = self._count <= 5
+            for estimator in self._quantiles:
+                estimate = estimator.estimate.copy()
+                if few.any():
+                    with warnings.catch_warnings():
+                        # Elements without any values give all-NaN slices
+                        warnings.simplefilter("ignore", RuntimeWarning)
+                        estimate[few] = np.nanquantile(
+                            self._first_values[:, few], estimator.p, axis=0
+                        )
+                quantiles[estimator.p] = estimate.reshape(self.shape)
+
+        return EnsembleStatistics(
+            dims=dims,
+            coords=coords or {},
+            count=self._count.reshape(self.shape),
+            mean=np.where(empty, np.nan, self._mean).reshape(self.shape),
+            variance=variance.reshape(self.shape),
+            minimum=np.where(empty, np.nan, self._min).reshape(self.shape),
+            maximum=np.where(empty, np.nan, self._max).reshape(self.shape),
+            quantiles=quantiles,
+            histogram=None
+            if self._histogram is None
+            else self._histogram.reshape((-1, *self.shape)),
+            bin_edges=self._bin_edges,
+        )
+
+
+def _realizations_to_visit(
+    ensemble: LocalEnsemble, realizations: Iterable[int] | None
+) -> tuple[list[int], bool]:
+    if realizations is None:
+        return list(range(ensemble.ensemble_size)), True
+    return [int(r) for r in realizations], False
+
+
+def parameter_statistics(
+    ensemble: LocalEnsemble,
+    group: str,
+    realizations: Iterable[int] | None = None,
+    quantiles: Sequence[float] = (),
+    bin_edges: npt.ArrayLike | None = None,
+    variable: str = "values",
+) -> EnsembleStatistics:
+    """
+    Compute statistics of a parameter group, one realization at a time.
+
+    Parameters
+    ----------
+    ensemble : LocalEnsemble
+        Ensemble to read parameters from.
+    group : str
+        Name of the parameter group.
+    realizations : iterable of int, optional
+        Realizations to include. If None, every realization with the
+        parameter group in storage is included.
+    quantiles : sequence of float
+        Quantiles to estimate, each in the range [0, 1].
+    bin_edges : array_like, optional
+        Edges of the histogram bins. No histogram is made if None.
+    variable : str
+        Variable of the parameter dataset to compute statistics for.
+
+    Returns
+    -------
+    statistics : EnsembleStatistics
+        Statistics with the dimensions of the parameter group.
+    """
+    if group not in ensemble.experiment.parameter_configuration:
+        raise ValueError(f"{group} is not registered to the experiment.")
+
+    to_visit, skip_missing = _realizations_to_visit(ensemble, realizations)
+    accumulator: StatisticsAccumulator | None = None
+    dims: tuple[str, ...] = ()
+    coords: dict[str, npt.NDArray[np.generic]] = {}
+    for realization in to_visit:
+        try:
+            dataset = ensemble.load_parameters(group, realization)
+        except KeyError:
+            if skip_missing:
+                continue
+            raise
+        with dataset:
+            data = dataset[variable]
+            if accumulator is None:
+                dims = tuple(str(d) for d in data.dims)
+                coords = {str(k): v.values for k, v in data.coords.items()}
+                accumulator = StatisticsAccumulator(data.shape, quantiles, bin_edges)
+            accumulator.add(data.values)
+
+    if accumulator is None:
+        raise KeyError(f"No dataset '{group}' in storage for any realization")
+    return accumulator.result(dims, coords)
+
+
+def response_statistics(
+    ensemble: LocalEnsemble,
+    key: str,
+    realizations: Iterable[int] | None = None,
+    quantiles: Sequence[float] = (),
+    bin_edges: npt.ArrayLike | None = None,
+) -> EnsembleStatistics:
+    """
+    Compute statistics of a response, one realization at a time.
+
+    Responses are aligned on the response key and the primary key of the
+    response type, using the index of the first realization read. Values that
+    a realization lacks for that index are treated as missing.
+
+    Parameters
+    ----------
+    ensemble : LocalEnsemble
+        Ensemble to read responses from.
+    key : str
+        Response key, or response type to include all of its keys.
+    realizations : iterable of int, optional
+        Realizations to include. If None, every realization with the
+        response in storage is included.
+    quantiles : sequence of float
+        Quantiles to estimate, each in the range [0, 1].
+    bin_edges : array_like, optional
+        Edges of the histogram bins. No histogram is made if None.
+
+    Returns
+    -------
+    statistics : EnsembleStatistics
+        Statistics along a single "index" dimension, with one coordinate
+        per primary key column.
+    """
+    experiment = ensemble.experiment
+    response_type = experiment.response_key_to_response_type.get(key, key)
+    if response_type not in experiment.response_configuration:
+        raise ValueError(f"{key} is not a response")
+    index_columns = [
+        "response_key",
+        *experiment.response_configuration[response_type].primary_key,
+    ]
+
+    to_visit, skip_missing = _realizations_to_visit(ensemble, realizations)
+    accumulator: StatisticsAccumulator | None = None
+    index: polars.DataFrame | None = None
+    for realization in to_visit:
+        try:
+            df = ensemble.load_responses(key, (realization,))
+        except KeyError:
+            if skip_missing:
+                continue
+            raise
+        if df.is_empty():
+            continue
+        df = df.select([*index_columns, "values"]).sort(index_columns)
+        if index is None:
+            index = df.select(index_columns)
+            accumulator = StatisticsAccumulator((index.height,), quantiles, bin_edges)
+        if df.height == index.height and df.select(index_columns).equals(index):
+            values = df["values"]
+        else:
+            values = index.join(
+                df, on=index_columns, how="left", maintain_order="left"
+            )["values"]
+        assert accumulator is not None
+        accumulator.add(values.cast(polars.Float64).fill_null(np.nan).to_numpy())
+
+    if accumulator is None or index is None:
+        raise KeyError(f"No response for key {key} in any realization")
+    return accumulator.result(
+        ("index",), {column: index[column].to_numpy() for column in index_columns}
+    )
+
+
+def ensemble_statistics(
+    ensemble: LocalEnsemble,
+    keys: Iterable[str],
+    realizations: Iterable[int] | None = None,
+    quantiles: Sequence[float] = (),
+    bin_edges: npt.ArrayLike | None = None,
+    max_workers: int | None = None,
+) -> dict[str, EnsembleStatistics]:
+    """
+    Compute statistics of several parameter groups and response keys.
+
+    Each key is handled by its own worker thread, so groups are read and
+    reduced in parallel. Keys are looked up first among the parameter groups
+    and then among the responses of the experiment.
+    """
+    keys = list(keys)
+    parameters = ensemble.experiment.parameter_configuration
+    response_types = ensemble.experiment.response_configuration
+    response_keys = ensemble.experiment.response_key_to_response_type
+    for key in keys:
+        if (
+            key not in parameters
+            and key not in response_keys
+            and key not in response_types
+        ):
+            raise ValueError(f"{key} is neither a parameter group nor a response")
+
+    if realizations is not None:
+        realizations = list(realizations)
+
+    def compute(key: str) -> EnsembleStatistics:
+        if key in parameters:
+            return parameter_statistics(
+                ensemble, key, realizations, quantiles, bin_edges
+            )
+        return response_statistics(ensemble, key, realizations, quantiles, bin_edges)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(keys, executor.map(compute, keys), strict=True))
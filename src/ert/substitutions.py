@@ -13,7 +13,7 @@
 _PATTERN = re.compile(r"<[^<>]+>")
 
 
-from collections import UserDict
+from collections import ChainMap, UserDict
 
 
 class Substitutions(UserDict[str, str]):
@@ -35,13 +35,15 @@ def substitute(
     def substitute_real_iter(
         self, to_substitute: str, realization: int, iteration: int
     ) -> str:
-        copy_substituter = self.copy()
+        real_iter_substitutions = {
+            "<IENS>": str(realization),
+            "<ITER>": str(iteration),
+        }
         geo_id_key = f"<GEO_ID_{realization}_{iteration}>"
         if geo_id_key in self:
-            copy_substituter["<GEO_ID>"] = self[geo_id_key]
-        copy_substituter["<IENS>"] = str(realization)
-        copy_substituter["<ITER>"] = str(iteration)
-        return copy_substituter.substitute(to_substitute)
+            real_iter_substitutions["<GEO_ID>"] = self[geo_id_key]
+        # Layered over the substitutions instead of copying them
+        return _substitute(ChainMap(real_iter_substitutions, self.data), to_substitute)
 
     def _concise_representation(self) -> str:
         return (
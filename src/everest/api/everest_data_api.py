@@ -1,9 +1,10 @@
 from collections import OrderedDict
+from typing import Self
 
 import polars as pl
 from seba_sqlite.snapshot import SebaSnapshot
 
-from ert.storage import open_storage
+from ert.storage import Storage, open_storage
 from everest.config import EverestConfig, ServerConfig
 from everest.detached import ServerStatus, everserver_status
 
@@ -13,6 +14,26 @@ def __init__(self, config: EverestConfig, filter_out_gradient=True):
         self._config = config
         output_folder = config.optimization_output_dir
         self._snapshot = SebaSnapshot(output_folder).get_snapshot(filter_out_gradient)
+        self._storage: Storage | None = None
+
+    def _get_storage(self) -> Storage:
+        if self._storage is None:
+            self._storage = open_storage(self._config.storage_dir, "r")
+        else:
+            self._storage.refresh_if_changed()
+        return self._storage
+
+    def close(self) -> None:
+        """Closes the storage, if it has been opened"""
+        if self._storage is not None:
+            self._storage.close()
+            self._storage = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
     @property
     def batches(self):
@@ -155,8 +176,7 @@ def summary_values(self, batches=None, keys=None):
         if batches is None:
             batches = self.batches
         data_frames = []
-        storage = open_storage(self._config.storage_dir, "r")
-        experiment = next(storage.experiments)
+        experiment = next(self._get_storage().experiments)
         for batch_id in batches:
             ensemble = experiment.get_ensemble_by_name(f"batch_{batch_id}")
             try:
@@ -195,7 +215,6 @@ def summary_values(self, batches=None, keys=None):
                 summary = summary.with_columns(realizations)
 
             data_frames.append(summary)
-        storage.close()
         return pl.concat(data_frames)
 
     @property
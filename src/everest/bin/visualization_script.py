@@ -32,7 +32,8 @@ def visualization_entry(args=None):
     )
     if server_state["status"] != ServerStatus.never_run:
         pm = EverestPluginManager()
-        pm.hook.visualize_data(api=EverestDataAPI(config))
+        with EverestDataAPI(config) as api:
+            pm.hook.visualize_data(api=api)
 
 
 if __name__ == "__main__":
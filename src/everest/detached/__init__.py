@@ -31,6 +31,7 @@
 from everest.config import EverestConfig, ServerConfig, SimulatorConfig
 from everest.config_keys import ConfigKeys as CK
 from everest.strings import (
+    EVENTS_ENDPOINT,
     EVEREST_SERVER_CONFIG,
     OPT_PROGRESS_ENDPOINT,
     OPT_PROGRESS_ID,
@@ -200,39 +201,62 @@ def server_is_running(url: str, cert: str, auth: tuple[str, str]):
     return True
 
 
-def start_monitor(
-    server_context: tuple[str, str, tuple[str, str]], callback, polling_interval=5
-):
+# Seconds to wait for a message on the event stream before giving up. The
+# server sends keep-alive messages well within this interval.
+_EVENT_STREAM_READ_TIMEOUT = 60
+
+_EVENT_IDS = {
+    SIM_PROGRESS_ENDPOINT: SIM_PROGRESS_ID,
+    OPT_PROGRESS_ENDPOINT: OPT_PROGRESS_ID,
+}
+
+
+def _read_event_stream(lines):
+    """Yields (event, data) tuples parsed from the lines of a server-sent
+    event stream, skipping comments and keep-alive messages"""
+    event, data = None, []
+    for line in lines:
+        if not line:
+            if event is not None and data:
+                yield event, json.loads("\n".join(data))
+            event, data = None, []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("event:"):
+            event = line.removeprefix("event:").strip()
+        elif line.startswith("data:"):
+            data.append(line.removeprefix("data:").strip())
+
+
+def start_monitor(server_context: tuple[str, str, tuple[str, str]], callback):
     """
-    Checks status on Everest server and calls callback when status changes
+    Listens to the events pushed by the Everest server and calls callback
+    when the status changes
+
+    The optimization progress is received incrementally, each event only
+    contains the batches that are new since the previous event.
 
     Monitoring stops when the server stops answering. It can also be
     interrupted by returning True from the callback
     """
     url, cert, auth = server_context
-    sim_endpoint = "/".join([url, SIM_PROGRESS_ENDPOINT])
-    opt_endpoint = "/".join([url, OPT_PROGRESS_ENDPOINT])
-
-    sim_status: dict = {}
-    opt_status: dict = {}
-    stop = False
+    events_endpoint = "/".join([url, EVENTS_ENDPOINT])
 
     try:
-        while not stop:
-            new_sim_status = _query_server(cert, auth, sim_endpoint)
-            if new_sim_status != sim_status:
-                sim_status = new_sim_status
-                ret = bool(callback({SIM_PROGRESS_ID: sim_status}))
-                stop |= ret
-            # When the API will support it query only from a certain batch on
-
-            # Check the optimization status
-            new_opt_status = _query_server(cert, auth, opt_endpoint)
-            if new_opt_status != opt_status:
-                opt_status = new_opt_status
-                ret = bool(callback({OPT_PROGRESS_ID: opt_status}))
-                stop |= ret
-            time.sleep(polling_interval)
+        with requests.get(
+            events_endpoint,
+            stream=True,
+            timeout=(_HTTP_REQUEST_RETRY, _EVENT_STREAM_READ_TIMEOUT),
+            verify=cert,
+            auth=auth,
+            proxies=PROXY,
+        ) as response:
+            response.raise_for_status()
+            for event, data in _read_event_stream(
+                response.iter_lines(decode_unicode=True)
+            ):
+                if event in _EVENT_IDS and callback({_EVENT_IDS[event]: data}):
+                    break
     except:
         logging.debug(traceback.format_exc())
 
@@ -316,13 +340,6 @@ def get_server_queue_options(
     return queue
 
 
-def _query_server(cert, auth, endpoint):
-    """Retrieve data from an endpoint as a dictionary"""
-    response = requests.get(endpoint, verify=cert, auth=auth, proxies=PROXY)
-    response.raise_for_status()
-    return response.json()
-
-
 class ServerStatus(Enum):
     """Keep track of the different states the everest server is in"""
 
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import datetime
 import json
 import logging
@@ -25,6 +26,7 @@
     JSONResponse,
     PlainTextResponse,
     Response,
+    StreamingResponse,
 )
 from fastapi.security import (
     HTTPBasic,
@@ -42,6 +44,7 @@
 from everest.simulator import JOB_FAILURE
 from everest.strings import (
     DEFAULT_LOGGING_FORMAT,
+    EVENTS_ENDPOINT,
     EVEREST,
     OPT_FAILURE_REALIZATIONS,
     OPT_PROGRESS_ENDPOINT,
@@ -50,6 +53,10 @@
 )
 from everest.util import makedirs_if_needed, version_info
 
+# Seconds between keep-alive messages on the event stream. The optimization
+# history is also checked for new batches at this interval.
+_EVENT_STREAM_HEARTBEAT = 5
+
 
 def _get_machine_name() -> str:
     """Returns a name that can be used to identify this machine in a network
@@ -78,6 +85,89 @@ def _get_machine_name() -> str:
         return "localhost"
 
 
+class _ProgressNotifier:
+    """Wakes up the event stream clients when the progress changes"""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._version = 0
+
+    def notify(self) -> None:
+        with self._condition:
+            self._version += 1
+            self._condition.notify_all()
+
+    def wait(self, version: int, timeout: float) -> int:
+        """Blocks until the version differs from the given version, or the
+        timeout is reached, and returns the current version"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._version != version, timeout)
+            return self._version
+
+
+class _OptimizationHistory:
+    """Cache of the optimization status read from seba.db
+
+    The database is only read again when it has been modified, so repeated
+    requests for the progress do not each build a new seba snapshot.
+    """
+
+    def __init__(self, output_folder: str) -> None:
+        self._output_folder = output_folder
+        self._lock = threading.Lock()
+        self._stamp: tuple[int, int] | None = None
+        self._status: dict[str, Any] = {}
+
+    def get(self, since_batch: int | None = None) -> dict[str, Any]:
+        with self._lock:
+            try:
+                stat = os.stat(os.path.join(self._output_folder, "seba.db"))
+            except FileNotFoundError:
+                return {}
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp != self._stamp:
+                self._status = get_opt_status(self._output_folder)
+                self._stamp = stamp
+            status = self._status
+
+        if since_batch is None:
+            return status
+        return _opt_status_since(status, since_batch)
+
+
+def _opt_status_since(status: dict[str, Any], since_batch: int) -> dict[str, Any]:
+    """Returns the optimization progress of the batches after since_batch"""
+    cli_monitor_data = status.get("cli_monitor_data")
+    if not cli_monitor_data:
+        return {"cli_monitor_data": {}}
+
+    indices = [
+        idx
+        for idx, batch in enumerate(cli_monitor_data["batches"])
+        if batch > since_batch
+    ]
+    if not indices:
+        return {"cli_monitor_data": {}}
+
+    return {
+        "cli_monitor_data": {
+            "batches": [cli_monitor_data["batches"][idx] for idx in indices],
+            "controls": [cli_monitor_data["controls"][idx] for idx in indices],
+            "objective_value": [
+                cli_monitor_data["objective_value"][idx] for idx in indices
+            ],
+            "expected_objectives": {
+                name: [values[idx] for idx in indices]
+                for name, values in cli_monitor_data["expected_objectives"].items()
+            },
+        }
+    }
+
+
+def _server_sent_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
 def _sim_monitor(context_status, shared_data=None):
     status = context_status["status"]
     shared_data[SIM_PROGRESS_ENDPOINT] = {
@@ -91,12 +181,16 @@ def _sim_monitor(context_status, shared_data=None):
         },
         "progress": context_status["progress"],
     }
+    shared_data[EVENTS_ENDPOINT].notify()
 
     if shared_data[STOP_ENDPOINT]:
         return "stop_queue"
 
 
 def _opt_monitor(shared_data=None):
+    # Called before each batch, so the results of the previous batch are
+    # available in the optimization history:
+    shared_data[EVENTS_ENDPOINT].notify()
     if shared_data[STOP_ENDPOINT]:
         return "stop_optimization"
 
@@ -104,6 +198,9 @@ def _opt_monitor(shared_data=None):
 def _everserver_thread(shared_data, server_config) -> None:
     app = FastAPI()
     security = HTTPBasic()
+    optimization_history = _OptimizationHistory(
+        server_config["optimization_output_dir"]
+    )
 
     def _check_user(credentials: HTTPBasicCredentials) -> None:
         if credentials.password != server_config["authentication"]:
@@ -146,13 +243,52 @@ def get_sim_progress(
 
     @app.get("/" + OPT_PROGRESS_ENDPOINT)
     def get_opt_progress(
-        request: Request, credentials: HTTPBasicCredentials = Depends(security)
+        request: Request,
+        since_batch: int | None = None,
+        credentials: HTTPBasicCredentials = Depends(security),
     ) -> JSONResponse:
         _log(request)
         _check_user(credentials)
-        progress = get_opt_status(server_config["optimization_output_dir"])
+        progress = optimization_history.get(since_batch)
         return JSONResponse(jsonable_encoder(progress))
 
+    @app.get("/" + EVENTS_ENDPOINT)
+    def get_events(
+        request: Request,
+        since_batch: int = -1,
+        credentials: HTTPBasicCredentials = Depends(security),
+    ) -> StreamingResponse:
+        """Stream of server-sent events, pushing the simulation progress when
+        it changes and the optimization progress of each new batch"""
+        _log(request)
+        _check_user(credentials)
+        notifier: _ProgressNotifier = shared_data[EVENTS_ENDPOINT]
+
+        async def event_stream():
+            version = -1
+            last_batch = since_batch
+            sim_progress = None
+            while not await request.is_disconnected():
+                if shared_data[SIM_PROGRESS_ENDPOINT] != sim_progress:
+                    sim_progress = shared_data[SIM_PROGRESS_ENDPOINT]
+                    yield _server_sent_event(SIM_PROGRESS_ENDPOINT, sim_progress)
+
+                opt_progress = await asyncio.to_thread(
+                    optimization_history.get, last_batch
+                )
+                if batches := opt_progress.get("cli_monitor_data", {}).get("batches"):
+                    last_batch = max(batches)
+                    yield _server_sent_event(OPT_PROGRESS_ENDPOINT, opt_progress)
+
+                new_version = await asyncio.to_thread(
+                    notifier.wait, version, _EVENT_STREAM_HEARTBEAT
+                )
+                if new_version == version:
+                    yield ": keep-alive\n\n"
+                version = new_version
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
     uvicorn.run(
         app,
         host="0.0.0.0",
@@ -272,6 +408,7 @@ def main():
         shared_data = {
             SIM_PROGRESS_ENDPOINT: {},
             STOP_ENDPOINT: False,
+            EVENTS_ENDPOINT: _ProgressNotifier(),
         }
 
         server_config = {
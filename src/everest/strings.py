@@ -7,6 +7,7 @@
 
 EVEREST_SERVER_CONFIG = "everserver_config"
 EVEREST = "everest"
+EVENTS_ENDPOINT = "events"
 
 HOSTFILE_NAME = "hostfile"
 
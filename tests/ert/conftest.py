@@ -110,6 +110,14 @@ def env_save():
     assert len(set_xor) == 0, f"Detected differences in environment: {set_xor}"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def config_cache_dir(tmp_path_factory):
+    """Keeps the parsed config cache of the tests out of the user cache"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path_factory.mktemp("config_cache")))
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def maximize_ulimits():
     """
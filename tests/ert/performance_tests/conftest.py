@@ -1,7 +1,9 @@
 import hashlib
 import json
 from argparse import ArgumentParser
+from pathlib import Path
 
+import memray
 import pytest
 from py import path
 from pytest import fixture
@@ -92,9 +94,13 @@ def template_config(request, source_root, tmp_path_factory):
         yield params
 
 
+peak_memory_key = pytest.StashKey[dict[str, float]]()
+
+
 def pytest_configure(config):
     global template_config_path
     template_config_path = config.getoption("--template-config-path")
+    config.stash[peak_memory_key] = {}
 
 
 def pytest_addoption(parser):
@@ -103,3 +109,78 @@ def pytest_addoption(parser):
         default=None,
         help="specify to share previously generated template-config runs",
     )
+    parser.addoption(
+        "--peak-memory-save",
+        default=None,
+        help="save the peak memory of benchmarks to the given json file",
+    )
+    parser.addoption(
+        "--peak-memory-compare",
+        default=None,
+        help="compare the peak memory of benchmarks to the given json file",
+    )
+    parser.addoption(
+        "--peak-memory-compare-fail",
+        default=10.0,
+        type=float,
+        help="fail benchmarks whose peak memory is more than the given "
+        "percentage above the one in --peak-memory-compare",
+    )
+
+
+def pytest_sessionfinish(session):
+    save_file = session.config.getoption("--peak-memory-save")
+    peak_memories = session.config.stash.get(peak_memory_key, {})
+    if save_file is None or not peak_memories:
+        return
+    saved = (
+        json.loads(Path(save_file).read_text(encoding="utf-8"))
+        if Path(save_file).exists()
+        else {}
+    )
+    Path(save_file).write_text(
+        json.dumps(saved | peak_memories, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+
+
+@fixture
+def benchmark_peak_memory(benchmark, request, tmp_path):
+    """Benchmarks the wall time of a function with pytest-benchmark, and
+    its peak memory with memray.
+
+    The peak memory is added to the extra info of the benchmark, saved
+    with --peak-memory-save, and the test fails if it exceeds the peak
+    memory in --peak-memory-compare by more than --peak-memory-compare-fail
+    percent. Regressions in wall time are checked by pytest-benchmark, with
+    --benchmark-compare and --benchmark-compare-fail.
+    """
+
+    def run(function, *args, **kwargs):
+        result = benchmark(function, *args, **kwargs)
+
+        memray_file = tmp_path / "benchmark_peak_memory.bin"
+        with memray.Tracker(memray_file):
+            function(*args, **kwargs)
+        peak_memory_mb = memray._memray.compute_statistics(
+            str(memray_file)
+        ).peak_memory_allocated / (1024**2)
+        memray_file.unlink()
+
+        benchmark.extra_info["peak_memory_mb"] = peak_memory_mb
+        request.config.stash[peak_memory_key][request.node.nodeid] = peak_memory_mb
+
+        compare_file = request.config.getoption("--peak-memory-compare")
+        if compare_file is not None:
+            baseline = json.loads(Path(compare_file).read_text(encoding="utf-8"))
+            budget = request.config.getoption("--peak-memory-compare-fail")
+            if request.node.nodeid in baseline:
+                baseline_mb = baseline[request.node.nodeid]
+                if peak_memory_mb > baseline_mb * (1 + budget / 100):
+                    pytest.fail(
+                        f"Peak memory of {peak_memory_mb:.2f} MB is more than "
+                        f"{budget}% above the baseline of {baseline_mb:.2f} MB"
+                    )
+        return result
+
+    return run
@@ -1,7 +1,9 @@
 from functools import partial
 
+import memray
 import numpy as np
 import polars
+import pytest
 import scipy as sp
 import xarray as xr
 import xtgeo
@@ -176,3 +178,126 @@ def g(X):
     ) > float(
         posterior_ensemble.calculate_std_dev_for_parameter(param_group)["values"].sum()
     )
+
+
+def _peak_memory_outside_memory_maps(memray_file):
+    """Peak memory allocated, not counting memory mapped files, which the
+    blocked update uses to read and write the parameters."""
+    with memray.FileReader(memray_file) as reader:
+        return sum(
+            record.size
+            for record in reader.get_high_watermark_allocation_records()
+            if record.allocator != memray.AllocatorType.MMAP
+        )
+
+
+@pytest.mark.parametrize("memory_budget", [None, 10])
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+def test_peak_memory_of_field_update(
+    storage, tmp_path, monkeypatch, precision, memory_budget
+):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(42)
+
+    shape = Shape(100, 100, 20)
+    num_ensemble = 50
+    num_observations = 200
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    grid.to_file("MY_EGRID.EGRID", "egrid")
+    param_group = "PARAM_FIELD"
+    config = Field.from_config_list(
+        "MY_EGRID.EGRID",
+        shape,
+        [
+            param_group,
+            param_group,
+            "param.GRDECL",
+            "INIT_FILES:param_%d.GRDECL",
+            "FORWARD_INIT:False",
+        ],
+    )
+    obs = polars.DataFrame(
+        {
+            "response_key": "RESPONSE",
+            "observation_key": "OBSERVATION",
+            "report_step": polars.Series(
+                np.zeros(num_observations), dtype=polars.UInt16
+            ),
+            "index": polars.Series(np.arange(num_observations), dtype=polars.UInt16),
+            "observations": polars.Series(
+                rng.normal(size=num_observations), dtype=polars.Float32
+            ),
+            "std": polars.Series(np.ones(num_observations), dtype=polars.Float32),
+        }
+    )
+    experiment = storage.create_experiment(
+        parameters=[config],
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(
+        experiment, ensemble_size=num_ensemble, name="prior"
+    )
+    for iens in range(num_ensemble):
+        values = rng.normal(size=(shape.nx, shape.ny, shape.nz)).astype(np.float32)
+        prior.save_parameters(
+            param_group,
+            iens,
+            xr.Dataset({"values": xr.DataArray(values, dims=("x", "y", "z"))}),
+        )
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series(
+                        np.zeros(num_observations), dtype=polars.UInt16
+                    ),
+                    "index": polars.Series(
+                        np.arange(num_observations), dtype=polars.UInt16
+                    ),
+                    "values": polars.Series(
+                        values.reshape(-1)[:num_observations], dtype=polars.Float32
+                    ),
+                }
+            ),
+            iens,
+        )
+    update = partial(
+        smoother_update,
+        prior,
+        observations=["OBSERVATION"],
+        parameters=[param_group],
+        analysis_config=UpdateSettings(),
+        es_settings=ESSettings(precision=precision, memory_budget=memory_budget),
+    )
+
+    def create_posterior(name):
+        return storage.create_ensemble(
+            experiment,
+            ensemble_size=num_ensemble,
+            iteration=1,
+            name=name,
+            prior_ensemble=prior,
+        )
+
+    # The first update also allocates the work buffers of the linear algebra
+    # library, which should not count towards the peak memory of the update.
+    update(posterior_storage=create_posterior("warmup"))
+    posterior = create_posterior("posterior")
+    with memray.Tracker(tmp_path / "memray.bin"):
+        update(posterior_storage=posterior)
+
+    peak_memory = _peak_memory_outside_memory_maps(tmp_path / "memray.bin")
+    parameter_bytes = shape.nx * shape.ny * shape.nz * num_ensemble * 4
+    peak_memory_mb = peak_memory / 1024**2
+    print(
+        f"Peak memory of {precision} field update with a memory budget of "
+        f"{memory_budget} MB: {peak_memory_mb:.1f} MB"
+    )
+    if memory_budget is None:
+        assert peak_memory < 2 * parameter_bytes
+    else:
+        # The blocked update saves the posterior one realization at a time
+        realization_bytes = parameter_bytes // num_ensemble
+        assert peak_memory < memory_budget * 1024**2 + 4 * realization_bytes
@@ -13,6 +13,7 @@
 import numpy as np
 import pandas as pd
 import polars
+import pyarrow as pa
 import pytest
 from httpx import RequestError
 from starlette.testclient import TestClient
@@ -115,6 +116,21 @@ def get_record_parquet(storage, ensemble_id1, keyword, poly_ran):
     assert len(record_df1.index) == poly_ran["reals"]
 
 
+def get_record_arrow(storage, ensemble_id1, keyword, poly_ran):
+    async def read_stream():
+        response = await records.get_ensemble_record(
+            storage=storage,
+            name=keyword,
+            ensemble_id=ensemble_id1,
+            accept="application/vnd.apache.arrow.stream",
+        )
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    record_df1 = pa.ipc.open_stream(run_in_loop(read_stream())).read_pandas()
+    assert len(record_df1.columns) == poly_ran["gen_data_entries"]
+    assert len(record_df1.index) == poly_ran["reals"]
+
+
 def get_record_csv(storage, ensemble_id1, keyword, poly_ran):
     csv = run_in_loop(
         records.get_ensemble_record(
@@ -140,6 +156,7 @@ def get_parameters(storage, ensemble_id1, keyword, poly_ran):
     "function",
     [
         get_record_parquet,
+        get_record_arrow,
         get_record_csv,
         get_parameters,
     ],
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+
+def _import_time_of_entry_point():
+    """Imports the entry point in a fresh interpreter, and returns the
+    import time of ert.__main__ in seconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ert.__main__"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: self [us] | cumulative | imported package"
+    import_times = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+    return import_times["ert.__main__"] / 1e6
+
+
+def test_import_time_of_entry_point(benchmark):
+    import_time = benchmark.pedantic(_import_time_of_entry_point, rounds=5)
+    # Importing everything eagerly took more than two seconds
+    assert import_time < 1.0
@@ -0,0 +1,190 @@
+"""Benchmarks of the hot paths of ert at several problem sizes.
+
+Each benchmark records the wall time with pytest-benchmark and the peak
+memory with memray, see the benchmark_peak_memory fixture. The larger
+sizes are marked slow and need --runslow.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import polars
+import pytest
+
+from ert.analysis import smoother_update
+from ert.config import GenDataConfig, GenKwConfig
+from ert.config.gen_kw_config import TransformFunctionDefinition
+from ert.dark_storage.common import data_for_key
+from ert.enkf_main import sample_prior
+from ert.storage import Ensemble, open_storage
+
+from .test_snapshot import simulate_forward_model_event_handling
+
+
+@dataclass
+class _ProblemSize:
+    num_realizations: int
+    num_parameters: int
+    num_observations: int
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.num_realizations}rls|"
+            f"{self.num_parameters}p|"
+            f"{self.num_observations}o]"
+        )
+
+
+_PROBLEM_SIZES = [
+    _ProblemSize(num_realizations=10, num_parameters=10, num_observations=100),
+    pytest.param(
+        _ProblemSize(num_realizations=100, num_parameters=100, num_observations=1000),
+        marks=pytest.mark.slow,
+    ),
+    pytest.param(
+        _ProblemSize(num_realizations=100, num_parameters=100, num_observations=10000),
+        marks=pytest.mark.slow,
+    ),
+    pytest.param(
+        _ProblemSize(num_realizations=1000, num_parameters=100, num_observations=1000),
+        marks=pytest.mark.slow,
+    ),
+]
+
+
+@dataclass
+class _Problem:
+    size: _ProblemSize
+    prior: Ensemble
+    posterior: Ensemble
+    responses: list[polars.DataFrame]
+
+
+@pytest.fixture(params=_PROBLEM_SIZES, ids=str)
+def problem(tmp_path, request):
+    size = request.param
+    rng = np.random.default_rng(0)
+    parameters = GenKwConfig(
+        name="PARAMETERS",
+        template_file=None,
+        output_file=None,
+        forward_init=False,
+        update=True,
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"p{i}", param_name="NORMAL", values=[0, 1])
+            for i in range(size.num_parameters)
+        ],
+    )
+    index = polars.Series(np.arange(size.num_observations), dtype=polars.UInt16)
+    observations = polars.DataFrame(
+        {
+            "response_key": "RESPONSE",
+            "observation_key": "OBSERVATION",
+            "report_step": polars.Series(
+                np.zeros(size.num_observations), dtype=polars.UInt16
+            ),
+            "index": index,
+            "observations": polars.Series(
+                rng.normal(size=size.num_observations), dtype=polars.Float32
+            ),
+            "std": polars.Series(np.ones(size.num_observations), dtype=polars.Float32),
+        }
+    )
+    responses = [
+        polars.DataFrame(
+            {
+                "response_key": "RESPONSE",
+                "report_step": polars.Series(
+                    np.zeros(size.num_observations), dtype=polars.UInt16
+                ),
+                "index": index,
+                "values": polars.Series(
+                    rng.normal(size=size.num_observations), dtype=polars.Float32
+                ),
+            }
+        )
+        for _ in range(size.num_realizations)
+    ]
+
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[parameters],
+            responses=[GenDataConfig(keys=["RESPONSE"])],
+            observations={"gen_data": observations},
+        )
+        prior = experiment.create_ensemble(
+            ensemble_size=size.num_realizations, name="prior"
+        )
+        sample_prior(prior, range(size.num_realizations), [parameters.name])
+        for realization, response in enumerate(responses):
+            prior.save_response("gen_data", response, realization)
+        prior.refresh_ensemble_state()
+        posterior = experiment.create_ensemble(
+            ensemble_size=size.num_realizations,
+            name="posterior",
+            iteration=1,
+            prior_ensemble=prior,
+        )
+        yield _Problem(size, prior, posterior, responses)
+
+
+def test_scaling_of_saving_responses(benchmark_peak_memory, problem):
+    def save_responses():
+        for realization, response in enumerate(problem.responses):
+            problem.posterior.save_response("gen_data", response, realization)
+
+    benchmark_peak_memory(save_responses)
+
+
+def test_scaling_of_loading_responses(benchmark_peak_memory, problem):
+    realizations = tuple(range(problem.size.num_realizations))
+    responses = benchmark_peak_memory(
+        problem.prior.load_responses, "RESPONSE", realizations
+    )
+    assert len(responses) == problem.size.num_realizations * (
+        problem.size.num_observations
+    )
+
+
+def test_scaling_of_joining_observations_and_responses(benchmark_peak_memory, problem):
+    joined = benchmark_peak_memory(
+        problem.prior.get_observations_and_responses,
+        ["OBSERVATION"],
+        np.arange(problem.size.num_realizations),
+    )
+    assert len(joined) == problem.size.num_observations
+
+
+def test_scaling_of_es_update(benchmark_peak_memory, problem):
+    benchmark_peak_memory(
+        smoother_update,
+        problem.prior,
+        problem.posterior,
+        ["OBSERVATION"],
+        ["PARAMETERS"],
+    )
+
+
+def test_scaling_of_dark_storage_data_for_key(benchmark_peak_memory, problem):
+    data = benchmark_peak_memory(data_for_key, problem.prior, "RESPONSE@0")
+    assert data.shape == (
+        problem.size.num_realizations,
+        problem.size.num_observations,
+    )
+
+
+@pytest.mark.parametrize(
+    "ensemble_size, forward_models",
+    [
+        (10, 10),
+        pytest.param(100, 10, marks=pytest.mark.slow),
+        pytest.param(1000, 10, marks=pytest.mark.slow),
+        pytest.param(100, 100, marks=pytest.mark.slow),
+    ],
+)
+def test_scaling_of_snapshot_updates(
+    benchmark_peak_memory, ensemble_size, forward_models
+):
+    benchmark_peak_memory(
+        simulate_forward_model_event_handling, ensemble_size, forward_models, 1
+    )
@@ -676,6 +676,50 @@ def test_ies():
     )
 
 
+@pytest.mark.usefixtures("copy_poly_case")
+def test_that_ies_restarted_from_an_ensemble_continues_the_smoother():
+    with open("poly.ert", mode="a", encoding="utf-8") as fh:
+        fh.write("RANDOM_SEED 123456\n")
+
+    def _run(experiment_name, num_iterations, *args):
+        run_cli(
+            ITERATIVE_ENSEMBLE_SMOOTHER_MODE,
+            "--disable-monitor",
+            "--experiment-name",
+            experiment_name,
+            "--num-iterations",
+            str(num_iterations),
+            "--realizations",
+            "1,2,4,8",
+            *args,
+            "poly.ert",
+        )
+
+    def _ensemble(storage, experiment_name, name):
+        return storage.get_experiment_by_name(experiment_name).get_ensemble_by_name(
+            name
+        )
+
+    _run("uninterrupted", 2)
+    _run("interrupted", 1)
+    enspath = ErtConfig.from_file("poly.ert").ens_path
+    with open_storage(enspath) as storage:
+        restart_id = str(_ensemble(storage, "interrupted", "iter-1").id)
+    _run("interrupted", 2, "--restart-ensemble-id", restart_id)
+
+    with open_storage(enspath) as storage:
+        np.testing.assert_allclose(
+            _ensemble(storage, "interrupted", "iter-2").load_all_gen_kw_data(),
+            _ensemble(storage, "uninterrupted", "iter-2").load_all_gen_kw_data(),
+        )
+        restart_id = str(_ensemble(storage, "interrupted", "iter-2").id)
+
+    with open("poly.ert", mode="a", encoding="utf-8") as fh:
+        fh.write("ANALYSIS_SET_VAR IES_ENKF ENKF_TRUNCATION 0.9\n")
+    with pytest.raises(ErtCliError, match="Cannot resume the iterated"):
+        _run("interrupted", 3, "--restart-ensemble-id", restart_id)
+
+
 @pytest.mark.usefixtures("copy_poly_case")
 def test_that_running_ies_with_different_steplength_produces_different_result():
     """This is a regression test to make sure that different step-lengths
@@ -1041,3 +1041,283 @@ def test_update_subset_parameters(storage, uniform_parameter, obs):
     assert not prior.load_parameters("PARAMETER", 0)["values"].equals(
         posterior_ens.load_parameters("PARAMETER", 0)["values"]
     )
+
+
+@pytest.mark.parametrize("localization", [False, True])
+def test_that_single_precision_update_matches_double_precision(
+    storage, obs, localization
+):
+    parameter = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"KEY{i}", "NORMAL", [0, 1]) for i in range(5)
+        ],
+        output_file=None,
+        update=True,
+    )
+    experiment = storage.create_experiment(
+        parameters=[parameter],
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(experiment, ensemble_size=20, name="prior")
+    rng = np.random.default_rng(42)
+    for iens in range(prior.ensemble_size):
+        values = rng.normal(size=5)
+        prior.save_parameters(
+            "PARAMETER",
+            iens,
+            xr.Dataset(
+                {
+                    "values": ("names", values),
+                    "transformed_values": ("names", values),
+                    "names": [f"KEY{i}" for i in range(5)],
+                }
+            ),
+        )
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                    "index": polars.Series(range(3), dtype=polars.UInt16),
+                    "values": polars.Series(values[:3] + 1, dtype=polars.Float32),
+                }
+            ),
+            iens,
+        )
+
+    posteriors = {}
+    for precision in ("float64", "float32"):
+        posteriors[precision] = storage.create_ensemble(
+            experiment,
+            ensemble_size=prior.ensemble_size,
+            iteration=1,
+            name=precision,
+            prior_ensemble=prior,
+        )
+        smoother_update(
+            prior,
+            posteriors[precision],
+            ["OBSERVATION"],
+            ["PARAMETER"],
+            UpdateSettings(),
+            ESSettings(localization=localization, precision=precision),
+            rng=np.random.default_rng(1234),
+        )
+
+    realizations = np.arange(prior.ensemble_size)
+    expected = _load_param_ensemble_array(
+        posteriors["float64"], "PARAMETER", realizations
+    )
+    np.testing.assert_allclose(
+        _load_param_ensemble_array(posteriors["float32"], "PARAMETER", realizations),
+        expected,
+        rtol=1e-4,
+        atol=1e-5,
+    )
+    assert not np.allclose(
+        _load_param_ensemble_array(prior, "PARAMETER", realizations), expected
+    )
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+def test_that_blocked_update_matches_update_in_memory(
+    storage, tmp_path, monkeypatch, obs, precision, memory_map
+):
+    monkeypatch.chdir(tmp_path)
+    shape = Shape(100, 100, 5)
+    ensemble_size = 10
+    rng = np.random.default_rng(42)
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    mask = grid.get_actnum()
+    mask_list = rng.choice([True, False], shape.nx * shape.ny * shape.nz)
+    mask.values = mask_list
+    grid.set_actnum(mask)
+    grid.to_file("MY_EGRID.EGRID", "egrid")
+    config = Field.from_config_list(
+        "MY_EGRID.EGRID",
+        shape,
+        [
+            "PARAM_FIELD",
+            "PARAM_FIELD",
+            "param.GRDECL",
+            "INIT_FILES:param_%d.GRDECL",
+            "FORWARD_INIT:False",
+            f"MEMORY_MAP:{memory_map}",
+        ],
+    )
+    experiment = storage.create_experiment(
+        parameters=[config],
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+    prior = storage.create_ensemble(experiment, ensemble_size=ensemble_size)
+    for iens in range(ensemble_size):
+        values = np.where(
+            mask_list.reshape(shape.nx, shape.ny, shape.nz),
+            rng.normal(size=(shape.nx, shape.ny, shape.nz)),
+            np.nan,
+        ).astype(np.float32)
+        prior.save_parameters(
+            "PARAM_FIELD",
+            iens,
+            xr.Dataset({"values": (["x", "y", "z"], values)}),
+        )
+        prior.save_response(
+            "gen_data",
+            polars.DataFrame(
+                {
+                    "response_key": "RESPONSE",
+                    "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                    "index": polars.Series(range(3), dtype=polars.UInt16),
+                    "values": polars.Series(
+                        np.nan_to_num(values.ravel()[:3]) + 1, dtype=polars.Float32
+                    ),
+                }
+            ),
+            iens,
+        )
+
+    posteriors = {}
+    for memory_budget in (None, 1):
+        posteriors[memory_budget] = storage.create_ensemble(
+            experiment,
+            ensemble_size=ensemble_size,
+            iteration=1,
+            name=f"posterior_{memory_budget}",
+            prior_ensemble=prior,
+        )
+        smoother_update(
+            prior,
+            posteriors[memory_budget],
+            ["OBSERVATION"],
+            ["PARAM_FIELD"],
+            UpdateSettings(),
+            ESSettings(precision=precision, memory_budget=memory_budget),
+            rng=np.random.default_rng(1234),
+        )
+
+    expected = posteriors[None].load_parameters("PARAM_FIELD")["values"]
+    blocked = posteriors[1].load_parameters("PARAM_FIELD")["values"]
+    assert not np.allclose(
+        prior.load_parameters("PARAM_FIELD")["values"], expected, equal_nan=True
+    )
+    np.testing.assert_allclose(blocked, expected, rtol=1e-5)
+    np.testing.assert_array_equal(
+        posteriors[1].load_parameter_values("PARAM_FIELD", 0), blocked[0]
+    )
+    assert isinstance(prior.load_parameter_values("PARAM_FIELD", 0), np.memmap) == (
+        memory_map
+    )
+    assert sorted(p.name for p in posteriors[1].mount_point.iterdir()) == sorted(
+        p.name for p in posteriors[None].mount_point.iterdir()
+    )
+
+
+@pytest.mark.parametrize("num_parameters", [5, 30])
+def test_that_iterative_update_resumes_from_persisted_state(
+    storage, obs, num_parameters
+):
+    names = [f"KEY{i}" for i in range(num_parameters)]
+    parameter = GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition(name, "NORMAL", [0, 1]) for name in names
+        ],
+        output_file=None,
+        update=True,
+    )
+    experiment = storage.create_experiment(
+        parameters=[parameter],
+        responses=[GenDataConfig(keys=["RESPONSE"])],
+        observations={"gen_data": obs},
+    )
+
+    def save_responses(ensemble):
+        for iens in range(ensemble.ensemble_size):
+            values = ensemble.load_parameters("PARAMETER", iens)["values"].values
+            ensemble.save_response(
+                "gen_data",
+                polars.DataFrame(
+                    {
+                        "response_key": "RESPONSE",
+                        "report_step": polars.Series([0] * 3, dtype=polars.UInt16),
+                        "index": polars.Series(range(3), dtype=polars.UInt16),
+                        "values": polars.Series(
+                            values[:3] ** 2 + 1, dtype=polars.Float32
+                        ),
+                    }
+                ),
+                iens,
+            )
+
+    prior = storage.create_ensemble(experiment, ensemble_size=20, name="prior")
+    rng = np.random.default_rng(42)
+    for iens in range(prior.ensemble_size):
+        values = rng.normal(size=num_parameters)
+        prior.save_parameters(
+            "PARAMETER",
+            iens,
+            xr.Dataset(
+                {
+                    "values": ("names", values),
+                    "transformed_values": ("names", values),
+                    "names": names,
+                }
+            ),
+        )
+    save_responses(prior)
+    initial_mask = prior.get_realization_mask_with_responses()
+
+    def update(source, name, sies_smoother, analysis_config=None):
+        target = storage.create_ensemble(
+            experiment,
+            ensemble_size=prior.ensemble_size,
+            iteration=source.iteration + 1,
+            name=name,
+            prior_ensemble=source,
+        )
+        _, sies_smoother = iterative_smoother_update(
+            prior_storage=source,
+            posterior_storage=target,
+            sies_smoother=sies_smoother,
+            observations=["OBSERVATION"],
+            parameters=["PARAMETER"],
+            update_settings=UpdateSettings(),
+            analysis_config=analysis_config or IESSettings(),
+            sies_step_length=functools.partial(steplength_exponential),
+            initial_mask=initial_mask,
+            rng=np.random.default_rng(1234),
+        )
+        return target, sies_smoother
+
+    first, sies_smoother = update(prior, "first", None)
+    save_responses(first)
+    state = experiment.load_sies_state()
+    assert state.attrs["ensemble_id"] == str(first.id)
+    assert state.attrs["iteration"] == 2
+    assert ("parameters" in state) == (num_parameters < prior.ensemble_size - 1)
+
+    with pytest.raises(ErtAnalysisError, match="Cannot resume the iterated"):
+        update(first, "mismatched", None, IESSettings(enkf_truncation=0.9))
+
+    resumed, resumed_smoother = update(first, "resumed", None)
+    continued, _ = update(first, "continued", sies_smoother)
+
+    assert resumed_smoother is not sies_smoother
+    assert resumed_smoother.iteration == 3
+    realizations = np.arange(prior.ensemble_size)
+    expected = _load_param_ensemble_array(continued, "PARAMETER", realizations)
+    np.testing.assert_allclose(
+        _load_param_ensemble_array(resumed, "PARAMETER", realizations), expected
+    )
+    assert not np.allclose(
+        _load_param_ensemble_array(first, "PARAMETER", realizations), expected
+    )
@@ -1,8 +1,11 @@
 import numpy as np
 import pytest
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.stats import spearmanr
 from sklearn.preprocessing import StandardScaler
 
 from ert.analysis.misfit_preprocessor import (
+    cluster_responses,
     get_nr_primary_components,
     get_scaling_factor,
     main,
@@ -99,3 +102,40 @@ def test_misfit_preprocessor_single(nr_observations):
         result,
         np.array(nr_observations * [1.0]),
     )
+
+
+def _correlated_responses(rng, nr_observations, nr_realizations, nr_groups):
+    """Responses of observations in nr_groups groups, where observations in
+    the same group are strongly correlated"""
+    parameters = rng.standard_normal((nr_groups, nr_realizations))
+    groups = np.arange(nr_observations) % nr_groups
+    noise = 0.1 * rng.standard_normal((nr_observations, nr_realizations))
+    return parameters[groups] + noise, groups
+
+
+@pytest.mark.parametrize("nr_clusters", [1, 2, 3, 5])
+def test_that_clusters_are_those_of_the_spearman_correlation_matrix(nr_clusters):
+    rng = np.random.default_rng(1234)
+    responses, _ = _correlated_responses(rng, 50, 100, 3)
+    responses += rng.standard_normal(responses.shape)
+
+    correlation = spearmanr(responses.T).statistic
+    expected = fcluster(
+        linkage(correlation, "average", "euclidean"),
+        nr_clusters,
+        criterion="maxclust",
+        depth=2,
+    )
+
+    np.testing.assert_equal(cluster_responses(responses.T, nr_clusters), expected)
+
+
+def test_that_observations_beyond_the_clustered_sample_join_the_nearest_cluster():
+    rng = np.random.default_rng(1234)
+    responses, groups = _correlated_responses(rng, 1000, 100, 3)
+
+    clusters = cluster_responses(responses.T, 3, max_clustered_observations=30)
+
+    assert len(np.unique(clusters)) == 3
+    for group in range(3):
+        assert len(np.unique(clusters[groups == group])) == 1
@@ -1,9 +1,17 @@
 import os
+import stat
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
+from lark import Lark
 
-from ert.config.parsing import ConfigValidationError, init_user_config_schema, parse
+from ert.config.parsing import (
+    ConfigValidationError,
+    init_user_config_schema,
+    lark_parser,
+    parse,
+)
 
 
 def touch(filename):
@@ -356,3 +364,128 @@ def test_that_giving_too_few_arguments_gives_config_validation_error():
 
     with pytest.raises(ConfigValidationError, match="at least 1 arguments"):
         _ = parse(test_config_file_name, schema=init_user_config_schema())
+
+
+def test_that_syntax_errors_are_reported_at_the_unexpected_character(tmp_path):
+    config_file = tmp_path / "config.ert"
+    config_file.write_text("NUM_REALIZATIONS 1\nFORWARD_MODEL JOB(<A>)\n")
+
+    with pytest.raises(ConfigValidationError) as err:
+        _ = parse(str(config_file), schema=init_user_config_schema())
+
+    assert len(err.value.errors) == 1
+    info = err.value.errors[0]
+    assert info.message.startswith("Did not expect character: )")
+    assert (info.line, info.column, info.filename) == (2, 22, str(config_file))
+
+
+def test_that_parsed_config_files_are_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_file = tmp_path / "config.ert"
+    config_file.write_text(
+        "NUM_REALIZATIONS 1\n"
+        + "".join(f"SETENV VAR{i} value{i} -- comment\n" for i in range(200))
+    )
+
+    config = parse(str(config_file), schema=init_user_config_schema())
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    with patch.object(lark_parser._parser, "parse", side_effect=AssertionError):
+        assert parse(str(config_file), schema=init_user_config_schema()) == config
+
+    with open(config_file, "a", encoding="utf-8") as fh:
+        fh.write("SETENV VAR 'new'\n")
+    config = parse(str(config_file), schema=init_user_config_schema())
+    assert config["SETENV"][-1] == ["VAR", "new"]
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+def test_that_corrupt_cache_entries_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_file = tmp_path / "config.ert"
+    config_file.write_text("NUM_REALIZATIONS 1\n" + "-- comment\n" * 500)
+    config = parse(str(config_file), schema=init_user_config_schema())
+
+    for entry in (tmp_path / "cache").iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    assert parse(str(config_file), schema=init_user_config_schema()) == config
+
+
+def test_that_the_cache_is_private_to_the_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_file = tmp_path / "config.ert"
+    config_file.write_text("NUM_REALIZATIONS 1\n" + "-- comment\n" * 500)
+    config = parse(str(config_file), schema=init_user_config_schema())
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.chmod(0o666)
+    with patch.object(lark_parser, "_parser", wraps=lark_parser._parser) as parser:
+        assert parse(str(config_file), schema=init_user_config_schema()) == config
+    parser.parse.assert_called_once()
+
+
+def test_that_unused_cache_entries_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "cache").mkdir(mode=0o700)
+    stale = tmp_path / "cache" / "stale.pickle"
+    stale.write_bytes(b"")
+    os.utime(stale, (0, 0))
+
+    for i in range(3):
+        config_file = tmp_path / f"config{i}.ert"
+        config_file.write_text(f"NUM_REALIZATIONS {i}\n" + "-- comment\n" * 500)
+        parse(str(config_file), schema=init_user_config_schema())
+        if i == 0:
+            assert not stale.exists()
+            (entry,) = (tmp_path / "cache").iterdir()
+            monkeypatch.setattr(lark_parser, "_MAX_CACHE_SIZE", entry.stat().st_size)
+
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+_QUOTED_COMMENT_MARKERS = dedent(
+    """
+    NUM_REALIZATIONS 1
+    SETENV X 'a -- b'
+    DEFINE <A> 'hello -- world'
+    RUNPATH 'my -- path'/r<IENS>
+    """
+)
+
+
+def test_that_comment_markers_in_quotes_start_a_comment(tmp_path):
+    config_file = tmp_path / "config.ert"
+    config_file.write_text(_QUOTED_COMMENT_MARKERS)
+
+    config = parse(str(config_file), schema=init_user_config_schema())
+
+    assert config["SETENV"] == [["X", "'a"]]
+    assert ["<A>", "'hello"] in config["DEFINE"]
+    assert config["RUNPATH"] == str(tmp_path / "'my")
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_that_parsed_trees_are_the_same_as_with_the_earley_parser(
+    tmp_path, monkeypatch, source_root, cached
+):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(lark_parser, "_MIN_CACHED_SIZE", 0)
+    earley_parser = Lark(lark_parser.grammar, propagate_positions=True)
+    contents = [_QUOTED_COMMENT_MARKERS] + [
+        path.read_text(encoding="utf-8")
+        for path in sorted((source_root / "test-data" / "ert").glob("**/*.ert"))
+    ]
+    for content in contents:
+        file = str(tmp_path / "config.ert")
+        if cached:
+            lark_parser._parse_contents(content, file)
+        expected = (
+            lark_parser.StringQuotationTransformer()
+            * lark_parser.FileContextTransformer(file)
+            * lark_parser.ArgumentToStringTransformer()
+            * lark_parser.InstructionTransformer()
+        ).transform(earley_parser.parse(content + "\n"))
+
+        assert lark_parser._parse_contents(content, file) == expected
@@ -200,6 +200,35 @@ def test_unknown_variable_raises_validation_error():
         )
 
 
+def test_precision_is_set_from_analysis_set_var():
+    assert AnalysisConfig.from_dict({}).es_module.precision == "float64"
+    assert (
+        AnalysisConfig.from_dict(
+            {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "PRECISION", "FLOAT32"]]}
+        ).es_module.precision
+        == "float32"
+    )
+
+
+def test_memory_budget_is_set_from_analysis_set_var():
+    assert AnalysisConfig.from_dict({}).es_module.memory_budget is None
+    assert (
+        AnalysisConfig.from_dict(
+            {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "MEMORY_BUDGET", "4096"]]}
+        ).es_module.memory_budget
+        == 4096
+    )
+
+
+def test_invalid_precision_raises_validation_error():
+    with pytest.raises(
+        ConfigValidationError, match="Input should be 'float64' or 'float32'"
+    ):
+        AnalysisConfig.from_dict(
+            {ConfigKeys.ANALYSIS_SET_VAR: [["STD_ENKF", "PRECISION", "FLOAT16"]]}
+        )
+
+
 def test_default_alpha_is_set():
     default_alpha = 3.0
     assert AnalysisConfig.from_dict({}).observation_settings.alpha == default_alpha
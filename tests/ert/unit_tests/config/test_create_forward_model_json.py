@@ -11,6 +11,7 @@
 from ert.config.ert_config import (
     _forward_model_step_from_config_file,
     create_forward_model_json,
+    forward_model_json_renderer,
 )
 from ert.substitutions import Substitutions
 
@@ -674,6 +675,38 @@ def test_simulation_job(job, forward_model, expected_args):
     assert fm_data["argList"] == expected_args
 
 
+def test_that_one_renderer_gives_the_forward_model_of_every_realization():
+    context = Substitutions(
+        {
+            "<RUNPATH>": "realization-<IENS>/iter-<ITER>",
+            "<CASE>": "case",
+            "<CASE_0>": "first",
+            "<CASE_1>": "second",
+            "<GEO_ID_1_2>": "geo",
+        }
+    )
+    fm_step = ForwardModelStep(
+        name="step",
+        executable="<CASE>.exe",
+        arglist=["<CASE>", "<RUNPATH>", "<CASE_<IENS>>", "<GEO_ID>", "<PRIVATE>"],
+    )
+    fm_step.private_args = Substitutions({"<PRIVATE>": "<CASE>-<IENS>"})
+    render = forward_model_json_renderer(context, [fm_step])
+
+    for iens, itr in [(0, 0), (1, 2), (0, 1)]:
+        rendered = render("run_id", iens, itr)
+        assert rendered == create_forward_model_json(
+            context, [fm_step], "run_id", iens, itr
+        )
+        assert rendered["jobList"][0]["argList"] == [
+            "case",
+            f"realization-{iens}/iter-{itr}",
+            ["first", "second"][iens],
+            "geo" if (iens, itr) == (1, 2) else "<GEO_ID>",
+            f"case-{iens}",
+        ]
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_that_private_over_global_args_gives_logging_message(caplog):
     caplog.set_level(logging.INFO)
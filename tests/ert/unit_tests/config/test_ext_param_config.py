@@ -1,6 +1,10 @@
+import json
+
+import numpy as np
 import pytest
 
 from ert.config import ExtParamConfig
+from ert.storage import open_storage
 
 
 @pytest.mark.usefixtures("use_tmpdir")
@@ -48,3 +52,30 @@ def test_ext_param_config_suffixes():
 
     with pytest.raises(IndexError):
         _ = config["no_such_key"]
+
+
+def test_ext_param_config_writes_rows_of_saved_matrix_to_runpath(tmp_path):
+    config = ExtParamConfig(
+        "Key",
+        input_keys={"key1": ["a", "b"], "key2": ["c"]},
+        output_file="controls.json",
+    )
+    names = ["key1\0a", "key1\0b", "key2\0c"]
+    values = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        ensemble = storage.create_experiment(parameters=[config]).create_ensemble(
+            name="batch", ensemble_size=2
+        )
+        ensemble.save_parameters(
+            "Key", np.arange(2), ExtParamConfig.matrix_to_dataset(names, values)
+        )
+        for realization, row in enumerate(values):
+            run_path = tmp_path / f"simulation_{realization}"
+            config.write_to_runpath(run_path, realization, ensemble)
+            assert json.loads((run_path / "controls.json").read_text()) == {
+                "key1": {"a": row[0], "b": row[1]},
+                "key2": {"c": row[2]},
+            }
+            assert ensemble.load_parameters("Key", realization)[
+                "values"
+            ].values.tolist() == list(row)
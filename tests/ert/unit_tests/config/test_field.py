@@ -167,6 +167,19 @@ def test_forward_init_is_gotten_from_keyword(parse_field_line, boolean):
     assert field.forward_init == boolean
 
 
+@pytest.mark.parametrize("boolean", [True, False])
+def test_memory_map_is_gotten_from_keyword(parse_field_line, boolean):
+    field = parse_field_line(
+        f"FIELD f PARAMETER f.roff INIT_FILES:f%d.grdecl MEMORY_MAP:{boolean}"
+    )
+    assert field.memory_map == boolean
+
+
+def test_memory_map_defaults_to_false(parse_field_line):
+    field = parse_field_line("FIELD f PARAMETER f.roff INIT_FILES:f%d.grdecl")
+    assert not field.memory_map
+
+
 @pytest.mark.parametrize("invalid", ["not_right", "uhum"])
 def test_invalid_forward_init_gives_a_user_error_message(parse_field_line, invalid):
     with pytest.raises(
@@ -1036,3 +1036,62 @@ def validate_pre_experiment(self, fm_step_json: ForwardModelStepJSON) -> None:
                 FMWithAssertionError,
             ]
         ).from_file(tmp_path / "test.ert")
+
+
+def test_that_job_directories_are_parsed_from_cache_when_unchanged(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("jobs")
+    Path("jobs/JOB_A").write_text("EXECUTABLE echo\nMIN_ARG 1\n", encoding="utf-8")
+    Path("jobs/JOB_B").write_text("EXECUTABLE echo\n", encoding="utf-8")
+    Path("test.ert").write_text(
+        "NUM_REALIZATIONS 1\nINSTALL_JOB_DIRECTORY jobs\n", encoding="utf-8"
+    )
+
+    steps = ErtConfig.from_file("test.ert").installed_forward_model_steps
+    with patch(
+        "ert.config.ert_config._forward_model_step_from_config_file",
+        side_effect=AssertionError("Should be read from cache"),
+    ):
+        assert ErtConfig.from_file("test.ert").installed_forward_model_steps == steps
+
+    Path("jobs/JOB_A").write_text("EXECUTABLE echo\nMIN_ARG 2\n", encoding="utf-8")
+    Path("jobs/JOB_B").unlink()
+    steps = ErtConfig.from_file("test.ert").installed_forward_model_steps
+    assert set(steps) == {"JOB_A"}
+    assert steps["JOB_A"].min_arg == 2
+
+
+def test_that_job_files_with_warnings_warn_on_every_load(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("jobs")
+    Path("jobs/JOB").write_text("EXECUTABLE echo\nNOT_A_KEYWORD\n", encoding="utf-8")
+    Path("test.ert").write_text(
+        "NUM_REALIZATIONS 1\nINSTALL_JOB_DIRECTORY jobs\n", encoding="utf-8"
+    )
+
+    for _ in range(2):
+        with pytest.warns(ConfigWarning, match="Unknown keyword 'NOT_A_KEYWORD'"):
+            ErtConfig.from_file("test.ert")
+
+
+def test_that_cached_job_executables_are_validated_on_every_load(tmp_path, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("jobs")
+    Path("script.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+    os.chmod("script.sh", 0o755)
+    Path("jobs/JOB").write_text(
+        f"EXECUTABLE {tmp_path / 'script.sh'}\n", encoding="utf-8"
+    )
+    Path("test.ert").write_text(
+        "NUM_REALIZATIONS 1\nINSTALL_JOB_DIRECTORY jobs\n", encoding="utf-8"
+    )
+
+    ErtConfig.from_file("test.ert")
+    Path("script.sh").unlink()
+    with pytest.raises(ConfigValidationError, match="Could not find executable"):
+        ErtConfig.from_file("test.ert")
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 import hypothesis.strategies as st
+import numpy as np
 import pytest
 from hypothesis import given
 
@@ -167,3 +168,26 @@ def test_that_read_file_does_not_raise_unexpected_exceptions_on_missing_director
             report_steps_list=[None],
             input_files=["DOES_NOT_EXIST"],
         ).read_from_file(str(tmp_path / "DOES_NOT_EXIST"), 0, 0)
+
+
+def test_that_all_report_steps_are_read_with_their_active_masks(tmp_path):
+    (tmp_path / "response_0").write_text("1.0\n2.0\n3.0\n")
+    (tmp_path / "response_0_active").write_text("1\n0\n1\n")
+    (tmp_path / "response_1").write_text("4.0\n5.0")
+    (tmp_path / "response_2").write_text("# a comment\n 6.0 \n\n7.0\n")
+    (tmp_path / "response_2_active").write_text("0")
+
+    data = GenDataConfig(
+        name="gen_data",
+        keys=["RESPONSE", "OTHER"],
+        report_steps_list=[[0, 1, 2], None],
+        input_files=["response_%d", "response_1"],
+    ).read_from_file(tmp_path, 0, 0)
+
+    assert data["response_key"].to_list() == ["RESPONSE"] * 7 + ["OTHER"] * 2
+    assert data["report_step"].to_list() == [0, 0, 0, 1, 1, 2, 2, 0, 0]
+    assert data["index"].to_list() == [0, 1, 2, 0, 1, 0, 1, 0, 1]
+    np.testing.assert_equal(
+        data["values"].to_numpy(),
+        [1.0, np.nan, 3.0, 4.0, 5.0, np.nan, np.nan, 4.0, 5.0],
+    )
@@ -4,6 +4,7 @@
 from pathlib import Path
 from textwrap import dedent
 
+import numpy as np
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
@@ -18,6 +19,8 @@
 )
 from ert.config.general_observation import GenObservation
 from ert.config.observation_vector import ObsVector
+from ert.config.observations import TimeMap
+from ert.config.summary_observation import SummaryObservationSeries
 
 from .config_dict_generator import config_generators
 
@@ -187,6 +190,57 @@ def test_gen_obs_invalid_observation_std(std):
         )
 
 
+def _find_nearest_by_scan(time_map, time, threshold):
+    nearest = [
+        (abs(time - t), i) for i, t in enumerate(time_map) if abs(time - t) < threshold
+    ]
+    if not nearest:
+        raise IndexError
+    return min(nearest)[1]
+
+
+@given(
+    time_map=st.lists(
+        st.datetimes(datetime(2000, 1, 1), datetime(2000, 1, 2)), max_size=20
+    ),
+    time=st.datetimes(datetime(2000, 1, 1), datetime(2000, 1, 2)),
+    threshold=st.timedeltas(timedelta(seconds=1), timedelta(hours=2)),
+)
+def test_that_nearest_time_is_found_in_unsorted_time_maps(time_map, time, threshold):
+    try:
+        expected = _find_nearest_by_scan(time_map, time, threshold)
+    except IndexError:
+        with pytest.raises(IndexError, match="is not in the time map"):
+            TimeMap(time_map).find_nearest(time, threshold)
+    else:
+        assert TimeMap(time_map).find_nearest(time, threshold) == expected
+
+
+def test_that_summary_observation_series_give_same_dataset_as_observations():
+    dates = [datetime(2000, 1, day) for day in range(1, 5)]
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    stds = np.array([0.1, 0.2, 0.3, 0.4])
+    nodes = {
+        date: SummaryObservation("FOPR", "FOPR", value, std)
+        for date, value, std in zip(dates, values, stds, strict=True)
+    }
+
+    def vector(observations):
+        return ObsVector(
+            EnkfObservationImplementationType.SUMMARY_OBS,
+            "FOPR",
+            "summary",
+            observations,
+        )
+
+    series = SummaryObservationSeries("FOPR", "FOPR", dates, values, stds)
+    assert dict(series) == nodes
+    assert vector(series).to_dataset([]).equals(vector(nodes).to_dataset([]))
+    assert vector(series).to_dataset([1, 3]).equals(vector(nodes).to_dataset([1, 3]))
+    with pytest.raises(ValueError, match="must be strictly > 0"):
+        SummaryObservationSeries("FOPR", "FOPR", dates, values, stds - 0.2)
+
+
 @pytest.mark.integration_test
 @settings(max_examples=10)
 @pytest.mark.filterwarnings("ignore::UserWarning")
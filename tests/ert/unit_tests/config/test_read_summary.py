@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta
 from itertools import zip_longest
+from unittest.mock import patch
 
 import hypothesis.strategies as st
+import numpy as np
 import pytest
 import resfo
 from hypothesis import given
 from resdata.summary import Summary, SummaryVarType
 
-from ert.config import InvalidResponseFile
+from ert.config import InvalidResponseFile, _read_summary
 from ert.config._read_summary import make_summary_key, read_summary
 from ert.summary_key_type import SummaryKeyType
 
@@ -488,3 +490,63 @@ def test_that_ambiguous_case_restart_raises_an_informative_error(tmp_path):
         match="Ambiguous reference to unified summary",
     ):
         read_summary(str(tmp_path / "test"), ["*"])
+
+
+def write_summary_with_ministeps(path, num_keys, num_report_steps):
+    keywords = ["TIME    ", *[f"FOPR{i}".ljust(8) for i in range(num_keys)]]
+    resfo.write(
+        path / "TEST.SMSPEC",
+        [
+            ("STARTDAT", array("i", [1, 1, 2010, 0])),
+            ("KEYWORDS", keywords),
+            ("UNITS   ", ["DAYS    ", *["SM3     "] * num_keys]),
+        ],
+    )
+    unsmry = []
+    for report_step in range(num_report_steps):
+        unsmry.append(("SEQHDR  ", np.array([report_step], dtype=np.int32)))
+        for ministep in range(2):
+            time = 10.0 * report_step + 5.0 * ministep + 0.25
+            params = np.arange(num_keys + 1, dtype=np.float32) + time
+            params[0] = time
+            unsmry.append(("MINISTEP", np.array([ministep], dtype=np.int32)))
+            unsmry.append(("PARAMS  ", params))
+    resfo.write(path / "TEST.UNSMRY", unsmry)
+
+
+def test_that_memory_mapped_summary_reader_gives_the_same_result_as_resfo(
+    tmp_path,
+):
+    write_summary_with_ministeps(tmp_path, num_keys=2500, num_report_steps=4)
+    _, _, time_map, data = read_summary(str(tmp_path / "TEST"), ["*"])
+
+    with patch.object(_read_summary, "_read_unformatted_params", return_value=None):
+        _, _, resfo_time_map, resfo_data = read_summary(str(tmp_path / "TEST"), ["*"])
+
+    assert data.shape == (2501, 4)
+    assert time_map == resfo_time_map
+    np.testing.assert_array_equal(data, resfo_data)
+
+
+def test_that_identical_smspec_files_are_only_parsed_once(tmp_path):
+    for realization in range(3):
+        (tmp_path / str(realization)).mkdir()
+        write_summary_with_ministeps(
+            tmp_path / str(realization), num_keys=3, num_report_steps=2
+        )
+    _read_summary._spec_cache.clear()
+
+    with patch.object(
+        _read_summary, "_read_spec", wraps=_read_summary._read_spec
+    ) as read_spec:
+        results = [
+            read_summary(str(tmp_path / str(realization) / "TEST"), ["FOPR*"])
+            for realization in range(3)
+        ]
+        assert read_spec.call_count == 1
+        assert all(result[1] == results[0][1] for result in results)
+
+        read_summary(str(tmp_path / "0" / "TEST"), ["FOPR1"])
+        write_summary_with_ministeps(tmp_path / "1", num_keys=4, num_report_steps=2)
+        assert "FOPR3" in read_summary(str(tmp_path / "1" / "TEST"), ["FOPR*"])[1]
+        assert read_spec.call_count == 3
@@ -80,6 +80,47 @@ def test_runpath_roundtrip(tmp_path, storage, surface):
         ), f"Failed for: {prop}"
 
 
+def test_that_surface_values_are_memory_mapped_from_storage(tmp_path, storage, surface):
+    config = SurfaceConfig(
+        "some_name",
+        forward_init=True,
+        ncol=surface.ncol,
+        nrow=surface.nrow,
+        xori=surface.xori,
+        yori=surface.yori,
+        xinc=surface.xinc,
+        yinc=surface.yinc,
+        rotation=surface.rotation,
+        yflip=surface.yflip,
+        forward_init_file="input_%d",
+        output_file=tmp_path / "output",
+        base_surface_path="base_surface",
+        update=True,
+        memory_map=True,
+    )
+    ensemble = storage.create_experiment(parameters=[config]).create_ensemble(
+        name="text", ensemble_size=2
+    )
+    surface.to_file(tmp_path / "input_0", fformat="irap_ascii")
+    ds = config.read_from_runpath(tmp_path, 0, 0)
+    for realization in range(2):
+        ensemble.save_parameters(config.name, realization, ds)
+
+    values = ensemble.load_parameter_values(config.name, 0)
+    assert isinstance(values, np.memmap)
+    np.testing.assert_array_equal(values, ds["values"].values)
+    expected = np.stack([ds["values"].values.ravel()] * 2, axis=1)
+    np.testing.assert_array_equal(
+        config.load_parameters(ensemble, config.name, np.array([0, 1])), expected
+    )
+
+    # Parameters stored without the raw mirror are read from the dataset
+    (ensemble._realization_dir(1) / f"{config.name}.npy").unlink()
+    values = ensemble.load_parameter_values(config.name, 1)
+    assert not isinstance(values, np.memmap)
+    np.testing.assert_array_equal(values, ds["values"].values)
+
+
 def test_init_files_must_contain_placeholder_when_not_forward_init():
     with pytest.raises(
         ConfigValidationError,
@@ -190,3 +231,36 @@ def test_invalid_surface_files_gives_config_error():
                 "INIT_FILES:%dsurf.irap",
             ]
         )
+
+
+def test_that_surface_values_are_only_mirrored_with_memory_map(
+    tmp_path, monkeypatch, storage, surface
+):
+    surface.to_file(tmp_path / "base_surface", fformat="irap_ascii")
+    surface.to_file(tmp_path / "input_0", fformat="irap_ascii")
+    monkeypatch.chdir(tmp_path)
+    configs = [
+        SurfaceConfig.from_config_list(
+            [
+                name,
+                "OUTPUT_FILE:output",
+                "INIT_FILES:input_%d",
+                "BASE_SURFACE:base_surface",
+                *options,
+            ]
+        )
+        for name, options in [("DEFAULT", []), ("MAPPED", ["MEMORY_MAP:TRUE"])]
+    ]
+    assert [config.memory_map for config in configs] == [False, True]
+    ensemble = storage.create_experiment(parameters=configs).create_ensemble(
+        name="text", ensemble_size=1
+    )
+    for config in configs:
+        ensemble.save_parameters(
+            config.name, 0, config.read_from_runpath(tmp_path, 0, 0)
+        )
+
+    assert not (ensemble._realization_dir(0) / "DEFAULT.npy").exists()
+    assert (ensemble._realization_dir(0) / "MAPPED.npy").exists()
+    assert not isinstance(ensemble.load_parameter_values("DEFAULT", 0), np.memmap)
+    assert isinstance(ensemble.load_parameter_values("MAPPED", 0), np.memmap)
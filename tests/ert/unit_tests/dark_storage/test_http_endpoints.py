@@ -2,8 +2,10 @@
 import json
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from numpy.testing import assert_array_equal
+from pandas.testing import assert_frame_equal
 from requests import Response
 
 
@@ -65,6 +67,28 @@ def test_get_responses_with_observations(poly_example_tmp_dir, dark_storage_clie
     assert ensemble_json["POLY_RES@0"]["has_observations"] is True
 
 
+@pytest.mark.integration_test
+def test_get_keys(poly_example_tmp_dir, dark_storage_client):
+    resp: Response = dark_storage_client.get("/keys")
+    keys_json = {key["name"]: key for key in resp.json()}
+
+    assert keys_json["POLY_RES@0"] == {
+        "name": "POLY_RES@0",
+        "userdata": {"data_origin": "GEN_DATA"},
+        "dimensionality": 2,
+        "has_observations": True,
+        "index_type": "VALUE",
+    }
+    assert keys_json["COEFFS:a"] == {
+        "name": "COEFFS:a",
+        "userdata": {"data_origin": "GEN_KW"},
+        "dimensionality": 1,
+        "has_observations": False,
+        "index_type": None,
+    }
+    assert set(keys_json) == {"POLY_RES@0", "COEFFS:a", "COEFFS:b", "COEFFS:c"}
+
+
 @pytest.mark.integration_test
 def test_get_response(poly_example_tmp_dir, dark_storage_client):
     resp: Response = dark_storage_client.get("/experiments")
@@ -114,6 +138,14 @@ def test_get_response(poly_example_tmp_dir, dark_storage_client):
     assert len(record_df1.columns) == 10
     assert len(record_df1.index) == 3
 
+    resp: Response = dark_storage_client.get(
+        f"/ensembles/{ensemble_id1}/records/POLY_RES@0",
+        headers={"accept": "application/vnd.apache.arrow.stream"},
+    )
+    assert resp.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    record_df1_arrow = pa.ipc.open_stream(resp.content).read_pandas()
+    assert_frame_equal(record_df1_arrow, record_df1)
+
 
 @pytest.mark.integration_test
 def test_get_summary_response(
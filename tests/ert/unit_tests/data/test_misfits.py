@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import numpy as np
+import polars
+import pytest
+
+from ert.config import GenDataConfig, SummaryConfig
+from ert.data import calculate_misfits, load_misfits
+from ert.storage import open_storage
+
+
+@pytest.fixture
+def ensemble_with_observations(tmp_path):
+    times = polars.Series([datetime(2000, 1, day) for day in (1, 2)]).dt.cast_time_unit(
+        "ms"
+    )
+    summary_observations = polars.DataFrame(
+        {
+            "response_key": ["FOPR", "FOPR"],
+            "observation_key": ["FOPR_OBS", "FOPR_OBS"],
+            "time": times,
+            "observations": polars.Series([1.0, 2.0], dtype=polars.Float32),
+            "std": polars.Series([0.5, 1.0], dtype=polars.Float32),
+        }
+    )
+    gen_data_observations = polars.DataFrame(
+        {
+            "response_key": ["GD"],
+            "observation_key": ["GD_OBS"],
+            "report_step": polars.Series([0], dtype=polars.UInt16),
+            "index": polars.Series([1], dtype=polars.UInt16),
+            "observations": polars.Series([3.0], dtype=polars.Float32),
+            "std": polars.Series([2.0], dtype=polars.Float32),
+        }
+    )
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[
+                SummaryConfig(keys=["FOPR"], input_files=["not_relevant"]),
+                GenDataConfig(keys=["GD"], input_files=["gd_%d"]),
+            ],
+            observations={
+                "summary": summary_observations,
+                "gen_data": gen_data_observations,
+            },
+        )
+        ensemble = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+        for realization, (fopr, gd) in enumerate(
+            [((2.0, 2.0), 3.0), ((1.0, 4.0), 7.0)]
+        ):
+            ensemble.save_response(
+                "summary",
+                polars.DataFrame(
+                    {
+                        "response_key": ["FOPR", "FOPR"],
+                        "time": times,
+                        "values": polars.Series(fopr, dtype=polars.Float32),
+                    }
+                ),
+                realization,
+            )
+            ensemble.save_response(
+                "gen_data",
+                polars.DataFrame(
+                    {
+                        "response_key": ["GD", "GD"],
+                        "report_step": polars.Series([0, 0], dtype=polars.UInt16),
+                        "index": polars.Series([0, 1], dtype=polars.UInt16),
+                        "values": polars.Series([0.0, gd], dtype=polars.Float32),
+                    }
+                ),
+                realization,
+            )
+        yield ensemble
+
+
+def test_load_misfits_sums_misfits_per_observation_key(ensemble_with_observations):
+    misfits = load_misfits(ensemble_with_observations)
+
+    assert misfits.columns == [
+        "realization",
+        "MISFIT:FOPR_OBS",
+        "MISFIT:GD_OBS",
+        "MISFIT:TOTAL",
+    ]
+    assert misfits["realization"].to_list() == [0, 1]
+    np.testing.assert_allclose(misfits["MISFIT:FOPR_OBS"], [4.0, 4.0])
+    np.testing.assert_allclose(misfits["MISFIT:GD_OBS"], [0.0, 4.0])
+    np.testing.assert_allclose(misfits["MISFIT:TOTAL"], [4.0, 8.0])
+
+
+def test_that_misfits_are_empty_without_observations(ensemble_with_observations):
+    assert load_misfits(ensemble_with_observations, observation_keys=[]).is_empty()
+
+
+def test_that_signed_misfits_follow_the_sign_of_the_difference(
+    ensemble_with_observations,
+):
+    misfits = calculate_misfits(
+        ensemble_with_observations.get_observations_and_responses(
+            ["FOPR_OBS"], np.array([1])
+        ),
+        signed=True,
+    )
+
+    np.testing.assert_allclose(misfits["1"], [0.0, 4.0])
+    np.testing.assert_allclose(misfits["observations"], [1.0, 2.0])
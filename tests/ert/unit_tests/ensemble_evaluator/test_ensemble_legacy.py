@@ -9,7 +9,7 @@
 from ert.config import QueueConfig
 from ert.ensemble_evaluator import EnsembleEvaluator, Monitor, identifiers, state
 from ert.ensemble_evaluator.config import EvaluatorServerConfig
-from ert.scheduler import Scheduler
+from ert.scheduler import Scheduler, create_driver
 
 
 @pytest.fixture
@@ -64,6 +64,44 @@ async def test_run_legacy_ensemble(
             assert os.path.isfile(f"real_{i}/status.txt")
 
 
+@pytest.mark.integration_test
+@pytest.mark.timeout(60)
+async def test_run_several_legacy_ensembles_in_one_session(
+    tmpdir, make_ensemble, monkeypatch, queue_config
+):
+    num_reals = 2
+    ensembles = []
+    for ens_id in ["0", "1"]:
+        ensemble = make_ensemble(
+            monkeypatch, tmpdir.mkdir(f"ens_{ens_id}"), num_reals, 1
+        )
+        ensemble.id_ = ens_id
+        ensembles.append(ensemble)
+    config = EvaluatorServerConfig(
+        custom_port_range=range(1024, 65535),
+        custom_host="127.0.0.1",
+        use_token=False,
+    )
+    evaluator = EnsembleEvaluator(ensembles[0], config)
+    driver = create_driver(queue_config.queue_options)
+    await evaluator.start_session(driver)
+    server_task = evaluator._ee_tasks[0]
+    try:
+        for ensemble in ensembles:
+            successful = await evaluator.evaluate_ensemble(ensemble)
+            assert sorted(successful) == list(range(num_reals))
+            assert ensemble.status == state.ENSEMBLE_STATE_STOPPED
+            assert not server_task.done()
+            assert ensemble._scheduler.driver is driver
+    finally:
+        await evaluator.stop_session()
+    assert server_task.done()
+
+    for ens_id in ["0", "1"]:
+        for i in range(num_reals):
+            assert os.path.isfile(tmpdir / f"ens_{ens_id}" / f"real_{i}/status.txt")
+
+
 @pytest.mark.integration_test
 @pytest.mark.timeout(60)
 async def test_run_and_cancel_legacy_ensemble(
@@ -3,9 +3,11 @@
 import os.path
 import stat
 import textwrap
+from pathlib import Path
 
 import pytest
 
+from _ert import checksum
 from _ert.forward_model_runner.reporting.message import Checksum, Exited, Start
 from _ert.forward_model_runner.runner import ForwardModelRunner
 from ert.config import ErtConfig, ForwardModelStep
@@ -350,3 +352,26 @@ def test_default_env_variables_available_inside_fm_step_context():
     # Check default ENV variable not available outside of step context
     for k in ForwardModelStep.default_env:
         assert k not in os.environ
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_large_files_in_manifest_get_a_sampled_checksum(monkeypatch):
+    monkeypatch.setattr(checksum, "SAMPLED_CHECKSUM_MIN_SIZE", 8)
+    monkeypatch.setattr(checksum, "CHUNK_SIZE", 2)
+    with open("manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"small": "small", "large": "large"}, f)
+    Path("small").write_bytes(b"content")
+    Path("large").write_bytes(b"large content")
+
+    fmr = ForwardModelRunner(create_jobs_json([]))
+    checksums = next(s for s in fmr.run([]) if isinstance(s, Checksum)).data
+
+    assert checksums["small"]["md5sum"] == checksum.md5_checksum("small")
+    assert "md5sum" not in checksums["large"]
+    assert checksums["large"]["sampled_md5sum"] == checksum.sampled_md5_checksum(
+        "large"
+    )
+    Path("large").write_bytes(b"large contenT")
+    assert checksums["large"]["sampled_md5sum"] != checksum.sampled_md5_checksum(
+        "large"
+    )
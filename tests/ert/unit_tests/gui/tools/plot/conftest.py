@@ -1,10 +1,10 @@
-import io
 import os
 import shutil
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from ert.gui.tools.plot.plot_api import PlotApi
@@ -46,21 +46,25 @@ def session():
         yield api
 
 
+def to_arrow_stream(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
 def mocked_requests_get(*args, **kwargs):
     summary_data = {
         "2010-01-20 00:00:00": [0.1, 0.2, 0.3, 0.4],
         "2010-02-20 00:00:00": [0.2, 0.21, 0.19, 0.18],
     }
     summary_df = pd.DataFrame(summary_data)
-    summary_stream = io.BytesIO()
-    summary_df.to_parquet(summary_stream)
-    summary_parquet_data = summary_stream.getvalue()
+    summary_arrow_data = to_arrow_stream(summary_df)
 
     parameter_data = {"0": [0.1, 0.2, 0.3]}
     parameter_df = pd.DataFrame(parameter_data)
-    parameter_stream = io.BytesIO()
-    parameter_df.to_parquet(parameter_stream)
-    parameter_parquet_data = parameter_stream.getvalue()
+    parameter_arrow_data = to_arrow_stream(parameter_df)
 
     gen_data = {
         "0": [0.1, 0.2, 0.3],
@@ -71,9 +75,7 @@ def mocked_requests_get(*args, **kwargs):
         "5": [0.1, 0.2, 0.3],
     }
     gen_df = pd.DataFrame(gen_data)
-    gen_stream = io.BytesIO()
-    gen_df.to_parquet(gen_stream)
-    gen_parquet_data = gen_stream.getvalue()
+    gen_arrow_data = to_arrow_stream(gen_df)
 
     history_data = {
         "0": [1.0, 0.2, 1.0, 1.0, 1.0],
@@ -81,9 +83,7 @@ def mocked_requests_get(*args, **kwargs):
         "2": [1.2, 1.2, 1.2, 1.2, 1.3],
     }
     history_df = pd.DataFrame(history_data)
-    history_stream = io.BytesIO()
-    history_df.to_parquet(history_stream)
-    history_parquet_data = history_stream.getvalue()
+    history_arrow_data = to_arrow_stream(history_df)
 
     ensemble = {
         "/ensembles/ens_id_1": {"name": "ensemble_1", "experiment_name": "experiment"},
@@ -184,88 +184,58 @@ def mocked_requests_get(*args, **kwargs):
             }
         ],
     }
-    parameters = {
-        "/ensembles/ens_id_1/parameters": [
-            {
-                "name": "SNAKE_OIL_PARAM:BPR_138_PERSISTENCE",
-                "dimensionality": 1,
-                "labels": [],
-                "userdata": {"data_origin": "GEN_KW"},
-            },
-            {
-                "name": "SNAKE_OIL_PARAM:OP1_DIVERGENCE_SCALE",
-                "dimensionality": 1,
-                "labels": [],
-                "userdata": {"data_origin": "GEN_KW"},
-            },
-        ],
-        "/ensembles/ens_id_3/parameters": [
-            {
-                "name": "SNAKE_OIL_PARAM:BPR_138_PERSISTENCE",
-                "dimensionality": 1,
-                "labels": [],
-                "userdata": {"data_origin": "GEN_KW"},
-            },
-            {
-                "name": "I_AM_A_PARAM",
-                "dimensionality": 1,
-                "labels": [],
-                "userdata": {"data_origin": "GEN_KW"},
-            },
-        ],
-        "/ensembles/ens_id_5/parameters": [
+    keys = {
+        "/keys": [
             {
-                "name": "I_AM_A_PARAM",
-                "dimensionality": 1,
-                "labels": [],
-                "userdata": {"data_origin": "GEN_KW"},
-            },
-        ],
-    }
-
-    responses = {
-        "/ensembles/ens_id_1/responses": {
-            "BPR:1,3,8": {
                 "name": "BPR:1,3,8",
-                "id": "id_1",
                 "userdata": {"data_origin": "Summary"},
+                "dimensionality": 2,
                 "has_observations": False,
+                "index_type": "VALUE",
             },
-            "FOPR": {
+            {
                 "name": "FOPR",
-                "id": "id_999",
                 "userdata": {"data_origin": "Summary"},
+                "dimensionality": 2,
                 "has_observations": True,
+                "index_type": "VALUE",
             },
-            "SNAKE_OIL_WPR_DIFF@199": {
-                "id": "id_88",
+            {
                 "name": "SNAKE_OIL_WPR_DIFF@199",
                 "userdata": {"data_origin": "GEN_DATA"},
+                "dimensionality": 2,
                 "has_observations": False,
+                "index_type": "VALUE",
             },
-        },
-        "/ensembles/ens_id_3/responses": {
-            "BPR:1,3,8": {
-                "name": "BPR:1,3,8",
-                "id": "id_111111",
-                "userdata": {"data_origin": "Summary"},
+            {
+                "name": "SNAKE_OIL_PARAM:BPR_138_PERSISTENCE",
+                "userdata": {"data_origin": "GEN_KW"},
+                "dimensionality": 1,
                 "has_observations": False,
+                "index_type": None,
             },
-            "WOPPER": {
-                "name": "WOPPER",
-                "id": "id_999",
-                "userdata": {"data_origin": "Summary"},
+            {
+                "name": "SNAKE_OIL_PARAM:OP1_DIVERGENCE_SCALE",
+                "userdata": {"data_origin": "GEN_KW"},
+                "dimensionality": 1,
                 "has_observations": False,
+                "index_type": None,
             },
-        },
-        "/ensembles/ens_id_5/responses": {
-            "WOPPER": {
+            {
                 "name": "WOPPER",
-                "id": "id_999",
                 "userdata": {"data_origin": "Summary"},
+                "dimensionality": 2,
                 "has_observations": False,
+                "index_type": "VALUE",
             },
-        },
+            {
+                "name": "I_AM_A_PARAM",
+                "userdata": {"data_origin": "GEN_KW"},
+                "dimensionality": 1,
+                "has_observations": False,
+                "index_type": None,
+            },
+        ]
     }
 
     ensembles = {
@@ -277,12 +247,12 @@ def mocked_requests_get(*args, **kwargs):
     }
 
     records = {
-        "/ensembles/ens_id_3/records/FOPR": summary_parquet_data,
-        "/ensembles/ens_id_3/records/BPR%25253A1%25252C3%25252C8": summary_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253ABPR_138_PERSISTENCE": parameter_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253AOP1_DIVERGENCE_SCALE": parameter_parquet_data,
-        "/ensembles/ens_id_3/records/SNAKE_OIL_WPR_DIFF@199": gen_parquet_data,
-        "/ensembles/ens_id_3/records/FOPRH": history_parquet_data,
+        "/ensembles/ens_id_3/records/FOPR": summary_arrow_data,
+        "/ensembles/ens_id_3/records/BPR%25253A1%25252C3%25252C8": summary_arrow_data,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253ABPR_138_PERSISTENCE": parameter_arrow_data,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_PARAM%25253AOP1_DIVERGENCE_SCALE": parameter_arrow_data,
+        "/ensembles/ens_id_3/records/SNAKE_OIL_WPR_DIFF@199": gen_arrow_data,
+        "/ensembles/ens_id_3/records/FOPRH": history_arrow_data,
     }
 
     experiments = [
@@ -310,10 +280,8 @@ def mocked_requests_get(*args, **kwargs):
         )
     elif args[0] in ensembles:
         return MockResponse(ensembles[args[0]], 200)
-    elif args[0] in parameters:
-        return MockResponse(parameters[args[0]], 200)
-    elif args[0] in responses:
-        return MockResponse(responses[args[0]], 200)
+    elif args[0] in keys:
+        return MockResponse(keys[args[0]], 200)
     elif args[0] in records:
         return MockResponse(records[args[0]], 200)
     elif "/experiments" in args[0]:
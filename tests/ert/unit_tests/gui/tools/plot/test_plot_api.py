@@ -251,6 +251,52 @@ def test_plot_api_handles_urlescape(api_and_storage):
     )
 
 
+def test_that_all_data_type_keys_are_updated_when_response_keys_are_finalized(
+    api_and_storage,
+):
+    api, storage = api_and_storage
+    date = datetime(year=2024, month=10, day=4)
+    experiment = storage.create_experiment(
+        parameters=[],
+        responses=[
+            SummaryConfig(
+                name="summary",
+                input_files=["CASE.UNSMRY", "CASE.SMSPEC"],
+                keys=["*"],
+            )
+        ],
+        observations={
+            "summary": polars.DataFrame(
+                {
+                    "response_key": "FOPR",
+                    "observation_key": "sumobs",
+                    "time": polars.Series([date]).dt.cast_time_unit("ms"),
+                    "observations": polars.Series([1.0], dtype=polars.Float32),
+                    "std": polars.Series([1.0], dtype=polars.Float32),
+                }
+            )
+        },
+    )
+    ensemble = experiment.create_ensemble(ensemble_size=1, name="ensemble")
+    assert api.all_data_type_keys() == []
+
+    ensemble.save_response(
+        "summary",
+        polars.DataFrame(
+            {
+                "response_key": ["FOPR", "FOPT"],
+                "time": polars.Series([date, date]).dt.cast_time_unit("ms"),
+                "values": polars.Series([1.0, 2.0], dtype=polars.Float32),
+            }
+        ),
+        0,
+    )
+    assert {key.key: key.observations for key in api.all_data_type_keys()} == {
+        "FOPR": True,
+        "FOPT": False,
+    }
+
+
 def test_plot_api_handles_empty_gen_kw(api_and_storage):
     api, storage = api_and_storage
     key = "gen_kw"
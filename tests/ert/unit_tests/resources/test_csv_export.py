@@ -0,0 +1,138 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import polars
+import pytest
+import xarray as xr
+
+from ert.config import GenKwConfig, SummaryConfig
+from ert.config.gen_kw_config import TransformFunctionDefinition
+from ert.storage import open_storage
+
+from ._import_from_location import import_from_location
+
+csv_export = import_from_location(
+    "csv_export",
+    os.path.join(
+        os.path.dirname(__file__),
+        "../../../../src/ert/resources/workflows/jobs/internal-gui/scripts/csv_export.py",
+    ),
+)
+
+
+@pytest.fixture
+def storage_with_ensemble(tmp_path):
+    times = polars.Series(
+        [datetime(2000, 1, 1), datetime(2000, 1, 2)]
+    ).dt.cast_time_unit("ms")
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[
+                GenKwConfig(
+                    name="COEFFS",
+                    forward_init=False,
+                    template_file=None,
+                    output_file=None,
+                    transform_function_definitions=[
+                        TransformFunctionDefinition("a", "NORMAL", [0, 1]),
+                        TransformFunctionDefinition("b", "CONST", [1]),
+                    ],
+                    update=True,
+                )
+            ],
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+        )
+        ensemble = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+        for realization in range(3):
+            ensemble.save_parameters(
+                "COEFFS",
+                realization,
+                xr.Dataset(
+                    {
+                        "values": ("names", [realization, 0.0]),
+                        "transformed_values": ("names", [realization, 1.0]),
+                        "names": ["a", "b"],
+                    }
+                ),
+            )
+            ensemble.save_response(
+                "summary",
+                polars.DataFrame(
+                    {
+                        "response_key": ["FOPR", "FOPR", "WOPR:OP1", "WOPR:OP1"],
+                        "time": polars.concat([times, times]),
+                        "values": polars.Series(
+                            [realization, 1.0, 2.0, 2.0], dtype=polars.Float32
+                        ),
+                    }
+                ),
+                realization,
+            )
+        yield storage, json.dumps({str(ensemble.id): ensemble.name})
+
+
+def test_that_csv_export_writes_one_row_per_realization_and_date(
+    storage_with_ensemble, tmp_path
+):
+    storage, ensembles = storage_with_ensemble
+    output_file = str(tmp_path / "export.csv")
+
+    info = csv_export.CSVExportJob().run(storage, [output_file, ensembles])
+
+    assert info == f"Exported 6 rows and 4 columns to {output_file}."
+    df = pd.read_csv(output_file)
+    assert list(df.columns) == [
+        "Realization",
+        "Iteration",
+        "Date",
+        "Ensemble",
+        "COEFFS:a",
+        "COEFFS:b",
+        "FOPR",
+        "WOPR:OP1",
+    ]
+    assert df["Realization"].tolist() == [0, 0, 1, 1, 2, 2]
+    assert df["FOPR"].tolist() == [0.0, 1.0, 1.0, 1.0, 2.0, 1.0]
+
+
+def test_that_csv_export_filters_keys_and_drops_constant_columns(
+    storage_with_ensemble, tmp_path
+):
+    storage, ensembles = storage_with_ensemble
+    output_file = str(tmp_path / "export.csv")
+
+    csv_export.CSVExportJob().run(
+        storage, [output_file, ensembles, None, True, True, "FOP*,WOPR:*"]
+    )
+
+    df = pd.read_csv(output_file)
+    assert list(df.columns) == [
+        "Realization",
+        "Iteration",
+        "Date",
+        "Ensemble",
+        "COEFFS:a",
+        "FOPR",
+    ]
+
+
+def test_that_parquet_export_has_the_same_data_as_csv_export(
+    storage_with_ensemble, tmp_path
+):
+    storage, ensembles = storage_with_ensemble
+    csv_file = str(tmp_path / "export.csv")
+    parquet_file = str(tmp_path / "export.parquet")
+
+    csv_export.CSVExportJob().run(storage, [csv_file, ensembles])
+    csv_export.CSVExportJob().run(storage, [parquet_file, ensembles])
+
+    from_csv = pd.read_csv(csv_file, parse_dates=["Date"])
+    from_parquet = pd.read_parquet(parquet_file)
+    np.testing.assert_allclose(
+        from_csv.drop(columns=["Date", "Ensemble"]),
+        from_parquet.drop(columns=["Date", "Ensemble"]),
+    )
+    assert (from_csv["Date"] == from_parquet["Date"]).all()
@@ -417,6 +417,46 @@ def test_await_completed_summary_file_will_return_asap():
     )
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_unsmry_record_counter_only_counts_complete_keywords():
+    keywords = [
+        ("SEQHDR  ", np.array([1], dtype=np.int32)),
+        ("MINISTEP", np.array([0], dtype=np.int32)),
+        ("PARAMS  ", np.arange(2500, dtype=np.float32)),
+        ("NAMES   ", np.array(["FOPR", "FOPT"], dtype="<U8")),
+        ("MINISTEP", np.array([1], dtype=np.int32)),
+        ("PARAMS  ", np.arange(2500, dtype=np.float32)),
+    ]
+    resfo.write("FOO.UNSMRY", keywords)
+    content = Path("FOO.UNSMRY").read_bytes()
+
+    counter = ecl_run.UnsmryRecordCounter("FOO.UNSMRY")
+    Path("FOO.UNSMRY").write_bytes(content[:4000])
+    with pytest.raises(ValueError, match="Incomplete keyword"):
+        counter.count()
+    assert counter.num_keywords == 2
+    assert counter.last_keyword == "MINISTEP"
+
+    Path("FOO.UNSMRY").write_bytes(content)
+    assert counter.count() == len(keywords)
+    assert counter.last_keyword == "PARAMS"
+    assert counter.count() == len(keywords)
+
+    Path("FOO.UNSMRY").write_bytes(content[:72])
+    assert counter.count() == 2
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_await_completed_summary_file_can_require_params_trailer():
+    resfo.write("FOO.UNSMRY", [("MINISTEP", np.array([1], dtype=np.int32))])
+    assert (
+        ecl_run.await_completed_unsmry_file(
+            "FOO.UNSMRY", max_wait=0.3, poll_interval=0.1, require_params_trailer=True
+        )
+        > 0.3
+    )
+
+
 @pytest.mark.flaky(reruns=5)
 @pytest.mark.integration_test
 @pytest.mark.usefixtures("use_tmpdir")
@@ -858,3 +898,47 @@ def test_can_parse_errors(prt_error, expected_error_list):
     run = ecl_run.EclRun("ECLCASE.DATA", "dummysimulatorobject")
     error_list = run.parseErrors()
     assert error_list == expected_error_list
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000, ecl_run.PRT_CHUNK_SIZE])
+def test_that_errors_spanning_chunks_are_parsed_in_full(chunk_size):
+    various_output = "\n".join(f" Some other output {i}" for i in range(20))
+    prt_content = f"\n{various_output}\n".join(
+        [
+            _DUMMY_ERROR_MESSAGE_E100,
+            _DUMMY_SLAVE_STARTED_MESSAGE,
+            _DUMMY_ERROR_MESSAGE_E300,
+            _DUMMY_ERROR_MESSAGE_MULTIPLE_CPUS_E100,
+            _DUMMY_ERROR_MESSAGE_E100,
+        ]
+    )
+    Path("ECLCASE.PRT").write_text(prt_content, encoding="utf-8")
+
+    regexps = [
+        re.compile(pattern, re.MULTILINE)
+        for pattern in [
+            ecl_run.error_pattern_e100,
+            ecl_run.error_pattern_e300,
+            ecl_run.slave_started_pattern,
+        ]
+    ]
+    assert ecl_run.find_all_in_file(Path("ECLCASE.PRT"), regexps, chunk_size) == [
+        [
+            _DUMMY_ERROR_MESSAGE_E100,
+            _DUMMY_ERROR_MESSAGE_MULTIPLE_CPUS_E100,
+            _DUMMY_ERROR_MESSAGE_E100,
+        ],
+        [_DUMMY_ERROR_MESSAGE_E300],
+        [_DUMMY_SLAVE_STARTED_MESSAGE],
+    ]
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, ecl_run.PRT_CHUNK_SIZE])
+def test_that_read_lines_backwards_gives_the_lines_in_reverse(chunk_size):
+    content = "first\n\n Errors                 1\n Bugs   0\næøå\nlast"
+    Path("ECLCASE.PRT").write_text(content, encoding="utf-8")
+    assert list(ecl_run.read_lines_backwards(Path("ECLCASE.PRT"), chunk_size)) == list(
+        reversed(content.split("\n"))
+    )
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import stat
 import uuid
 from pathlib import Path
 from queue import SimpleQueue
@@ -7,9 +9,12 @@
 import pytest
 
 from ert.config import ErtConfig, ModelConfig
+from ert.ensemble_evaluator.config import EvaluatorServerConfig
 from ert.ensemble_evaluator.snapshot import EnsembleSnapshot
+from ert.run_arg import create_run_arguments
 from ert.run_models import BaseRunModel
-from ert.storage import Storage
+from ert.scheduler import LocalDriver
+from ert.storage import Storage, open_storage
 from ert.substitutions import Substitutions
 
 
@@ -381,3 +386,73 @@ def test_get_number_of_active_realizations_varies_when_rerun_or_new_iteration(
     brm.active_realizations = new_active_realizations
     brm.restart = was_rerun
     assert brm.get_number_of_active_realizations() == expected_result
+
+
+class _LateReportingDriver(LocalDriver):
+    """Reports jobs as finished some time after they are, as queue systems
+    which are polled do"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._reports: list[asyncio.Task[None]] = []
+
+    async def _dispatch_finished_event(self, iens: int, returncode: int) -> None:
+        self._reports.append(asyncio.create_task(self._report_later(iens, returncode)))
+
+    async def _report_later(self, iens: int, returncode: int) -> None:
+        await asyncio.sleep(1.0)
+        await super()._dispatch_finished_event(iens, returncode)
+
+
+@pytest.mark.integration_test
+@pytest.mark.timeout(120)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_killed_realizations_do_not_affect_the_next_ensemble_in_a_session(
+    monkeypatch,
+):
+    Path("sleep_in_first_iteration").write_text(
+        '#!/bin/sh\nif [ "$1" = 0 ]; then sleep 60; fi\n', encoding="utf-8"
+    )
+    os.chmod("sleep_in_first_iteration", stat.S_IRWXU)
+    Path("SLEEP").write_text(
+        "EXECUTABLE sleep_in_first_iteration\nARGLIST <ITER>\n", encoding="utf-8"
+    )
+    config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nMAX_RUNTIME 5\nINSTALL_JOB SLEEP SLEEP\nFORWARD_MODEL SLEEP\n"
+    )
+    monkeypatch.setattr(
+        "ert.run_models.base_run_model.create_driver",
+        lambda _: _LateReportingDriver(),
+    )
+    ee_config = EvaluatorServerConfig(
+        custom_port_range=range(1024, 65535),
+        custom_host="127.0.0.1",
+        use_token=False,
+    )
+    with open_storage("storage", mode="w") as storage:
+        brm = BaseRunModel(
+            config=config,
+            storage=storage,
+            queue_config=config.queue_config,
+            status_queue=SimpleQueue(),
+            active_realizations=[True],
+        )
+        experiment = storage.create_experiment()
+        num_successful_realizations = []
+        with brm.evaluator_session():
+            for iteration in range(2):
+                ensemble = experiment.create_ensemble(
+                    name=f"batch_{iteration}", ensemble_size=1, iteration=iteration
+                )
+                num_successful_realizations.append(
+                    brm._evaluate_and_postprocess(
+                        create_run_arguments(brm.run_paths, [True], ensemble),
+                        ensemble,
+                        ee_config,
+                    )
+                )
+
+    # The realization of the first ensemble is stopped by MAX_RUNTIME, and
+    # the report of it being killed must not be taken as the result of the
+    # same realization in the second ensemble
+    assert num_successful_realizations == [0, 1]
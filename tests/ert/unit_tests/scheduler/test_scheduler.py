@@ -1,6 +1,8 @@
 import asyncio
+import hashlib
 import itertools
 import json
+import logging
 import random
 import shutil
 import time
@@ -9,12 +11,18 @@
 
 import pytest
 
-from _ert.events import Id, RealizationFailed, RealizationTimeout
+from _ert.events import (
+    ForwardModelStepChecksum,
+    Id,
+    RealizationFailed,
+    RealizationTimeout,
+)
 from ert.config import QueueConfig
 from ert.ensemble_evaluator import Realization
 from ert.load_status import LoadResult, LoadStatus
 from ert.run_arg import RunArg
 from ert.scheduler import LsfDriver, OpenPBSDriver, create_driver, job, scheduler
+from ert.scheduler.event import StartedEvent
 from ert.scheduler.job import JobState
 
 
@@ -572,6 +580,51 @@ async def mock_failure(message, *args, **kwargs):
     raise RuntimeError(message)
 
 
+@pytest.mark.timeout(10)
+async def test_that_late_events_of_jobs_killed_by_a_previous_ensemble_are_ignored(
+    storage, tmp_path, mock_driver, monkeypatch
+):
+    monkeypatch.setattr(scheduler, "_REAP_TIMEOUT", 0.5)
+    killed_job_reported = asyncio.Event()
+    waits = 0
+
+    async def wait():
+        nonlocal waits
+        waits += 1
+        if waits == 1:
+            # The killed job is reported as failed after the timeout
+            await killed_job_reported.wait()
+            return 1
+        return 0
+
+    async def kill(iens):
+        pass
+
+    async def finish():
+        pass
+
+    driver = mock_driver(wait=wait)
+    driver.kill = kill
+    driver.finish = finish
+    experiment = storage.create_experiment()
+    schedulers = []
+    for name in ["first", "second"]:
+        ensemble = experiment.create_ensemble(name=name, ensemble_size=1)
+        realization = create_stub_realization(ensemble, tmp_path / name, 0)
+        if name == "first":
+            realization.max_runtime = 1
+        schedulers.append(scheduler.Scheduler(driver, [realization], poll_driver=False))
+
+    assert await schedulers[0].execute() == Id.ENSEMBLE_SUCCEEDED
+    assert 0 in driver.abandoned_jobs
+
+    await driver.event_queue.put(StartedEvent(iens=5))
+    asyncio.get_running_loop().call_later(0.2, killed_job_reported.set)
+    assert await schedulers[1].execute() == Id.ENSEMBLE_SUCCEEDED
+    assert schedulers[1]._jobs[0].returncode.result() == 0
+    assert not driver.abandoned_jobs
+
+
 @pytest.mark.timeout(5)
 async def test_that_driver_poll_exceptions_are_propagated(mock_driver, realization):
     driver = mock_driver()
@@ -702,3 +755,43 @@ async def mock_publisher(*args, **kwargs):
         event = await sch._events.get()
 
     assert expected_error in event.message
+
+
+@pytest.mark.timeout(5)
+async def test_that_checksums_are_verified_when_they_are_received(
+    realization, mock_driver, caplog
+):
+    caplog.set_level(logging.DEBUG)
+    manifest_queue = asyncio.Queue()
+    sch = scheduler.Scheduler(
+        mock_driver(), [realization], manifest_queue=manifest_queue
+    )
+    runpath = Path(realization.run_arg.runpath)
+    runpath.mkdir()
+    (runpath / "output").write_text("content", encoding="utf-8")
+    consumer_task = asyncio.create_task(sch._checksum_consumer())
+
+    verify_task = asyncio.create_task(
+        sch._jobs[realization.iens]._verify_checksum(asyncio.BoundedSemaphore())
+    )
+    await asyncio.sleep(0.1)
+    assert not verify_task.done()
+
+    await manifest_queue.put(
+        ForwardModelStepChecksum(
+            real="0",
+            checksums={
+                str(runpath): {
+                    "output": {
+                        "type": "file",
+                        "path": str(runpath / "output"),
+                        "md5sum": hashlib.md5(b"content").hexdigest(),
+                    }
+                }
+            },
+        )
+    )
+    await verify_task
+    consumer_task.cancel()
+
+    assert f"File {runpath / 'output'} checksum successful." in caplog.text
@@ -2,6 +2,7 @@
 import os
 import shutil
 import tempfile
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -34,7 +35,7 @@
 from ert.config.gen_kw_config import TransformFunctionDefinition
 from ert.config.general_observation import GenObservation
 from ert.config.observation_vector import ObsVector
-from ert.storage import ErtStorageException, LocalEnsemble, open_storage
+from ert.storage import ErtStorageException, LocalEnsemble, LocalStorage, open_storage
 from ert.storage.local_storage import _LOCAL_STORAGE_VERSION
 from ert.storage.mode import ModeError
 from ert.storage.realization_storage_state import RealizationStorageState
@@ -286,6 +287,93 @@ def test_refresh(tmp_path):
             assert _ensembles(accessor) == _ensembles(reader)
 
 
+def test_refresh_if_changed_only_reloads_changed_ensembles(tmp_path):
+    with open_storage(tmp_path, mode="w") as accessor:
+        experiment = accessor.create_experiment()
+        unchanged = accessor.create_ensemble(experiment, name="foo", ensemble_size=2)
+        changed = accessor.create_ensemble(experiment, name="bar", ensemble_size=2)
+        with open_storage(tmp_path, mode="r") as reader:
+            assert not reader.refresh_if_changed()
+            reader_unchanged = reader.get_ensemble(unchanged.id)
+            reader_changed = reader.get_ensemble(changed.id)
+
+            assert (
+                RealizationStorageState.LOAD_FAILURE
+                not in reader_changed.get_ensemble_state()[0]
+            )
+
+            accessor.create_ensemble(experiment, name="baz", ensemble_size=2)
+            changed.set_failure(0, RealizationStorageState.LOAD_FAILURE, "failed")
+            changed.refresh_ensemble_state()
+
+            with patch.object(
+                reader_unchanged, "refresh_ensemble_state"
+            ) as refresh_unchanged:
+                assert reader.refresh_if_changed()
+            refresh_unchanged.assert_not_called()
+            assert _ensembles(accessor) == _ensembles(reader)
+            assert reader.get_ensemble(unchanged.id) is reader_unchanged
+            assert reader.get_ensemble(changed.id) is reader_changed
+            assert (
+                RealizationStorageState.LOAD_FAILURE
+                in reader_changed.get_ensemble_state()[0]
+            )
+            assert not reader.refresh_if_changed()
+
+
+def test_that_generations_are_saved_once_per_ensemble_operation(tmp_path):
+    with open_storage(tmp_path, mode="w") as accessor:
+        experiment = accessor.create_experiment()
+        ensemble = accessor.create_ensemble(experiment, name="foo", ensemble_size=3)
+        with (
+            open_storage(tmp_path, mode="r") as reader,
+            patch.object(
+                accessor, "_write_transaction", wraps=accessor._write_transaction
+            ) as write_transaction,
+        ):
+            for realization in range(3):
+                ensemble.set_failure(
+                    realization, RealizationStorageState.LOAD_FAILURE, "failed"
+                )
+            generation_writes = [
+                call
+                for call in write_transaction.call_args_list
+                if call.args[0].name == accessor.GENERATIONS_FILE
+            ]
+            assert not generation_writes
+            assert not reader.refresh_if_changed()
+
+            ensemble.refresh_ensemble_state()
+            generation_writes = [
+                call
+                for call in write_transaction.call_args_list
+                if call.args[0].name == accessor.GENERATIONS_FILE
+            ]
+            assert len(generation_writes) == 1
+            assert reader.refresh_if_changed()
+
+
+def test_that_readers_see_realizations_saved_while_an_ensemble_runs(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(LocalStorage, "GENERATIONS_FLUSH_INTERVAL", 0.1)
+    with open_storage(tmp_path, mode="w") as accessor:
+        experiment = accessor.create_experiment()
+        ensemble = accessor.create_ensemble(experiment, name="foo", ensemble_size=2)
+        with open_storage(tmp_path, mode="r") as reader:
+            ensemble.set_failure(0, RealizationStorageState.LOAD_FAILURE, "failed")
+            ensemble.set_failure(1, RealizationStorageState.LOAD_FAILURE, "failed")
+
+            deadline = time.monotonic() + 5
+            while not reader.refresh_if_changed():
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+            assert all(
+                RealizationStorageState.LOAD_FAILURE in state
+                for state in reader.get_ensemble(ensemble.id).get_ensemble_state()
+            )
+
+
 def test_that_reader_storage_reads_most_recent_response_configs(tmp_path):
     reader = open_storage(tmp_path, mode="r")
     writer = open_storage(tmp_path, mode="w")
@@ -788,6 +876,9 @@ def save_field(self, model_ensemble: Ensemble, field_data):
                     dims=["x", "y", "z"],  # type: ignore
                 ).to_dataset(),
             )
+        # Makes the change visible to other readers, as ert does at the end
+        # of an ensemble operation
+        self.storage.flush()
 
     @rule(
         model_ensemble=ensembles,
@@ -905,6 +996,7 @@ def save_summary(self, model_ensemble: Ensemble, data):
             assume(False)
             raise AssertionError() from e
         storage_ensemble.save_response(summary.response_type, ds, self.iens_to_edit)
+        self.storage.flush()
 
         model_ensemble.response_values[summary.name] = ds
 
@@ -1054,6 +1146,7 @@ def set_failure(self, model_ensemble: Ensemble, data: st.DataObject, message: st
         storage_ensemble.set_failure(
             realization, RealizationStorageState.PARENT_FAILURE, message
         )
+        self.storage.flush()
         model_ensemble.failure_messages[realization] = message
 
     @rule(model_ensemble=ensembles, data=st.data(), message=st.text())
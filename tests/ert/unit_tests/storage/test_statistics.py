@@ -0,0 +1,188 @@
+from datetime import datetime
+
+import numpy as np
+import polars
+import pytest
+import xarray as xr
+
+from ert.config import GenKwConfig, SummaryConfig
+from ert.config.gen_kw_config import TransformFunctionDefinition
+from ert.storage import open_storage
+from ert.storage.statistics import (
+    StatisticsAccumulator,
+    ensemble_statistics,
+    parameter_statistics,
+    response_statistics,
+)
+
+
+def _accumulate(samples, **kwargs):
+    accumulator = StatisticsAccumulator(samples.shape[1:], **kwargs)
+    for sample in samples:
+        accumulator.add(sample)
+    return accumulator.result()
+
+
+def test_that_moments_match_numpy():
+    rng = np.random.default_rng(1)
+    samples = rng.normal(loc=3.0, scale=2.0, size=(50, 4, 3))
+
+    statistics = _accumulate(samples)
+
+    np.testing.assert_allclose(statistics.mean, samples.mean(axis=0))
+    np.testing.assert_allclose(statistics.variance, samples.var(axis=0))
+    np.testing.assert_allclose(statistics.std(ddof=1), samples.std(axis=0, ddof=1))
+    np.testing.assert_array_equal(statistics.minimum, samples.min(axis=0))
+    np.testing.assert_array_equal(statistics.maximum, samples.max(axis=0))
+    np.testing.assert_array_equal(statistics.count, np.full((4, 3), 50))
+
+
+def test_that_missing_values_are_ignored_element_wise():
+    samples = np.array([[1.0, np.nan, np.nan], [3.0, 2.0, np.nan], [5.0, 4.0, np.nan]])
+
+    statistics = _accumulate(samples, quantiles=[0.5])
+
+    np.testing.assert_array_equal(statistics.count, [3, 2, 0])
+    np.testing.assert_allclose(statistics.mean, [3.0, 3.0, np.nan])
+    np.testing.assert_allclose(statistics.variance, [8 / 3, 1.0, np.nan])
+    np.testing.assert_allclose(statistics.minimum, [1.0, 2.0, np.nan])
+    np.testing.assert_allclose(statistics.quantiles[0.5], [3.0, 3.0, np.nan])
+
+
+def test_that_quantiles_are_exact_for_small_ensembles():
+    rng = np.random.default_rng(2)
+    samples = rng.uniform(size=(5, 10))
+
+    statistics = _accumulate(samples, quantiles=[0.1, 0.5, 0.9])
+
+    for p, estimate in statistics.quantiles.items():
+        np.testing.assert_allclose(estimate, np.quantile(samples, p, axis=0))
+
+
+def test_that_quantiles_are_estimated_for_large_ensembles():
+    rng = np.random.default_rng(3)
+    samples = rng.normal(size=(2000, 20))
+
+    statistics = _accumulate(samples, quantiles=[0.1, 0.5, 0.9])
+
+    for p, estimate in statistics.quantiles.items():
+        np.testing.assert_allclose(estimate, np.quantile(samples, p, axis=0), atol=0.1)
+
+
+def test_that_histogram_matches_numpy():
+    rng = np.random.default_rng(4)
+    samples = rng.normal(size=(100, 3))
+    bin_edges = np.linspace(-2.0, 2.0, 9)
+
+    statistics = _accumulate(samples, bin_edges=bin_edges)
+
+    assert statistics.histogram.shape == (8, 3)
+    for column in range(3):
+        expected, _ = np.histogram(samples[:, column], bins=bin_edges)
+        np.testing.assert_array_equal(statistics.histogram[:, column], expected)
+
+
+def test_that_invalid_quantiles_are_rejected():
+    with pytest.raises(ValueError, match="Quantiles must be in the range"):
+        StatisticsAccumulator((1,), quantiles=[1.5])
+
+
+@pytest.fixture
+def ensemble_with_coefficients(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        config = GenKwConfig(
+            name="COEFFS",
+            forward_init=False,
+            template_file=None,
+            output_file=None,
+            transform_function_definitions=[
+                TransformFunctionDefinition(
+                    name=name, param_name="NORMAL", values=[0, 1]
+                )
+                for name in ("a", "b", "c")
+            ],
+            update=True,
+        )
+        experiment = storage.create_experiment(
+            parameters=[config],
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+        )
+        ensemble = storage.create_ensemble(experiment, ensemble_size=6, name="prior")
+        rng = np.random.default_rng(5)
+        values = rng.normal(size=(6, 3))
+        for realization in range(5):
+            ensemble.save_parameters(
+                "COEFFS",
+                realization,
+                xr.Dataset(
+                    {
+                        "values": ("names", values[realization]),
+                        "transformed_values": ("names", values[realization]),
+                        "names": ["a", "b", "c"],
+                    }
+                ),
+            )
+            times = [
+                datetime(2000, 1, day) for day in range(1, 4 if realization else 3)
+            ]
+            ensemble.save_response(
+                "summary",
+                polars.DataFrame(
+                    {
+                        "response_key": ["FOPR"] * len(times),
+                        "time": polars.Series(times).dt.cast_time_unit("ms"),
+                        "values": polars.Series(
+                            values[realization, : len(times)], dtype=polars.Float32
+                        ),
+                    }
+                ),
+                realization,
+            )
+        yield ensemble, values[:5]
+
+
+def test_parameter_statistics_skip_realizations_without_parameters(
+    ensemble_with_coefficients,
+):
+    ensemble, values = ensemble_with_coefficients
+
+    statistics = parameter_statistics(ensemble, "COEFFS")
+
+    assert statistics.dims == ("names",)
+    assert list(statistics.coords["names"]) == ["a", "b", "c"]
+    np.testing.assert_allclose(statistics.mean, values.mean(axis=0))
+    np.testing.assert_allclose(
+        ensemble.calculate_std_dev_for_parameter("COEFFS")["values"],
+        values.std(axis=0),
+    )
+
+    with pytest.raises(KeyError):
+        parameter_statistics(ensemble, "COEFFS", realizations=[5])
+
+
+def test_response_statistics_align_on_primary_key(ensemble_with_coefficients):
+    ensemble, values = ensemble_with_coefficients
+
+    statistics = response_statistics(ensemble, "FOPR", realizations=[1, 0, 2])
+
+    expected = values[[1, 0, 2]].astype(np.float32).astype(np.float64)
+    expected[1, 2] = np.nan
+    np.testing.assert_array_equal(statistics.count, [3, 3, 2])
+    np.testing.assert_allclose(statistics.mean, np.nanmean(expected, axis=0))
+    assert list(statistics.coords["response_key"]) == ["FOPR"] * 3
+    assert statistics.to_dataset()["mean"].dims == ("index",)
+
+
+def test_ensemble_statistics_covers_parameters_and_responses(
+    ensemble_with_coefficients,
+):
+    ensemble, _ = ensemble_with_coefficients
+
+    statistics = ensemble_statistics(
+        ensemble, ["COEFFS", "FOPR"], quantiles=[0.5], max_workers=2
+    )
+
+    assert set(statistics) == {"COEFFS", "FOPR"}
+    assert statistics["COEFFS"].count.tolist() == [5, 5, 5]
+    with pytest.raises(ValueError, match="neither a parameter group nor a response"):
+        ensemble_statistics(ensemble, ["NOT_A_KEY"])
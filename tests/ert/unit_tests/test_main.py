@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import Mock
 
 import pytest
@@ -151,6 +153,20 @@ def test_argparse_exec_ensemble_es_mda_restart_ensembler():
     assert parsed.func.__name__ == "run_cli"
 
 
+def test_argparse_exec_iterative_ensemble_smoother_restart_ensemble():
+    parsed = ert_parser(
+        None,
+        [
+            ITERATIVE_ENSEMBLE_SMOOTHER_MODE,
+            "--restart-ensemble-id",
+            "test_ensemble",
+            "path/to/config.ert",
+        ],
+    )
+    assert parsed.mode == ITERATIVE_ENSEMBLE_SMOOTHER_MODE
+    assert parsed.restart_ensemble_id == "test_ensemble"
+
+
 def test_argparse_exec_workflow():
     parsed = ert_parser(None, [WORKFLOW_MODE, "workflow_name", "path/to/config.ert"])
     assert parsed.mode == WORKFLOW_MODE
@@ -257,3 +273,28 @@ def test_argparse_no_port_range():
         ],
     )
     assert parsed.port_range is None
+
+
+def test_that_heavy_subsystems_are_not_imported_by_the_entry_point():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, ert.__main__; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert not set(result.stdout.split()) & {
+        "PyQt6",
+        "ert.cli.main",
+        "ert.config",
+        "ert.dark_storage",
+        "ert.gui",
+        "ert.services",
+        "ert.storage",
+        "scipy",
+        "xarray",
+        "xtgeo",
+    }
@@ -1,8 +1,9 @@
+import json
 import logging
 import os
 from functools import partial
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -23,10 +24,7 @@
 CONFIG_FILE_MINIMAL = "config_minimal.yml"
 
 
-def query_server_mock(cert, auth, endpoint):
-    url = "localhost"
-    sim_endpoint = "/".join([url, SIM_PROGRESS_ENDPOINT])
-
+def event_stream_mock(endpoint, **kwargs):
     def build_job(
         status=JOB_SUCCESS,
         start_time="begining",
@@ -49,20 +47,22 @@ def build_job(
         build_job(name="make_pancakes"),
         build_job(name="make_scrambled_eggs"),
     ]
-    if endpoint == sim_endpoint:
-        return {
-            "status": {
-                "failed": 0,
-                "running": 0,
-                "complete": 1,
-                "pending": 0,
-                "waiting": 0,
-            },
-            "progress": [all_jobs],
-            "batch_number": "0",
-        }
-    else:
-        raise Exception("Stop! Hands in the air!")
+    sim_progress = {
+        "status": {
+            "failed": 0,
+            "running": 0,
+            "complete": 1,
+            "pending": 0,
+            "waiting": 0,
+        },
+        "progress": [all_jobs],
+        "batch_number": "0",
+    }
+    response = MagicMock()
+    response.__enter__.return_value.iter_lines.return_value = iter(
+        [f"event: {SIM_PROGRESS_ENDPOINT}", f"data: {json.dumps(sim_progress)}", ""]
+    )
+    return response
 
 
 def run_detached_monitor_mock(status=ServerStatus.completed, error=None, **kwargs):
@@ -286,7 +286,7 @@ def test_everest_entry_monitor_no_run(
 @patch("everest.bin.everest_script.server_is_running", return_value=False)
 @patch("everest.bin.everest_script.wait_for_server")
 @patch("everest.bin.everest_script.start_server")
-@patch("everest.detached._query_server", side_effect=query_server_mock)
+@patch("everest.detached.requests.get", side_effect=event_stream_mock)
 @patch.object(
     ServerConfig,
     "get_server_context",
@@ -301,7 +301,7 @@ def test_everest_entry_show_all_jobs(
     everserver_status_mock,
     get_opt_status_mock,
     get_server_context_mock,
-    query_server_mock,
+    event_stream_mock,
     start_server_mock,
     wait_for_server_mock,
     server_is_running_mock,
@@ -320,7 +320,7 @@ def test_everest_entry_show_all_jobs(
 @patch("everest.bin.everest_script.server_is_running", return_value=False)
 @patch("everest.bin.everest_script.wait_for_server")
 @patch("everest.bin.everest_script.start_server")
-@patch("everest.detached._query_server", side_effect=query_server_mock)
+@patch("everest.detached.requests.get", side_effect=event_stream_mock)
 @patch.object(
     ServerConfig,
     "get_server_context",
@@ -335,7 +335,7 @@ def test_everest_entry_no_show_all_jobs(
     everserver_status_mock,
     get_opt_status_mock,
     get_server_context_mock,
-    query_server_mock,
+    event_stream_mock,
     start_server_mock,
     wait_for_server_mock,
     server_is_running_mock,
@@ -356,7 +356,7 @@ def test_everest_entry_no_show_all_jobs(
 
 
 @patch("everest.bin.monitor_script.server_is_running", return_value=True)
-@patch("everest.detached._query_server", side_effect=query_server_mock)
+@patch("everest.detached.requests.get", side_effect=event_stream_mock)
 @patch.object(
     ServerConfig,
     "get_server_context",
@@ -371,7 +371,7 @@ def test_monitor_entry_show_all_jobs(
     everserver_status_mock,
     get_opt_status_mock,
     get_server_context_mock,
-    query_server_mock,
+    event_stream_mock,
     server_is_running_mock,
     copy_math_func_test_data_to_tmp,
 ):
@@ -387,7 +387,7 @@ def test_monitor_entry_show_all_jobs(
 
 
 @patch("everest.bin.monitor_script.server_is_running", return_value=True)
-@patch("everest.detached._query_server", side_effect=query_server_mock)
+@patch("everest.detached.requests.get", side_effect=event_stream_mock)
 @patch.object(
     ServerConfig,
     "get_server_context",
@@ -402,7 +402,7 @@ def test_monitor_entry_no_show_all_jobs(
     everserver_status_mock,
     get_opt_status_mock,
     get_server_context_mock,
-    query_server_mock,
+    event_stream_mock,
     server_is_running_mock,
     copy_math_func_test_data_to_tmp,
 ):
@@ -60,8 +60,8 @@ def test_api_snapshots(config_file, snapshot, cached_example):
         f"math_func/{config_file}"
     )
     config = EverestConfig.load_file(Path(config_path) / config_file)
-    api = EverestDataAPI(config)
-    json_snapshot = make_api_snapshot(api)
+    with EverestDataAPI(config) as api:
+        json_snapshot = make_api_snapshot(api)
     json_snapshot["optimal_result_json"] = optimal_result_json
     rounded_json_snapshot = _round_floats(json_snapshot, 8)
 
@@ -109,8 +109,13 @@ def test_api_summary_snapshot(snapshot, cached_example):
             for real in range(ens.ensemble_size):
                 ens.save_response("summary", smry_data.clone(), real)
 
-    api = EverestDataAPI(config)
-    dicts = api.summary_values().to_dicts()
+    with EverestDataAPI(config) as api:
+        dicts = api.summary_values().to_dicts()
+        # The storage is kept open between calls, and closed on exit
+        storage = api._storage
+        assert storage is not None
+    assert api._storage is None
+    assert not storage._experiments
     snapshot.assert_match(
         orjson.dumps(dicts, option=orjson.OPT_INDENT_2).decode("utf-8").strip() + "\n",
         "snapshot.json",
@@ -28,6 +28,7 @@
     everserver_status,
     get_server_queue_options,
     server_is_running,
+    start_monitor,
     start_server,
     stop_server,
     update_everserver_status,
@@ -39,6 +40,8 @@
     DEFAULT_OUTPUT_DIR,
     DETACHED_NODE_DIR,
     EVEREST_SERVER_CONFIG,
+    OPT_PROGRESS_ID,
+    SIM_PROGRESS_ID,
     SIMULATION_DIR,
 )
 from everest.util import makedirs_if_needed
@@ -373,3 +376,45 @@ async def server_running():
     driver = await start_server(everest_config, debug=True)
     final_state = await server_running()
     assert final_state.returncode == 0
+
+
+def test_that_start_monitor_calls_callback_for_each_pushed_event():
+    lines = [
+        ": keep-alive",
+        "",
+        "event: sim_progress",
+        'data: {"batch_number": 0}',
+        "",
+        "event: opt_progress",
+        'data: {"cli_monitor_data": {"batches": [0]}}',
+        "",
+        "event: sim_progress",
+        'data: {"batch_number": 1}',
+        "",
+    ]
+    response = MagicMock()
+    response.__enter__.return_value.iter_lines.return_value = iter(lines)
+    callback = MagicMock(return_value=False)
+
+    with patch("everest.detached.requests.get", return_value=response) as get:
+        start_monitor(("https://localhost", "cert", ("user", "pw")), callback)
+
+    assert get.call_args.args == ("https://localhost/events",)
+    assert get.call_args.kwargs["stream"]
+    assert [call.args[0] for call in callback.call_args_list] == [
+        {SIM_PROGRESS_ID: {"batch_number": 0}},
+        {OPT_PROGRESS_ID: {"cli_monitor_data": {"batches": [0]}}},
+        {SIM_PROGRESS_ID: {"batch_number": 1}},
+    ]
+
+
+def test_that_start_monitor_stops_when_callback_returns_true():
+    lines = ["event: sim_progress", 'data: {"batch_number": 0}', ""] * 3
+    response = MagicMock()
+    response.__enter__.return_value.iter_lines.return_value = iter(lines)
+    callback = MagicMock(return_value=True)
+
+    with patch("everest.detached.requests.get", return_value=response):
+        start_monitor(("https://localhost", "cert", ("user", "pw")), callback)
+
+    callback.assert_called_once()
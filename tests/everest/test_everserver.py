@@ -248,3 +248,33 @@ def test_everserver_status_contains_max_runtime_failure(
         "sleep Failed with: The run is cancelled due to reaching MAX_RUNTIME"
         in status["message"]
     )
+
+
+def test_that_opt_status_since_only_contains_newer_batches():
+    status = {
+        "cli_monitor_data": {
+            "batches": [0, 1, 2],
+            "controls": [{"x": 0.0}, {"x": 0.1}, {"x": 0.2}],
+            "objective_value": [1.0, 0.5, 0.25],
+            "expected_objectives": {"f": [1.0, 0.5, 0.25]},
+        }
+    }
+
+    assert everserver._opt_status_since(status, 0) == {
+        "cli_monitor_data": {
+            "batches": [1, 2],
+            "controls": [{"x": 0.1}, {"x": 0.2}],
+            "objective_value": [0.5, 0.25],
+            "expected_objectives": {"f": [0.5, 0.25]},
+        }
+    }
+    assert everserver._opt_status_since(status, -1) == status
+    assert everserver._opt_status_since(status, 2) == {"cli_monitor_data": {}}
+    assert everserver._opt_status_since({}, -1) == {"cli_monitor_data": {}}
+
+
+def test_that_progress_notifier_wakes_up_waiting_clients():
+    notifier = everserver._ProgressNotifier()
+    assert notifier.wait(0, timeout=0) == 0
+    notifier.notify()
+    assert notifier.wait(0, timeout=10) == 1
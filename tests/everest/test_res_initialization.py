@@ -80,7 +80,7 @@
         ],
     ],
 )
-def test_everest_to_ert_queue_config(config, expected):
+def test_everest_to_ert_queue_config(config, expected, change_to_tmpdir):
     general_options = {"resubmit_limit": 7, "cores": 42}
     ever_config = EverestConfig.with_defaults(
         **{
@@ -100,7 +100,7 @@ def test_everest_to_ert_queue_config(config, expected):
     assert qo.max_running == general_options["cores"]
 
 
-def test_everest_to_ert_controls():
+def test_everest_to_ert_controls(change_to_tmpdir):
     ever_config = EverestConfig.with_defaults(
         **yaml.safe_load(
             dedent("""